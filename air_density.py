@@ -0,0 +1,82 @@
+from typing import Optional, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+# Gas constants in J/(kg·K)
+R_DRY_AIR = 287.05
+R_WATER_VAPOR = 461.495
+
+STANDARD_PRESSURE = 1013.25  # hPa at sea level
+INHG_TO_HPA = 33.8639        # Weather feeds in inches of mercury: multiply by this
+
+# Reference conditions the CLUB_DATABASE stock yardages correspond to
+REFERENCE_TEMPERATURE = 70.0  # °F
+REFERENCE_ALTITUDE = 0.0      # ft
+
+
+def _celsius(temperature: ArrayLike) -> np.ndarray:
+    return (np.asarray(temperature, dtype=float) - 32) * 5 / 9
+
+
+def standard_pressure(altitude: ArrayLike) -> np.ndarray:
+    """Station pressure in hPa of the standard atmosphere at an altitude in feet."""
+    altitude_m = np.asarray(altitude, dtype=float) * 0.3048
+    return STANDARD_PRESSURE * (1 - 2.25577e-5 * altitude_m) ** 5.25588
+
+
+def saturation_vapor_pressure(temperature: ArrayLike) -> np.ndarray:
+    """Saturation vapor pressure over water in hPa at a temperature in °F (Tetens)."""
+    celsius = _celsius(temperature)
+    return 6.1078 * 10 ** (7.5 * celsius / (celsius + 237.3))
+
+
+def air_density(temperature: ArrayLike, pressure: Optional[ArrayLike] = None,
+                humidity: Optional[ArrayLike] = None,
+                altitude: ArrayLike = REFERENCE_ALTITUDE) -> ArrayLike:
+    """
+    Moist air density in kg/m³, vectorized over any broadcastable inputs.
+
+    Dry air and water vapor are treated as ideal gases sharing the station
+    pressure: rho = (p - e) / (R_d T) + e / (R_v T), with the vapor pressure e
+    from relative humidity and the Tetens saturation pressure. Humid air is
+    lighter than dry air at the same pressure and temperature.
+
+    The pressure is the measured station (surface) pressure, which already
+    reflects the course elevation; altitude is only used to derive a
+    standard-atmosphere pressure where pressure is unknown (None or NaN).
+
+    Args:
+        temperature: Air temperature in °F
+        pressure: Station pressure in hPa (multiply inHg by INHG_TO_HPA)
+        humidity: Relative humidity in % (None or NaN = dry air)
+        altitude: Elevation in feet, used where pressure is unknown
+
+    Returns:
+        Density in kg/m³; a float for scalar inputs
+    """
+    temp_k = _celsius(temperature) + 273.15
+    if pressure is None:
+        pressure_hpa = standard_pressure(altitude)
+    else:
+        pressure_hpa = np.asarray(pressure, dtype=float)
+        pressure_hpa = np.where(np.isnan(pressure_hpa), standard_pressure(altitude), pressure_hpa)
+    if humidity is None:
+        vapor_hpa = 0.0
+    else:
+        relative = np.nan_to_num(np.asarray(humidity, dtype=float), nan=0.0) / 100
+        vapor_hpa = relative * saturation_vapor_pressure(temperature)
+    density = ((pressure_hpa - vapor_hpa) * 100 / (R_DRY_AIR * temp_k)
+               + vapor_hpa * 100 / (R_WATER_VAPOR * temp_k))
+    return float(density) if np.ndim(density) == 0 else density
+
+
+REFERENCE_DENSITY = air_density(REFERENCE_TEMPERATURE)
+
+
+def density_ratio(temperature: ArrayLike, pressure: Optional[ArrayLike] = None,
+                  humidity: Optional[ArrayLike] = None,
+                  altitude: ArrayLike = REFERENCE_ALTITUDE) -> ArrayLike:
+    """Air density relative to the dry reference conditions (70°F, sea level)."""
+    return air_density(temperature, pressure, humidity, altitude) / REFERENCE_DENSITY
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from air_density import (air_density, density_ratio, standard_pressure, saturation_vapor_pressure,
+                         INHG_TO_HPA, REFERENCE_TEMPERATURE)
+from conditions_timeline import ConditionsTimeline, WeatherSample
+from trajectory_engine import density_at
+
+
+def test_standard_atmosphere_values():
+    assert air_density(59.0) == pytest.approx(1.225, abs=1e-3)  # ISA sea level, 15 °C
+    assert standard_pressure(0.0) == pytest.approx(1013.25)
+    assert standard_pressure(5000.0) == pytest.approx(843.1, abs=0.5)
+    assert saturation_vapor_pressure(68.0) == pytest.approx(23.4, abs=0.1)  # 20 °C
+    assert density_ratio(REFERENCE_TEMPERATURE) == 1.0
+
+
+def test_humidity_heat_and_altitude_thin_the_air():
+    dry = air_density(86.0)
+    assert air_density(86.0, humidity=80.0) < dry
+    assert air_density(86.0, humidity=np.nan) == dry
+    assert air_density(100.0) < dry < air_density(40.0)
+    assert air_density(70.0, altitude=5000.0) < air_density(70.0)
+    assert air_density(70.0, pressure=29.92 * INHG_TO_HPA) == pytest.approx(air_density(70.0), rel=1e-3)
+
+
+def test_vectorized_matches_scalar_and_unknown_pressure_falls_back():
+    temperature = np.array([40.0, 70.0, 95.0])
+    pressure = np.array([np.nan, 900.0, 1020.0])
+    humidity = np.array([20.0, np.nan, 90.0])
+    values = air_density(temperature, pressure, humidity, altitude=5000.0)
+    expected = [air_density(40.0, None, 20.0, 5000.0), air_density(70.0, 900.0, None, 5000.0),
+                air_density(95.0, 1020.0, 90.0, 5000.0)]
+    np.testing.assert_allclose(values, expected)
+
+
+def test_trajectory_density_takes_keyword_pressure_and_humidity():
+    assert density_at(70.0, 5000.0) == air_density(70.0, altitude=5000.0)
+    assert density_at(70.0, 5000.0, pressure=900.0, humidity=50.0) == \
+        air_density(70.0, pressure=900.0, humidity=50.0, altitude=5000.0)
+    with pytest.raises(TypeError):
+        density_at(70.0, 5000.0, 900.0)
+
+
+def test_timeline_densities_are_computed_once_per_window():
+    timeline = ConditionsTimeline(altitude=5280)
+    timeline.extend([WeatherSample(0.0, temperature=60, pressure=830, humidity=30),
+                     WeatherSample(3600.0, temperature=80, pressure=826, humidity=50)])
+    times = np.array([10.0, 250.0, 299.0, 1800.0, 3599.0])
+    densities = timeline.densities(times, window=300.0)
+
+    # One value per window, from the interpolated conditions at the window's midpoint
+    assert densities[0] == densities[1] == densities[2]
+    middle = timeline.sample_at(1950.0)
+    assert densities[3] == pytest.approx(air_density(middle.temperature, middle.pressure,
+                                                     middle.humidity, 5280))
+    assert timeline.densities([1900.0], window=300.0)[0] == densities[3]
@@ -1,72 +1,89 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Altitude test conditions
+CONDITIONS = [
+    {
+        "name": "Sea Level",
+        "altitude": 0
+    },
+    {
+        "name": "Coastal Hills",
+        "altitude": 1000
+    },
+    {
+        "name": "Rolling Hills",
+        "altitude": 2000
+    },
+    {
+        "name": "Mile High",
+        "altitude": 5280
+    },
+    {
+        "name": "Mountain Course",
+        "altitude": 6000
+    },
+    {
+        "name": "High Mountain",
+        "altitude": 7000
+    },
+    {
+        "name": "Alpine Course",
+        "altitude": 8000
+    },
+    {
+        "name": "Low Foothills",
+        "altitude": 500
+    },
+    {
+        "name": "Desert Mesa",
+        "altitude": 3000
+    },
+    {
+        "name": "High Desert",
+        "altitude": 4000
+    }
+]
+
+CLUBS = {
+    "driver": 300,
+    "7-iron": 180,
+    "pitching-wedge": 140
+}
+
+BALL_MODEL = "tour_premium"
+TEMPERATURE = 70  # Standard temperature
+WIND_SPEED = 0  # No wind
+WIND_DIRECTION = 0
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_altitude_conditions."""
+    return [
+        (f"{club_name}/{condition['name']}",
+         ShotRequest(target_distance, club_name,
+                     Conditions(TEMPERATURE, condition["altitude"], WIND_SPEED, WIND_DIRECTION),
+                     BALL_MODEL, SkillLevel.PROFESSIONAL))
+        for club_name, target_distance in CLUBS.items() for condition in CONDITIONS
+    ]
+
 
 def test_altitude_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test altitude effects with standard temperature (70°F) and no wind."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Altitude test conditions
-    conditions = [
-        {
-            "name": "Sea Level",
-            "altitude": 0
-        },
-        {
-            "name": "Coastal Hills",
-            "altitude": 1000
-        },
-        {
-            "name": "Rolling Hills",
-            "altitude": 2000
-        },
-        {
-            "name": "Mile High",
-            "altitude": 5280
-        },
-        {
-            "name": "Mountain Course",
-            "altitude": 6000
-        },
-        {
-            "name": "High Mountain",
-            "altitude": 7000
-        },
-        {
-            "name": "Alpine Course",
-            "altitude": 8000
-        },
-        {
-            "name": "Low Foothills",
-            "altitude": 500
-        },
-        {
-            "name": "Desert Mesa",
-            "altitude": 3000
-        },
-        {
-            "name": "High Desert",
-            "altitude": 4000
-        }
-    ]
-    
-    clubs = {
-        "driver": 300,
-        "7-iron": 180,
-        "pitching-wedge": 140
-    }
-    
-    for club_name, target_distance in clubs.items():
+    for club_name, target_distance in CLUBS.items():
         club_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
-                temperature=70,  # Standard temperature
+                temperature=TEMPERATURE,
                 altitude=condition["altitude"],
-                wind_speed=0,   # No wind
-                wind_direction=0
+                wind_speed=WIND_SPEED,
+                wind_direction=WIND_DIRECTION
             )
             
             result = model.calculate_adjusted_yardage(
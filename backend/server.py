@@ -0,0 +1,415 @@
+import sys
+import os
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Add the repository root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
+from instrumentation import Instrumentation
+from calibration import calibrated_model
+from player_profiles import ProfileStore, PROFILE_FIELDS
+from shot_history import ShotHistory, ShotRecord
+
+logger = logging.getLogger("yardage.server")
+
+MAX_BODY_SIZE = 1 << 20  # 1 MiB
+MAX_BATCH_ROWS = 100_000
+CONDITION_FIELDS = ("temperature", "altitude", "wind_speed", "wind_direction")
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Coalescer:
+    """
+    Collapses concurrent identical work items into one computation.
+
+    Requests submitted during the same event loop iteration are queued by key;
+    a key already queued or in flight shares the pending future instead of
+    being computed again. Once the loop yields, every distinct key is handed to
+    compute in a single call, so a burst of requests costs one vectorized pass.
+    """
+
+    def __init__(self, compute: Callable[[List[Hashable]], List[Any]]):
+        self.compute = compute
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._flush_scheduled = False
+        self.submitted = 0  # Requests received
+        self.computed = 0   # Distinct keys actually computed
+
+    def submit(self, key: Hashable) -> asyncio.Future:
+        self.submitted += 1
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        keys = list(pending)
+        self.computed += len(keys)
+        try:
+            results = self.compute(keys)
+        except Exception:
+            # Recompute one at a time so a bad key only fails its own requests
+            for key in keys:
+                try:
+                    pending[key].set_result(self.compute([key])[0])
+                except Exception as e:
+                    pending[key].set_exception(e)
+            return
+        for key, result in zip(keys, results):
+            pending[key].set_result(result)
+
+
+def _number(payload: Dict[str, Any], name: str, default: Optional[float] = None) -> Optional[float]:
+    value = payload.get(name, default)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise HTTPError(400, f"{name} must be a number")
+    return float(value)
+
+
+def _conditions(payload: Dict[str, Any]) -> Conditions:
+    return Conditions(*(_number(payload, name) for name in CONDITION_FIELDS))
+
+
+def _skill_level(payload: Dict[str, Any]) -> SkillLevel:
+    try:
+        return SkillLevel(payload.get("skill_level", SkillLevel.PROFESSIONAL.value))
+    except ValueError:
+        raise HTTPError(400, f"Unknown skill level: {payload.get('skill_level')}")
+
+
+class YardageService:
+    """
+    Request handlers around one shared YardageModelEnhanced.
+
+    Every request carries its own conditions and ball model, which are passed
+    explicitly to the model's stateless API, so the shared model's set_conditions
+    state is never read or written and requests cannot see each other's conditions.
+
+    With an Instrumentation, the model's stages and each route's handling time
+    are recorded and exported on GET /metrics (Prometheus text) and
+    GET /metrics.json.
+
+    Shots logged with POST /profile/shot build per-player club tables; /shot
+    requests with a player_id use that player's ClubData.
+
+    With a ShotHistory, every /shot prediction and every /profile/shot reading
+    (with its carry, when the launch monitor reports one) is recorded there.
+    """
+
+    def __init__(self, model: Optional[YardageModelEnhanced] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 profiles: Optional[ProfileStore] = None,
+                 history: Optional[ShotHistory] = None):
+        self.model = model or YardageModelEnhanced()
+        self.instrumentation = instrumentation
+        self.profiles = profiles or ProfileStore()
+        self.history = history
+        if instrumentation is not None:
+            self.model.set_instrumentation(instrumentation)
+        self.shots = Coalescer(self._compute_shots)
+        self.routes: Dict[Tuple[str, str], Callable] = {
+            ("GET", "/health"): self.health,
+            ("POST", "/shot"): self.shot,
+            ("POST", "/shots/batch"): self.shot_batch,
+            ("POST", "/club/optimal"): self.optimal_club,
+            ("POST", "/profile/shot"): self.profile_shot,
+        }
+        if instrumentation is not None:
+            self.routes[("GET", "/metrics")] = self.metrics
+            self.routes[("GET", "/metrics.json")] = self.metrics_json
+
+    def _known_ball_model(self, ball_model: Any) -> str:
+        # Checked as a string first: JSON lists and objects are unhashable
+        if not isinstance(ball_model, str) or ball_model not in self.model.BALL_MODELS:
+            raise HTTPError(400, f"Unknown ball model: {ball_model}")
+        return ball_model
+
+    def _ball_model(self, payload: Dict[str, Any]) -> str:
+        return self._known_ball_model(payload.get("ball_model", "mid_range"))
+
+    def _ball_model_column(self, payload: Dict[str, Any]) -> Any:
+        """A batch ball_model field: one name or a non-empty list of names, default mid_range."""
+        ball_model = payload.get("ball_model")
+        if ball_model is None:
+            return "mid_range"
+        if not isinstance(ball_model, list):
+            return self._known_ball_model(ball_model)
+        if not ball_model:
+            raise HTTPError(400, "ball_model must not be an empty list")
+        for name in ball_model:
+            self._known_ball_model(name)
+        return ball_model
+
+    def _compute_shots(self, keys: List[Tuple]) -> List[Dict[str, float]]:
+        """One batch call for every distinct (target, club, conditions, ball) row."""
+        target, club, temperature, altitude, wind_speed, wind_direction, ball = zip(*keys)
+        result = self.model.calculate_adjusted_yardage_batch(
+            np.array(target), np.array(club),
+            self._condition_array(temperature), self._condition_array(altitude),
+            self._condition_array(wind_speed), self._condition_array(wind_direction),
+            np.array(ball))
+        return [{"carry_distance": float(c), "lateral_movement": float(l)}
+                for c, l in zip(result.carry_distance, result.lateral_movement)]
+
+    @staticmethod
+    def _condition_array(values: Tuple[Optional[float], ...]) -> np.ndarray:
+        # NaN marks unset rows, which the model skips exactly like None
+        return np.array([np.nan if v is None else v for v in values])
+
+    async def health(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "clubs": list(self.model.CLUB_DATABASE),
+            "ball_models": list(self.model.BALL_MODELS),
+            "coalescing": {"submitted": self.shots.submitted, "computed": self.shots.computed},
+        }
+
+    async def shot(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Adjusted carry and lateral movement for one shot."""
+        target = _number(payload, "target_yardage")
+        if target is None:
+            raise HTTPError(400, "target_yardage is required")
+        club = str(payload.get("club", "")).lower()
+        _skill_level(payload)
+        conditions = _conditions(payload)
+        player_id = payload.get("player_id")
+        request = ShotRequest(target, club, conditions, self._ball_model(payload))
+        if player_id is not None:
+            request = self.profiles.get(str(player_id)).personalize(request, self.model)
+        if request.club_data is not None:
+            # Personal clubs are a single O(1) calculation, outside the shared batch
+            result = asdict(self.model.calculate(request))
+        else:
+            self.model.club_data(club)  # Unknown clubs are a 400 via ValueError
+            result = await self.shots.submit(
+                (target, club, conditions.temperature, conditions.altitude,
+                 conditions.wind_speed, conditions.wind_direction, request.ball_model))
+        if self.history is not None:
+            self.history.log(ShotRecord.from_request(
+                request, player_id=None if player_id is None else str(player_id),
+                predicted_carry=result["carry_distance"], predicted_lateral=result["lateral_movement"]))
+        return result
+
+    async def shot_batch(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Columnar shots: each field is a scalar or a list, broadcast to the longest list.
+        """
+        if "target_yardage" not in payload or "club" not in payload:
+            raise HTTPError(400, "target_yardage and club are required")
+        columns = {name: payload.get(name) for name in ("target_yardage", "club") + CONDITION_FIELDS}
+        columns["ball_model"] = self._ball_model_column(payload)
+        size = max(np.size(v) for v in columns.values() if v is not None)
+        if size > MAX_BATCH_ROWS:
+            raise HTTPError(413, f"Batch exceeds {MAX_BATCH_ROWS} rows")
+        # Explicit NaN (unset) for missing conditions keeps the shared model's own state out of
+        # the call; null entries inside a list are unset too
+        for name in CONDITION_FIELDS:
+            if columns[name] is None:
+                columns[name] = np.nan
+            elif isinstance(columns[name], list):
+                columns[name] = [np.nan if v is None else v for v in columns[name]]
+        try:
+            result = self.model.calculate_adjusted_yardage_batch(
+                columns["target_yardage"], columns["club"],
+                columns["temperature"], columns["altitude"],
+                columns["wind_speed"], columns["wind_direction"],
+                columns["ball_model"])
+        except (TypeError, ValueError) as e:
+            raise HTTPError(400, str(e))
+        return {"carry_distance": result.carry_distance.tolist(),
+                "lateral_movement": result.lateral_movement.tolist()}
+
+    async def optimal_club(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Best club for the target plus ranked alternatives."""
+        target = _number(payload, "target_yardage")
+        if target is None:
+            raise HTTPError(400, "target_yardage is required")
+        _skill_level(payload)
+        max_alternatives = payload.get("max_alternatives", 2)
+        if isinstance(max_alternatives, bool) or not isinstance(max_alternatives, int) or max_alternatives < 0:
+            raise HTTPError(400, "max_alternatives must be a non-negative integer")
+        # The model caches one carry index per condition set, so identical
+        # conditions across requests are computed once
+        recommendation = self.model.recommend(target, _conditions(payload),
+                                              self._ball_model(payload), max_alternatives)
+        return {
+            "club": recommendation.club,
+            "best": asdict(recommendation.best),
+            "alternatives": [asdict(option) for option in recommendation.alternatives],
+        }
+
+    async def profile_shot(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold one launch-monitor reading into a player's club table."""
+        player_id = payload.get("player_id")
+        club = payload.get("club")
+        if not player_id or not club:
+            raise HTTPError(400, "player_id and club are required")
+        if not isinstance(club, str):
+            raise HTTPError(400, f"Unknown club: {club}")
+        club = club.lower()
+        self.model.club_data(club)  # Unknown clubs are a 400 via ValueError, as in /shot
+        measurements = {name: _number(payload, name) for name in PROFILE_FIELDS}
+        # The whole reading is validated before anything is recorded
+        record = None if self.history is None else ShotRecord(
+            club=club, ball_model=self._ball_model(payload), player_id=str(player_id),
+            target_yardage=_number(payload, "target_yardage"),
+            **{name: _number(payload, name) for name in CONDITION_FIELDS},
+            actual_carry=_number(payload, "carry_distance"),
+            actual_lateral=_number(payload, "lateral_movement"), **measurements)
+        profile = self.profiles.log_shot(str(player_id), club, **measurements)
+        if record is not None:
+            self.history.log(record)
+        stats = profile.clubs[club].stats
+        return {name: {"count": s.count, "mean": s.mean, "std": s.std} for name, s in stats.items()}
+
+    async def metrics(self, payload: Dict[str, Any]) -> str:
+        return self.instrumentation.prometheus()
+
+    async def metrics_json(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self.instrumentation.snapshot()
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        """Route one request; handlers return a JSON-ready dict or plain text."""
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                raise HTTPError(405, f"{method} not allowed on {path}")
+            raise HTTPError(404, f"No route for {path}")
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            raise HTTPError(400, "Request body must be JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        timer = None if self.instrumentation is None else self.instrumentation.start("server", "http")
+        try:
+            return 200, await handler(payload)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        finally:
+            if timer is not None:
+                timer.mark(path)
+                timer.finish()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve HTTP/1.1 requests on one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and version != "HTTP/1.0")
+                try:
+                    length = headers.get("content-length", "0") or "0"
+                    if not length.isdecimal():
+                        keep_alive = False
+                        raise HTTPError(400, "Invalid Content-Length")
+                    length = int(length)
+                    if length > MAX_BODY_SIZE:
+                        keep_alive = False
+                        raise HTTPError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self.dispatch(method, target.split("?", 1)[0], body)
+                except HTTPError as e:
+                    status, response = e.status, {"error": e.message}
+                except asyncio.IncompleteReadError:
+                    break
+                except Exception:
+                    logger.exception("Unhandled error serving %s %s", method, target)
+                    status, response = 500, {"error": "Internal server error"}
+
+                if isinstance(response, str):
+                    data = response.encode()
+                    content_type = "text/plain; version=0.0.4"
+                else:
+                    data = json.dumps(response).encode()
+                    content_type = "application/json"
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+
+async def serve(host: str = "0.0.0.0", port: int = 8000,
+                service: Optional[YardageService] = None) -> asyncio.AbstractServer:
+    """Start the yardage service and return the listening server."""
+    service = service or YardageService()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    logger.info("Yardage service listening on %s:%d", host, port)
+    return server
+
+
+async def main():
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
+    # INSTRUMENTATION=1 enables per-stage timing and the /metrics endpoints
+    instrumented = os.environ.get("INSTRUMENTATION", "").lower() in ("1", "true", "yes")
+    # CALIBRATION=path loads a fitted parameter bundle (see calibration.py)
+    calibration = os.environ.get("CALIBRATION")
+    model = calibrated_model(calibration) if calibration else None
+    # PROFILE_DIR=path persists player profiles; otherwise they live in memory
+    profiles = ProfileStore(os.environ.get("PROFILE_DIR"))
+    # SHOT_HISTORY=path records every prediction and logged shot (see shot_history.py)
+    history = ShotHistory(os.environ["SHOT_HISTORY"]) if os.environ.get("SHOT_HISTORY") else None
+    service = YardageService(model, Instrumentation() if instrumented else None, profiles, history)
+    server = await serve(os.environ.get("HOST", "0.0.0.0"), int(os.environ.get("PORT", 8000)), service)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        profiles.flush()
+        if history is not None:
+            history.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,279 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from yardage_model import YardageModel, SkillLevel as BaseSkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, ShotResult
+from yardage_kernel import KernelYardageModel
+
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_THRESHOLD = 0.10  # Fail on a 10% regression
+
+CLUBS = ("driver", "3-wood", "5-iron", "7-iron", "pitching-wedge")
+BALLS = ("tour_premium", "distance", "mid_range", "two_piece")
+
+
+@dataclass
+class Metric:
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+    change: float  # Fractional change in the bad direction
+
+
+def _percentiles(samples_ns: List[int]) -> Dict[str, float]:
+    """p50/p99 in microseconds."""
+    samples = np.array(samples_ns) / 1000
+    return {"p50": float(np.percentile(samples, 50)), "p99": float(np.percentile(samples, 99))}
+
+
+def _time_calls(call: Callable[[int], object], calls: int, warmup: int = 200) -> Dict[str, float]:
+    """Per-call latency of call(i) for i in range(calls)."""
+    for i in range(warmup):
+        call(i)
+    timer = time.perf_counter_ns
+    samples = []
+    for i in range(calls):
+        start = timer()
+        call(i)
+        samples.append(timer() - start)
+    return _percentiles(samples)
+
+
+def _random_conditions(n: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "target_yardage": rng.uniform(60, 300, n),
+        "club": rng.choice(CLUBS, n),
+        "temperature": rng.uniform(40, 100, n),
+        "altitude": rng.uniform(0, 8000, n),
+        "wind_speed": rng.uniform(0, 25, n),
+        "wind_direction": rng.uniform(0, 360, n),
+        "ball_model": rng.choice(BALLS, n),
+    }
+
+
+def bench_scalar(metrics: Dict[str, Metric], calls: int):
+    """Scalar calculate_adjusted_yardage latency, cycling through clubs and targets."""
+    base = YardageModel()
+    base.set_conditions(85, 5280, 10, 45)
+    targets = [100 + i % 200 for i in range(64)]
+    latency = _time_calls(lambda i: base.calculate_adjusted_yardage(
+        targets[i % 64], BaseSkillLevel.PROFESSIONAL, CLUBS[i % 5]), calls)
+    for p, value in latency.items():
+        metrics[f"yardage_model.scalar.{p}"] = Metric(value, "us")
+
+    enhanced = YardageModelEnhanced()
+    enhanced.set_conditions(85, 5280, 10, 45)
+    latency = _time_calls(lambda i: enhanced.calculate_adjusted_yardage(
+        targets[i % 64], SkillLevel.PROFESSIONAL, CLUBS[i % 5]), calls)
+    for p, value in latency.items():
+        metrics[f"yardage_model_enhanced.scalar.{p}"] = Metric(value, "us")
+
+    # Conditions changing on every call (no snapshot reuse)
+    rows = _random_conditions(1024)
+    def changing(i):
+        j = i % 1024
+        enhanced.set_conditions(rows["temperature"][j], rows["altitude"][j],
+                                rows["wind_speed"][j], rows["wind_direction"][j])
+        return enhanced.calculate_adjusted_yardage(rows["target_yardage"][j], SkillLevel.PROFESSIONAL,
+                                                   rows["club"][j])
+    latency = _time_calls(changing, calls)
+    for p, value in latency.items():
+        metrics[f"yardage_model_enhanced.scalar_new_conditions.{p}"] = Metric(value, "us")
+
+
+def bench_optimal_club(metrics: Dict[str, Metric], calls: int):
+    """get_optimal_club latency with fixed and with changing conditions."""
+    rows = _random_conditions(1024, seed=1)
+    for name, model, skill in (("yardage_model", YardageModel(), BaseSkillLevel.PROFESSIONAL),
+                               ("yardage_model_enhanced", YardageModelEnhanced(), SkillLevel.PROFESSIONAL)):
+        model.set_conditions(85, 5280, 10, 45)
+        latency = _time_calls(lambda i: model.get_optimal_club(rows["target_yardage"][i % 1024], skill), calls)
+        for p, value in latency.items():
+            metrics[f"{name}.optimal_club.{p}"] = Metric(value, "us")
+
+        def changing(i):
+            j = i % 1024
+            model.set_conditions(rows["temperature"][j], rows["altitude"][j],
+                                 rows["wind_speed"][j], rows["wind_direction"][j])
+            return model.get_optimal_club(rows["target_yardage"][j], skill)
+        latency = _time_calls(changing, calls // 4)
+        for p, value in latency.items():
+            metrics[f"{name}.optimal_club_new_conditions.{p}"] = Metric(value, "us")
+
+
+def bench_batch(metrics: Dict[str, Metric], rows: int, repeats: int = 5):
+    """Batch API throughput on random rows (best of several runs)."""
+    data = _random_conditions(rows, seed=2)
+    base_args = (data["target_yardage"], data["club"], data["temperature"], data["altitude"],
+                 data["wind_speed"], data["wind_direction"])
+    for name, call in (
+            ("yardage_model", lambda: YardageModel().calculate_adjusted_yardage_batch(*base_args)),
+            ("yardage_model_enhanced", lambda: YardageModelEnhanced().calculate_adjusted_yardage_batch(
+                *base_args, data["ball_model"])),
+            # Fused Numba kernel when installed, otherwise the NumPy path with factorized names
+            ("yardage_kernel", lambda: KernelYardageModel().calculate_adjusted_yardage_batch(
+                *base_args, data["ball_model"]))):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            call()
+            best = min(best, time.perf_counter() - start)
+        metrics[f"{name}.batch.throughput"] = Metric(rows / best, "rows/s", higher_is_better=True)
+
+
+def bench_memory(metrics: Dict[str, Metric]):
+    """Peak memory to hold 1M results, columnar (batch) and as ShotResult objects."""
+    data = _random_conditions(1_000_000, seed=3)
+    model = YardageModelEnhanced()
+    tracemalloc.start()
+    result = model.calculate_adjusted_yardage_batch(
+        data["target_yardage"], data["club"], data["temperature"], data["altitude"],
+        data["wind_speed"], data["wind_direction"], data["ball_model"])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    metrics["yardage_model_enhanced.batch.peak_memory_per_1m"] = Metric(peak / 1e6, "MB")
+    metrics["yardage_model_enhanced.batch.result_memory_per_1m"] = Metric(
+        (result.carry_distance.nbytes + result.lateral_movement.nbytes) / 1e6, "MB")
+
+    # Scalar results: 100k ShotResult objects, scaled to 1M
+    tracemalloc.start()
+    results = [ShotResult(float(c), float(l))
+               for c, l in zip(result.carry_distance[:100_000], result.lateral_movement[:100_000])]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    metrics["yardage_model_enhanced.scalar.result_memory_per_1m"] = Metric(size * 10 / 1e6, "MB")
+
+
+def bench_import(metrics: Dict[str, Metric], repeats: int = 5):
+    """Cold import time of each model module in a fresh interpreter (median)."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    for module in ("yardage_model", "yardage_model_enhanced"):
+        code = (f"import time; t = time.perf_counter(); import {module}; "
+                f"print(time.perf_counter() - t)")
+        samples = []
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                                    capture_output=True, text=True).stdout
+            samples.append(float(output.strip()) * 1000)
+        metrics[f"{module}.import_time"] = Metric(float(np.median(samples)), "ms")
+
+
+def run_benchmarks(quick: bool = False) -> Dict[str, Metric]:
+    """Run the full suite; quick mode uses fewer samples for a smoke run."""
+    calls = 2_000 if quick else 20_000
+    metrics: Dict[str, Metric] = {}
+    bench_scalar(metrics, calls)
+    bench_optimal_club(metrics, calls)
+    bench_batch(metrics, 100_000 if quick else 1_000_000, repeats=2 if quick else 5)
+    bench_memory(metrics)
+    bench_import(metrics, repeats=2 if quick else 5)
+    return metrics
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def save_results(metrics: Dict[str, Metric], path: str):
+    """Write metrics plus machine/version metadata as JSON."""
+    report = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+        },
+        "metrics": {name: asdict(metric) for name, metric in sorted(metrics.items())},
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Metric]:
+    with open(path) as f:
+        return {name: Metric(**metric) for name, metric in json.load(f)["metrics"].items()}
+
+
+def compare(current: Dict[str, Metric], baseline: Dict[str, Metric],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+    """
+    Metrics that got worse than the baseline by more than threshold.
+
+    Latency and memory regress when they grow; throughput regresses when it drops.
+    Metrics missing from either side are ignored.
+    """
+    regressions = []
+    for name, metric in current.items():
+        reference = baseline.get(name)
+        if reference is None or reference.value == 0:
+            continue
+        change = (metric.value - reference.value) / reference.value
+        if metric.higher_is_better:
+            change = -change
+        if change > threshold:
+            regressions.append(Regression(name, reference.value, metric.value, change))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the yardage models")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to save this run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed fractional regression per metric (default 0.10)")
+    parser.add_argument("--update-baseline", action="store_true", help="Save this run as the baseline")
+    parser.add_argument("--quick", action="store_true", help="Fewer samples, for smoke runs")
+    args = parser.parse_args(argv)
+
+    metrics = run_benchmarks(quick=args.quick)
+    save_results(metrics, args.output)
+    width = max(len(name) for name in metrics)
+    for name, metric in sorted(metrics.items()):
+        print(f"{name:<{width}}  {metric.value:>14,.2f} {metric.unit}")
+
+    if args.update_baseline:
+        save_results(metrics, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = compare(metrics, load_results(args.baseline), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}:")
+        for r in regressions:
+            print(f"  {r.name}: {r.baseline:,.2f} -> {r.current:,.2f} ({r.change:+.1%})")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,511 @@
+import argparse
+import csv
+import json
+import re
+import sys
+from dataclasses import dataclass, field, asdict, fields, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, ClubData
+from table_store import model_fingerprint
+from club_loft import STOCK_LOFTS
+
+try:
+    from scipy.optimize import least_squares
+except ImportError:  # The numpy Levenberg-Marquardt below is always available
+    least_squares = None
+
+BUNDLE_FORMAT = "yardage-calibration"
+BUNDLE_VERSION = 1
+
+# Launch-monitor export headers (TrackMan, GC Quad, validation-data.md), after
+# normalize_header, mapped onto ShotTable columns
+COLUMN_ALIASES = {
+    "club_type": "club",
+    "ball": "ball_model",
+    "carry_distance": "carry",
+    "carry_yds": "carry",
+    "side": "lateral",
+    "carry_side": "lateral",
+    "offline": "lateral",
+    "lateral_movement": "lateral",
+    "speed": "ball_speed",
+    "launch": "launch_angle",
+    "vla": "launch_angle",
+    "spin": "spin_rate",
+    "back_spin": "spin_rate",
+    "total_spin": "spin_rate",
+    "height": "max_height",
+    "peak_height": "max_height",
+    "apex": "max_height",
+    "landing_angle": "land_angle",
+    "descent_angle": "land_angle",
+    "target": "target_yardage",
+    "stock_yardage": "target_yardage",
+    "temp": "temperature",
+    "elevation": "altitude",
+}
+
+# Club names as launch monitors write them
+CLUB_ALIASES = {
+    "dr": "driver",
+    "1w": "driver",
+    "1-wood": "driver",
+    "pw": "pitching-wedge",
+    "p": "pitching-wedge",
+}
+
+# Launch-monitor measurements averaged per club into CLUB_DATABASE
+LAUNCH_FIELDS = ("ball_speed", "launch_angle", "spin_rate", "max_height", "land_angle")
+CONDITION_FIELDS = ("temperature", "altitude", "wind_speed", "wind_direction")
+
+FD_STEP = 1e-6  # Relative finite-difference step for the Jacobian
+
+
+def normalize_header(name: str) -> str:
+    """Column name without units, e.g. "Ball Speed (mph)" -> "ball_speed"; aliases applied."""
+    name = re.sub(r"[(\[].*?[)\]]", "", name).strip().lower()
+    name = re.sub(r"[^a-z0-9]+", "_", name).strip("_")
+    return COLUMN_ALIASES.get(name, name)
+
+
+def normalize_club(name: str) -> str:
+    """CLUB_DATABASE key for a club name, e.g. "7 Iron", "7i" -> "7-iron", "PW" -> "pitching-wedge"."""
+    club = re.sub(r"[\s_]+", "-", name.strip().lower())
+    club = CLUB_ALIASES.get(club, club)
+    match = re.fullmatch(r"(\d+)-?([iw])", club)
+    if match:
+        club = f"{match.group(1)}-{'iron' if match.group(2) == 'i' else 'wood'}"
+    return CLUB_ALIASES.get(club, club)
+
+
+def parse_value(value: Any) -> float:
+    """
+    Number from a launch-monitor cell: units are dropped ("245y", "12.1°", "150 mph")
+    and a trailing L/R side marks left as negative. Blank cells are NaN.
+    """
+    if value is None:
+        return np.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    match = re.match(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", text)
+    if not match:
+        return np.nan
+    number = float(match.group())
+    return -number if text.upper().endswith("L") else number
+
+
+@dataclass
+class ShotTable:
+    """
+    Launch-monitor shots as columns. Unknown values are NaN; a NaN target_yardage
+    means the shot's stock yardage is fitted per club.
+    """
+    club: np.ndarray                 # CLUB_DATABASE keys
+    ball_model: np.ndarray           # BALL_MODELS keys
+    carry: np.ndarray                # Measured carry in yards
+    lateral: np.ndarray              # Measured lateral movement in yards (+ is right)
+    target_yardage: np.ndarray       # Stock yardage the shot was played at
+    temperature: np.ndarray
+    altitude: np.ndarray
+    wind_speed: np.ndarray
+    wind_direction: np.ndarray
+    ball_speed: np.ndarray           # mph
+    launch_angle: np.ndarray         # Degrees
+    spin_rate: np.ndarray            # rpm
+    max_height: np.ndarray           # Yards
+    land_angle: np.ndarray           # Degrees
+
+    def __len__(self) -> int:
+        return len(self.carry)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]], ball_model: str = "mid_range",
+                     club: Optional[str] = None) -> "ShotTable":
+        """
+        Shots from loader records keyed by any launch-monitor header (see COLUMN_ALIASES).
+
+        Args:
+            records: One mapping per shot; shots without a carry are skipped
+            ball_model: Ball for records without one
+            club: Club for records without one
+        """
+        columns: Dict[str, list] = {f.name: [] for f in fields(cls)}
+        for record in records:
+            values = {normalize_header(key): value for key, value in record.items() if key}
+            carry = parse_value(values.get("carry"))
+            if np.isnan(carry):
+                continue
+            name = values.get("club") or club
+            if not name:
+                raise ValueError(f"Shot has no club: {dict(record)}")
+            columns["club"].append(normalize_club(name))
+            columns["ball_model"].append(values.get("ball_model") or ball_model)
+            columns["carry"].append(carry)
+            for name in columns:
+                if name not in ("club", "ball_model", "carry"):
+                    columns[name].append(parse_value(values.get(name)))
+        return cls(**{name: np.array(values, dtype=str if name in ("club", "ball_model") else float)
+                      for name, values in columns.items()})
+
+    @classmethod
+    def concat(cls, tables: Sequence["ShotTable"]) -> "ShotTable":
+        return cls(**{f.name: np.concatenate([getattr(t, f.name) for t in tables]) for f in fields(cls)})
+
+
+def load_csv(path: str, ball_model: str = "mid_range", club: Optional[str] = None) -> ShotTable:
+    """Shots from a launch-monitor CSV export with a header row."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return ShotTable.from_records(csv.DictReader(f), ball_model, club)
+
+
+def read_pipe_table(text: str) -> List[Dict[str, str]]:
+    """Records from a "Header | Header" text table such as those in validation-data.md."""
+    lines = [line for line in text.splitlines() if "|" in line]
+    if not lines:
+        return []
+    header = [cell.strip() for cell in lines[0].split("|")]
+    return [dict(zip(header, (cell.strip() for cell in line.split("|")))) for line in lines[1:]]
+
+
+def load_markdown(path: str, ball_model: str = "mid_range") -> ShotTable:
+    """
+    Shots from every fenced table with a Carry column in a markdown file.
+
+    Tables without a Club column take their club from the nearest heading
+    when it names one (e.g. "### 1. Driver Data Set").
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    known = set(YardageModelEnhanced.CLUB_DATABASE)
+    tables = []
+    heading_club = None
+    for block in re.split(r"^```.*$", text, flags=re.MULTILINE):
+        for line in block.splitlines():
+            if line.startswith("#"):
+                words = (normalize_club(word) for word in re.findall(r"[\w-]+", line))
+                heading_club = next((word for word in words if word in known), None)
+        records = read_pipe_table(block)
+        if records and "carry" in {normalize_header(key) for key in records[0]}:
+            tables.append(ShotTable.from_records(records, ball_model, heading_club))
+    if not tables:
+        raise ValueError(f"No shot tables with a Carry column in {path}")
+    return ShotTable.concat(tables)
+
+
+def load_shots(paths: Sequence[str], ball_model: str = "mid_range") -> ShotTable:
+    """Shots from CSV and markdown files, by extension."""
+    return ShotTable.concat([load_markdown(path, ball_model) if path.endswith(".md")
+                             else load_csv(path, ball_model) for path in paths])
+
+
+def levenberg_marquardt(residuals: Callable[[np.ndarray], np.ndarray],
+                        jacobian: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                        x0: np.ndarray, max_iterations: int = 50,
+                        tolerance: float = 1e-10) -> Tuple[np.ndarray, int, bool]:
+    """
+    Minimize ||residuals(x)||² with Marquardt-scaled damping.
+
+    Parameters the residuals do not depend on have zero Jacobian columns and
+    are left where they start.
+
+    Returns:
+        Tuple: solution, iterations and whether the relative cost change fell below tolerance
+    """
+    x = np.asarray(x0, dtype=float).copy()
+    r = residuals(x)
+    cost = r @ r
+    damping = 1e-3
+    for iteration in range(1, max_iterations + 1):
+        J = jacobian(x, r)
+        A = J.T @ J
+        g = J.T @ r
+        scale = np.diag(A).copy()
+        scale[scale == 0] = 1.0
+        while True:
+            try:
+                step = np.linalg.solve(A + damping * np.diag(scale), -g)
+            except np.linalg.LinAlgError:
+                step = None
+            if step is not None:
+                candidate = x + step
+                r_new = residuals(candidate)
+                cost_new = r_new @ r_new
+                if cost_new < cost:
+                    break
+            damping *= 10
+            if damping > 1e12:
+                return x, iteration, True  # No step improves the fit: at a minimum
+        improvement = cost - cost_new
+        x, r, cost = candidate, r_new, cost_new
+        damping = max(damping / 10, 1e-12)
+        if improvement <= tolerance * max(cost, 1e-300):
+            return x, iteration, True
+    return x, max_iterations, False
+
+
+@dataclass
+class CalibrationResult:
+    parameters: Dict[str, Any]                   # apply_parameters input
+    stock_yardage: Dict[str, float]              # Fitted stock yardage of clubs shot without a target
+    shots: int
+    rms_before: Dict[str, float]                 # "carry"/"lateral" RMS error in yards
+    rms_after: Dict[str, float]
+    iterations: int
+    converged: bool
+    fingerprint: str = ""                        # model_fingerprint of the calibrated model
+    created: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_bundle(self, model: str = YardageModelEnhanced.__name__) -> Dict[str, Any]:
+        return {"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "model": model, **asdict(self)}
+
+    def save(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_bundle(), f, indent=1)
+            f.write("\n")
+
+
+def _club_database(shots: ShotTable, model: YardageModelEnhanced) -> Tuple[Dict[str, ClubData], Dict[str, float]]:
+    """
+    CLUB_DATABASE and SPIN_DECAY_RATES with the per-club mean of each measured
+    launch field (its least-squares estimate). Clubs not yet in the database need
+    ball speed, launch, spin and height; land angle and spin decay are then
+    interpolated from the existing clubs by launch angle.
+    """
+    clubs, inverse = np.unique(shots.club, return_inverse=True)
+    means = {}
+    for name in LAUNCH_FIELDS:
+        values = getattr(shots, name)
+        known = ~np.isnan(values)
+        counts = np.bincount(inverse[known], minlength=len(clubs))
+        totals = np.bincount(inverse[known], values[known], minlength=len(clubs))
+        with np.errstate(invalid="ignore"):
+            means[name] = totals / counts
+
+    database = dict(model.CLUB_DATABASE)
+    decay = dict(model.SPIN_DECAY_RATES)
+    by_launch = sorted(database.values(), key=lambda c: c.launch_angle)
+    launch = [c.launch_angle for c in by_launch]
+    for i, club in enumerate(clubs):
+        measured = {name: float(means[name][i]) for name in LAUNCH_FIELDS if not np.isnan(means[name][i])}
+        if club in database:
+            database[club] = replace(database[club], **measured)
+            continue
+        missing = [name for name in LAUNCH_FIELDS[:4] if name not in measured]
+        if missing:
+            raise ValueError(f"New club {club} needs launch data: {', '.join(missing)}")
+        measured.setdefault("land_angle", float(np.interp(
+            measured["launch_angle"], launch, [c.land_angle for c in by_launch])))
+        spin_decay = float(np.interp(measured["launch_angle"], launch, [c.spin_decay for c in by_launch]))
+        database[club] = ClubData(name=club.replace("-", " ").title(), spin_decay=spin_decay,
+                                  loft=STOCK_LOFTS.get(club), **measured)
+        decay[club] = spin_decay
+    return database, decay
+
+
+def _rms(values: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(values ** 2))) if values.size else 0.0
+
+
+def fit(shots: ShotTable, model: Optional[YardageModelEnhanced] = None,
+        max_iterations: int = 50, solver: str = "auto") -> CalibrationResult:
+    """
+    Fit model constants to launch-monitor shots by nonlinear least squares.
+
+    Club launch characteristics are the per-club means of the measured fields.
+    Then carry and lateral residuals of every shot are minimized jointly over
+    HEAD_TAIL_SCALE, HEADWIND_FACTOR, LATERAL_SCALE, each ball's speed_factor and
+    temp_sensitivity, and the stock yardage of clubs shot without a target.
+    Names and conditions are resolved to columns once; every residual
+    evaluation is a single vectorized pass over all shots, and the Jacobian is
+    built by grouped finite differences (per-ball and per-club parameters touch
+    disjoint rows, so each group costs one pass), six passes in all.
+
+    Only the product CROSSWIND_FACTOR * LATERAL_SCALE is observable, so
+    CROSSWIND_FACTOR is held. A ball's speed_factor is fitted only from shots
+    with a known target_yardage, since it is otherwise confounded with the stock
+    yardage. Parameters no shot depends on (e.g. wind factors without windy
+    shots) keep their values.
+
+    Args:
+        shots: Launch-monitor shots
+        model: Model whose constants are the starting point (default: YardageModelEnhanced)
+        max_iterations: Levenberg-Marquardt iterations
+        solver: "numpy", "scipy" (scipy.optimize.least_squares) or "auto" (scipy when installed)
+
+    Returns:
+        CalibrationResult: Fitted parameters, ready to save as a bundle
+    """
+    if solver == "auto":
+        solver = "numpy" if least_squares is None else "scipy"
+    if solver == "scipy" and least_squares is None:
+        raise ImportError("scipy is required for solver='scipy'")
+    if not len(shots):
+        raise ValueError("No shots to calibrate against")
+    base = model or YardageModelEnhanced()
+    for ball in np.unique(shots.ball_model):
+        if ball not in base.BALL_MODELS:
+            raise ValueError(f"Unknown ball model: {ball}")
+
+    # Scratch model with the measured club table; the fit only changes its columns
+    clubs_table, decay = _club_database(shots, base)
+    scratch = YardageModelEnhanced()
+    scratch.apply_parameters({"CLUB_DATABASE": {k: asdict(v) for k, v in clubs_table.items()},
+                              "SPIN_DECAY_RATES": decay,
+                              **{name: getattr(base, name) for name in base.WIND_FACTORS}})
+    scratch.BALL_MODELS = dict(base.BALL_MODELS)
+    size = len(shots)
+    club_columns = scratch._club_columns(shots.club, size)
+    ball_columns = scratch._ball_columns(shots.ball_model, size)
+    conditions = scratch._condition_columns(*(getattr(shots, name) for name in CONDITION_FIELDS), size)
+
+    has_target = ~np.isnan(shots.target_yardage)
+    has_lateral = ~np.isnan(shots.lateral)
+    balls, ball_index = np.unique(shots.ball_model, return_inverse=True)
+    clubs, club_index = np.unique(shots.club, return_inverse=True)
+
+    # Parameter vector: wind factors, then groups of per-ball and per-club parameters.
+    # owner maps each shot to its parameter within a group (-1: not affected).
+    wind = ["HEAD_TAIL_SCALE", "HEADWIND_FACTOR", "LATERAL_SCALE"]
+    x0 = [getattr(base, name) for name in wind]
+    groups: List[Tuple[np.ndarray, np.ndarray]] = [(np.array([i]), np.zeros(size, dtype=int))
+                                                   for i in range(len(wind))]
+
+    def add_group(initial: Sequence[float], owner: np.ndarray) -> np.ndarray:
+        indices = np.arange(len(x0), len(x0) + len(initial))
+        x0.extend(initial)
+        groups.append((indices, owner))
+        return indices
+
+    speed_balls = np.unique(ball_index[has_target])
+    speed_position = np.full(len(balls), -1)
+    speed_position[speed_balls] = np.arange(len(speed_balls))
+    speed = add_group([base.BALL_MODELS[balls[b]].speed_factor for b in speed_balls],
+                      speed_position[ball_index])
+    sensitivity = add_group([base.BALL_MODELS[b].temp_sensitivity for b in balls], ball_index)
+    stock_clubs = np.unique(club_index[~has_target])
+    stock_position = np.full(len(clubs), -1)
+    stock_position[stock_clubs] = np.arange(len(stock_clubs))
+    stock_owner = np.where(has_target, -1, stock_position[club_index])
+    # Start each fitted stock yardage at the club's mean measured carry
+    mean_carry = np.bincount(club_index, shots.carry, len(clubs)) / np.bincount(club_index, minlength=len(clubs))
+    stock = add_group(mean_carry[stock_clubs], stock_owner)
+    x0 = np.array(x0, dtype=float)
+
+    def predict(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        scratch.HEAD_TAIL_SCALE, scratch.HEADWIND_FACTOR, scratch.LATERAL_SCALE = x[:3]
+        ball = dict(ball_columns)
+        speed_factor = np.array([base.BALL_MODELS[b].speed_factor for b in balls])
+        speed_factor[speed_balls] = x[speed]
+        ball["speed_factor"] = speed_factor[ball_index]
+        ball["temp_sensitivity"] = x[sensitivity][ball_index]
+        target = shots.target_yardage.copy()
+        target[~has_target] = x[stock][stock_owner[~has_target]]
+        return scratch._adjusted_columns(target, club_columns, ball, conditions)
+
+    def residuals(x: np.ndarray) -> np.ndarray:
+        carry, lateral = predict(x)
+        return np.concatenate([carry - shots.carry, (lateral - shots.lateral)[has_lateral]])
+
+    owners = [np.concatenate([owner, owner[has_lateral]]) for _, owner in groups]
+
+    def jacobian(x: np.ndarray, r: Optional[np.ndarray] = None) -> np.ndarray:
+        r = residuals(x) if r is None else r
+        J = np.zeros((r.size, x.size))
+        for (indices, _), owner in zip(groups, owners):
+            if not indices.size:
+                continue
+            h = FD_STEP * np.maximum(np.abs(x[indices]), 1.0)
+            shifted = x.copy()
+            shifted[indices] += h
+            rows = np.flatnonzero(owner >= 0)
+            J[rows, indices[owner[rows]]] = (residuals(shifted)[rows] - r[rows]) / h[owner[rows]]
+        return J
+
+    before = residuals(x0)
+    if solver == "scipy":
+        solution = least_squares(residuals, x0, jac=jacobian, method="trf", x_scale="jac",
+                                 max_nfev=max_iterations)
+        x, iterations, converged = solution.x, int(solution.njev), solution.status > 0
+    else:
+        x, iterations, converged = levenberg_marquardt(residuals, jacobian, x0, max_iterations)
+    after = residuals(x)
+
+    ball_models = {}
+    for b, name in enumerate(balls.tolist()):
+        updates = {"temp_sensitivity": float(x[sensitivity][b])}
+        if speed_position[b] >= 0:
+            updates["speed_factor"] = float(x[speed][speed_position[b]])
+        ball_models[name] = replace(base.BALL_MODELS[name], **updates)
+    parameters = {
+        "CLUB_DATABASE": {name: asdict(club) for name, club in clubs_table.items()},
+        "BALL_MODELS": {name: asdict(ball) for name, ball in {**base.BALL_MODELS, **ball_models}.items()},
+        "SPIN_DECAY_RATES": decay,
+        **{name: float(getattr(scratch, name)) for name in base.WIND_FACTORS},
+    }
+    calibrated = YardageModelEnhanced()
+    calibrated.apply_parameters(parameters)
+    return CalibrationResult(
+        parameters=parameters,
+        stock_yardage={str(clubs[c]): round(float(x[stock][i]), 1) for i, c in enumerate(stock_clubs)},
+        shots=size,
+        rms_before={"carry": _rms(before[:size]), "lateral": _rms(before[size:])},
+        rms_after={"carry": _rms(after[:size]), "lateral": _rms(after[size:])},
+        iterations=iterations,
+        converged=bool(converged),
+        fingerprint=model_fingerprint(calibrated).hex(),
+    )
+
+
+def load_bundle(path: str) -> Dict[str, Any]:
+    """Read a calibration bundle, checking its format and version."""
+    with open(path) as f:
+        bundle = json.load(f)
+    if bundle.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"{path} is not a calibration bundle")
+    if bundle.get("version", 0) > BUNDLE_VERSION:
+        raise ValueError(f"Calibration bundle version {bundle['version']} is newer than "
+                         f"supported version {BUNDLE_VERSION}")
+    return bundle
+
+
+def calibrated_model(path: str, model: Optional[YardageModelEnhanced] = None) -> YardageModelEnhanced:
+    """
+    Model with a calibration bundle's parameters applied, e.g. at service startup.
+
+    Raises ValueError when the result does not match the fingerprint recorded at
+    fit time, i.e. the model's own tables changed since; refit in that case.
+    """
+    bundle = load_bundle(path)
+    model = model or YardageModelEnhanced()
+    model.apply_parameters(bundle["parameters"])
+    if bundle.get("fingerprint") and model_fingerprint(model).hex() != bundle["fingerprint"]:
+        raise ValueError(f"Calibration bundle {path} was fitted against different model tables; refit it")
+    return model
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fit model constants to launch-monitor shots")
+    parser.add_argument("paths", nargs="+", help="Launch-monitor CSV exports or markdown tables")
+    parser.add_argument("-o", "--output", default="calibration.json", help="Bundle to write")
+    parser.add_argument("--ball", default="mid_range", help="Ball model for shots without one")
+    parser.add_argument("--solver", default="auto", choices=("auto", "numpy", "scipy"))
+    args = parser.parse_args(argv)
+
+    shots = load_shots(args.paths, args.ball)
+    result = fit(shots, solver=args.solver)
+    result.save(args.output)
+    print(f"Fitted {result.shots} shots in {result.iterations} iterations"
+          f"{'' if result.converged else ' (not converged)'}")
+    for name in ("carry", "lateral"):
+        print(f"  {name} RMS {result.rms_before[name]:.2f} -> {result.rms_after[name]:.2f} yards")
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
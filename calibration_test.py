@@ -0,0 +1,68 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from calibration import ShotTable, fit, calibrated_model, LAUNCH_FIELDS
+from yardage_model_enhanced import YardageModelEnhanced
+
+TRUE_FACTORS = {"HEAD_TAIL_SCALE": 1.45, "HEADWIND_FACTOR": 1.3, "LATERAL_SCALE": 2.6}
+TRUE_BALL = {"speed_factor": 1.03, "temp_sensitivity": 0.9}
+STOCK_YARDAGE = {"driver": 248.0}  # Shot without a target, so its stock yardage is fitted
+
+
+def _synthetic_shots(seed: int = 0, n: int = 400) -> ShotTable:
+    """Shots carried exactly by a model with TRUE_FACTORS, launch data from the stock clubs."""
+    truth = YardageModelEnhanced()
+    for name, value in TRUE_FACTORS.items():
+        setattr(truth, name, value)
+    truth.BALL_MODELS = dict(truth.BALL_MODELS)
+    truth.BALL_MODELS["tour_premium"] = replace(truth.BALL_MODELS["tour_premium"], **TRUE_BALL)
+
+    rng = np.random.default_rng(seed)
+    club = rng.choice(["driver", "5-iron", "7-iron", "9-iron"], n)
+    target = np.where(club == "driver", np.nan, rng.uniform(120, 200, n))
+    played = np.where(club == "driver", STOCK_YARDAGE["driver"], target)
+    conditions = {
+        "temperature": rng.uniform(40, 100, n),
+        "altitude": rng.uniform(0, 6000, n),
+        "wind_speed": rng.uniform(0, 25, n),
+        "wind_direction": rng.uniform(0, 360, n),
+    }
+    result = truth.calculate_adjusted_yardage_batch(
+        played, club, *conditions.values(), "tour_premium", rounded=False)
+    launch = {name: np.array([getattr(truth.CLUB_DATABASE[c], name) for c in club])
+              for name in LAUNCH_FIELDS}
+    return ShotTable(club=club, ball_model=np.full(n, "tour_premium"),
+                     carry=result.carry_distance, lateral=result.lateral_movement,
+                     target_yardage=target, **conditions, **launch)
+
+
+def test_fit_recovers_known_wind_factors():
+    result = fit(_synthetic_shots(), solver="numpy")
+
+    assert result.converged
+    assert result.rms_after["carry"] < 1e-3 < result.rms_before["carry"]
+    assert result.rms_after["lateral"] < 1e-3 < result.rms_before["lateral"]
+    for name, value in TRUE_FACTORS.items():
+        assert result.parameters[name] == pytest.approx(value, rel=1e-4), name
+    ball = result.parameters["BALL_MODELS"]["tour_premium"]
+    for name, value in TRUE_BALL.items():
+        assert ball[name] == pytest.approx(value, rel=1e-4), name
+    assert result.stock_yardage == pytest.approx(STOCK_YARDAGE, abs=0.1)
+
+
+def test_bundle_round_trip(tmp_path):
+    result = fit(_synthetic_shots(seed=1, n=200), solver="numpy")
+    path = str(tmp_path / "calibration.json")
+    result.save(path)
+
+    model = calibrated_model(path)
+    for name, value in TRUE_FACTORS.items():
+        assert getattr(model, name) == pytest.approx(value, rel=1e-4)
+
+    # A table the bundle does not carry changed since the fit
+    model = YardageModelEnhanced()
+    model.ALTITUDE_EFFECTS = {**model.ALTITUDE_EFFECTS, 0: 1.01}
+    with pytest.raises(ValueError):
+        calibrated_model(path, model)
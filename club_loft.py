@@ -0,0 +1,104 @@
+import re
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+Number = Union[float, np.ndarray]
+
+# Loft-indexed club characteristics (ClubData field names) plus stock carry
+LOFT_FIELDS = ("ball_speed", "launch_angle", "spin_rate", "max_height", "land_angle", "spin_decay", "carry")
+
+# Static lofts clubs are interpolated over (club-effects.md: drivers from 8°, wedges to 64°)
+LOFT_RANGE = (8.0, 64.0)
+
+# Stock lofts of a full bag in degrees; clubs without tour data are interpolated by loft
+STOCK_LOFTS = {
+    "driver": 10.5,
+    "3-wood": 15.0,
+    "5-wood": 18.0,
+    "hybrid": 19.0,
+    "3-iron": 21.0,
+    "4-iron": 24.0,
+    "5-iron": 27.0,
+    "6-iron": 30.0,
+    "7-iron": 34.0,
+    "8-iron": 38.0,
+    "9-iron": 42.0,
+    "pitching-wedge": 46.0,
+    "gap-wedge": 50.0,
+    "sand-wedge": 56.0,
+    "lob-wedge": 60.0,
+}
+
+
+def parse_loft(club: str) -> float:
+    """
+    Loft in degrees for a club name from STOCK_LOFTS or a loft name such as
+    "56-degree", "56°" or "56"; raises ValueError for anything else.
+    """
+    name = club.strip().lower()
+    if name in STOCK_LOFTS:
+        return STOCK_LOFTS[name]
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)(?:\s*°|[\s-]*deg(?:ree)?s?)?(?:-wedge)?", name)
+    if not match:
+        raise ValueError(f"Unknown club: {club}")
+    return float(match.group(1))
+
+
+class LoftTable:
+    """
+    Piecewise-linear club characteristics as a function of loft.
+
+    All fields share the loft breakpoints, so one searchsorted locates every
+    query loft and the whole table is interpolated in a single pass. The first
+    and last segments extend linearly to LOFT_RANGE; lofts outside it raise.
+    """
+
+    def __init__(self, anchors: Mapping[float, Mapping[str, float]],
+                 loft_range: Tuple[float, float] = LOFT_RANGE):
+        if len(anchors) < 2:
+            raise ValueError("Loft table needs at least two lofts")
+        self.lofts = np.array(sorted(anchors), dtype=float)
+        self.fields = tuple(name for name in LOFT_FIELDS if all(name in anchors[l] for l in anchors))
+        self._values = np.array([[anchors[loft][name] for name in self.fields] for loft in sorted(anchors)],
+                                dtype=float)
+        self.loft_range = loft_range
+
+    @classmethod
+    def from_clubs(cls, clubs: Mapping[str, Any], carry: Optional[Mapping[str, float]] = None,
+                   loft_range: Tuple[float, float] = LOFT_RANGE) -> "LoftTable":
+        """
+        Table anchored at every club with a loft, e.g. a model's CLUB_DATABASE.
+
+        Args:
+            clubs: Name -> ClubData; clubs without a loft are skipped
+            carry: Stock carry per club name; adds a carry field when it covers every anchor
+        """
+        anchors = {}
+        for name, club in clubs.items():
+            if getattr(club, "loft", None) is None:
+                continue
+            values = {field: getattr(club, field) for field in LOFT_FIELDS if hasattr(club, field)}
+            if carry is not None and name in carry:
+                values["carry"] = carry[name]
+            anchors[club.loft] = values
+        return cls(anchors, loft_range)
+
+    def __call__(self, loft: Number) -> Dict[str, Number]:
+        """Every field at the given loft(s): floats for a scalar loft, arrays otherwise."""
+        lofts = np.asarray(loft, dtype=float)
+        low, high = self.loft_range
+        if np.any((lofts < low) | (lofts > high)) or np.any(np.isnan(lofts)):
+            raise ValueError(f"Loft outside [{low}, {high}] degrees: {loft}")
+        keys = self.lofts
+        idx = np.clip(np.searchsorted(keys, lofts, side="left") - 1, 0, len(keys) - 2)
+        ratio = ((lofts - keys[idx]) / (keys[idx + 1] - keys[idx]))[..., None]
+        values = self._values[idx] + (self._values[idx + 1] - self._values[idx]) * ratio
+        if values.ndim == 1:
+            return {name: float(v) for name, v in zip(self.fields, values)}
+        return {name: values[:, i] for i, name in enumerate(self.fields)}
+
+    def grid(self, step: float = 0.25) -> np.ndarray:
+        """Evenly spaced lofts covering the table's range, e.g. for a continuous club search."""
+        low, high = self.loft_range
+        return np.linspace(low, high, int(round((high - low) / step)) + 1)
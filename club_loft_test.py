@@ -0,0 +1,68 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from club_loft import LoftTable, parse_loft, LOFT_RANGE
+from yardage_model_enhanced import YardageModelEnhanced
+
+TABLE = LoftTable({20.0: {"ball_speed": 140.0, "carry": 200.0}, 40.0: {"ball_speed": 110.0, "carry": 150.0}})
+
+
+def test_loft_table_interpolates_every_field():
+    assert TABLE.fields == ("ball_speed", "carry")
+    assert TABLE(30.0) == {"ball_speed": 125.0, "carry": 175.0}
+    # The end segments extend linearly up to LOFT_RANGE
+    assert TABLE(50.0)["carry"] == pytest.approx(125.0)
+    values = TABLE(np.array([20.0, 30.0, 40.0]))
+    np.testing.assert_allclose(values["carry"], [200.0, 175.0, 150.0])
+    grid = TABLE.grid(0.5)
+    assert grid[0] == LOFT_RANGE[0] and grid[-1] == LOFT_RANGE[1] and np.allclose(np.diff(grid), 0.5)
+
+
+@pytest.mark.parametrize("loft", [LOFT_RANGE[0] - 1, LOFT_RANGE[1] + 1, np.nan, [30.0, 70.0]])
+def test_loft_table_rejects_lofts_outside_range(loft):
+    with pytest.raises(ValueError):
+        TABLE(loft)
+    with pytest.raises(ValueError):
+        LoftTable({30.0: {"carry": 170.0}})
+
+
+@pytest.mark.parametrize("name, loft", [
+    ("56-degree", 56.0), ("56°", 56.0), ("56", 56.0), ("52 degrees", 52.0), ("58-deg-wedge", 58.0),
+    ("Sand-Wedge", 56.0), (" driver ", 10.5),
+])
+def test_parse_loft(name, loft):
+    assert parse_loft(name) == loft
+
+
+@pytest.mark.parametrize("name", ["putter", "wedge", "7 iron", ""])
+def test_parse_loft_rejects_unknown_names(name):
+    with pytest.raises(ValueError):
+        parse_loft(name)
+
+
+def test_club_data_resolves_bag_and_loft_names():
+    model = YardageModelEnhanced()
+    assert model.club_data("7-Iron") is model.CLUB_DATABASE["7-iron"]
+    by_loft, by_name = model.club_data("56-degree"), model.club_data("Sand-Wedge")
+    assert (by_loft.name, by_name.name) == ("56 Degree", "Sand Wedge")
+    assert dataclasses.replace(by_loft, name="") == dataclasses.replace(by_name, name="")
+    assert model.club_data("56-DEGREE") is by_loft
+    with pytest.raises(ValueError):
+        model.club_data("putter")
+
+
+def test_loft_club_cache_is_bounded_and_reset_with_the_tables(monkeypatch):
+    monkeypatch.setattr(YardageModelEnhanced, "LOFT_CLUB_CACHE_SIZE", 8)
+    model = YardageModelEnhanced()
+    for loft in range(20, 40):
+        model.club_data(f"{loft}-degree")
+    assert model._loft_clubs.cache_info().currsize == 8
+
+    fast = {name: dict(dataclasses.asdict(club), ball_speed=club.ball_speed + 10)
+            for name, club in model.CLUB_DATABASE.items()}
+    before = model.club_data("56-degree")
+    model.apply_parameters({"CLUB_DATABASE": fast})
+    assert model._loft_clubs.cache_info().currsize == 0
+    assert model.club_data("56-degree").ball_speed > before.ball_speed
@@ -0,0 +1,99 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+
+@dataclass
+class ClubOption:
+    club: str
+    carry_distance: float    # Adjusted carry in yards
+    lateral_movement: float  # Lateral movement in yards (+ is right, - is left)
+    difference: float        # Adjusted carry minus target in yards
+
+
+@dataclass
+class ClubRecommendation:
+    best: ClubOption
+    alternatives: List[ClubOption] = field(default_factory=list)  # Next best clubs, closest first
+
+    @property
+    def club(self) -> str:
+        return self.best.club
+
+
+@dataclass
+class LoftRecommendation:
+    loft: float              # Static loft in degrees whose stock shot carries the target
+    club: str                # Club in the bag closest to that loft
+    stock_carry: float       # Carry of a stock swing at this loft in neutral conditions
+    carry_distance: float    # Adjusted carry in yards (the target unless out of reach)
+    lateral_movement: float  # Lateral movement in yards (+ is right, - is left)
+
+
+class ClubCarryIndex:
+    """
+    Clubs sorted by adjusted carry per yard of target for one set of conditions.
+
+    Every model scales carry linearly with target yardage, so a club's adjusted
+    carry for any target is target * carry_per_yard. The club whose adjusted carry
+    lands closest to the target is found by bisecting for a factor of 1.0, and
+    alternatives are read off by walking outward from that point.
+    """
+
+    def __init__(self, clubs: Sequence[str], carry_per_yard: Sequence[float],
+                 lateral_per_yard: Sequence[float]):
+        # Stable sort keeps bag order for equal factors
+        order = sorted(range(len(clubs)), key=lambda i: carry_per_yard[i])
+        self.clubs = [clubs[i] for i in order]
+        self.carry_per_yard = [float(carry_per_yard[i]) for i in order]
+        self.lateral_per_yard = [float(lateral_per_yard[i]) for i in order]
+        self.priority = order  # Position in the bag, used to break ties
+
+    def _gap(self, i: int, target_yardage: float) -> float:
+        return abs(target_yardage - round(target_yardage * self.carry_per_yard[i], 1))
+
+    def _option(self, i: int, target_yardage: float) -> ClubOption:
+        carry = round(target_yardage * self.carry_per_yard[i], 1)
+        return ClubOption(
+            club=self.clubs[i],
+            carry_distance=carry,
+            lateral_movement=round(target_yardage * self.lateral_per_yard[i], 1),
+            difference=round(carry - target_yardage, 1),
+        )
+
+    def recommend(self, target_yardage: float, max_alternatives: int = 2) -> ClubRecommendation:
+        """
+        Best club for the target plus up to max_alternatives ranked alternatives.
+
+        Clubs are ranked by the absolute gap between target and rounded adjusted carry,
+        with ties going to the club listed first in the bag.
+        """
+        if not self.clubs:
+            raise ValueError("No clubs to choose from")
+        if max_alternatives < 0:
+            raise ValueError(f"max_alternatives must be non-negative: {max_alternatives}")
+        wanted = min(max_alternatives + 1, len(self.clubs))
+        below = bisect.bisect_left(self.carry_per_yard, 1.0) - 1
+        above = below + 1
+
+        ranked = []
+        while below >= 0 or above < len(self.clubs):
+            # Take whichever neighbour is closer to the target
+            candidates = []
+            if below >= 0:
+                candidates.append((self._gap(below, target_yardage), self.priority[below], below))
+            if above < len(self.clubs):
+                candidates.append((self._gap(above, target_yardage), self.priority[above], above))
+            gap, priority, i = min(candidates)
+            # Stop once enough clubs are collected and nothing left can tie with them
+            if len(ranked) >= wanted and gap > ranked[-1][0]:
+                break
+            ranked.append((gap, priority, i))
+            if i == below:
+                below -= 1
+            else:
+                above += 1
+
+        ranked.sort()
+        options = [self._option(i, target_yardage) for _, _, i in ranked[:wanted]]
+        return ClubRecommendation(best=options[0], alternatives=options[1:])
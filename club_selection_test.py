@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from club_selection import ClubCarryIndex
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest
+
+
+def _brute_force(clubs, carry_per_yard, lateral_per_yard, target, max_alternatives):
+    """Every club ranked by gap to the target, ties in bag order."""
+    carries = [round(target * f, 1) for f in carry_per_yard]
+    ranked = sorted(range(len(clubs)), key=lambda i: (abs(target - carries[i]), i))
+    return [(clubs[i], carries[i], round(target * lateral_per_yard[i], 1))
+            for i in ranked[:max_alternatives + 1]]
+
+
+def _options(recommendation):
+    return [(o.club, o.carry_distance, o.lateral_movement)
+            for o in [recommendation.best] + recommendation.alternatives]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bisection_matches_exhaustive_search(seed):
+    rng = np.random.default_rng(seed)
+    n = 14
+    # Quantized factors give exact ties between clubs
+    carry = np.round(rng.uniform(0.7, 1.4, n), 2)
+    lateral = rng.uniform(-0.05, 0.05, n)
+    clubs = [f"club-{i}" for i in range(n)]
+    index = ClubCarryIndex(clubs, carry, lateral)
+    for target in np.concatenate([rng.uniform(40, 320, 200), [100.0, 1.0, 1000.0]]):
+        for max_alternatives in (0, 2, n + 3):
+            assert _options(index.recommend(target, max_alternatives)) == \
+                _brute_force(clubs, carry, lateral, target, max_alternatives)
+
+
+def test_ties_go_to_the_club_first_in_the_bag():
+    index = ClubCarryIndex(["a", "b", "c"], [1.1, 0.9, 1.1], [0.0, 0.0, 0.0])
+    recommendation = index.recommend(100.0, 2)
+    assert [o.club for o in [recommendation.best] + recommendation.alternatives] == ["a", "b", "c"]
+    assert recommendation.best.difference == 10.0
+    assert index.clubs == ["b", "a", "c"]
+
+
+def test_invalid_requests():
+    with pytest.raises(ValueError):
+        ClubCarryIndex([], [], []).recommend(150)
+    with pytest.raises(ValueError):
+        ClubCarryIndex(["a"], [1.0], [0.0]).recommend(150, max_alternatives=-1)
+
+
+@pytest.mark.parametrize("conditions", [Conditions(), Conditions(85, 5280, 12, 200), Conditions(45, 0, 20, 10)])
+def test_model_recommend_matches_per_club_calculate(conditions):
+    model = YardageModelEnhanced()
+    for target in (95.0, 150.0, 183.0, 262.0):
+        recommendation = model.recommend(target, conditions, max_alternatives=3)
+        results = {club: model.calculate(ShotRequest(target, club, conditions)) for club in model.CLUB_DATABASE}
+        ranked = sorted(results, key=lambda club: abs(target - results[club].carry_distance))
+        expected = [(club, results[club].carry_distance, results[club].lateral_movement) for club in ranked[:4]]
+        assert _options(recommendation) == expected
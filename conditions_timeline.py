@@ -0,0 +1,330 @@
+import bisect
+import csv
+import json
+import math
+import urllib.request
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, BatchShotResult, ArrayLike
+from air_density import air_density, REFERENCE_TEMPERATURE, REFERENCE_ALTITUDE
+
+# Weather service field names accepted by the loaders (Tomorrow.io style, see weather-api-integration.md)
+FIELD_ALIASES = {
+    "time": "timestamp",
+    "startTime": "timestamp",
+    "windSpeed": "wind_speed",
+    "windDirection": "wind_direction",
+    "pressureSurfaceLevel": "pressure",
+}
+
+Timestamp = Union[float, int, str, datetime]
+
+
+@dataclass(frozen=True)
+class WeatherSample:
+    timestamp: float                        # Seconds since the epoch
+    temperature: Optional[float] = None     # °F
+    wind_speed: Optional[float] = None      # mph
+    wind_direction: Optional[float] = None  # Degrees (0 is headwind, 180 is tailwind)
+    pressure: Optional[float] = None        # hPa
+    humidity: Optional[float] = None        # % relative humidity
+
+
+FIELDS = tuple(f.name for f in fields(WeatherSample) if f.name != "timestamp")
+
+
+def to_timestamp(value: Timestamp) -> float:
+    """Seconds since the epoch from a number, an ISO 8601 string or a datetime (naive = UTC)."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
+
+
+def _times(timestamps: Any) -> np.ndarray:
+    values = np.atleast_1d(np.asarray(timestamps))
+    if values.dtype.kind in "iuf":
+        return values.astype(float)
+    return np.array([to_timestamp(v) for v in values.tolist()], dtype=float)
+
+
+def _interpolate_direction(start, end, weight):
+    """Wind direction between start and end along the shorter arc (floats or arrays)."""
+    turn = 180 - (180 - (end - start)) % 360  # Signed turn in (-180, 180]
+    return (start + turn * weight) % 360
+
+
+def sample_from_mapping(record: Mapping[str, Any]) -> WeatherSample:
+    """WeatherSample from a loader record; aliases are renamed, blanks and unknown keys ignored."""
+    values = {FIELD_ALIASES.get(key, key): value for key, value in record.items()}
+    if values.get("timestamp") in (None, ""):
+        raise ValueError(f"Weather sample has no timestamp: {dict(record)}")
+    return WeatherSample(
+        timestamp=to_timestamp(values["timestamp"]),
+        **{name: float(values[name]) for name in FIELDS if values.get(name) not in (None, "")})
+
+
+class ConditionsTimeline:
+    """
+    Append-only store of timestamped weather samples with interpolation.
+
+    Samples are kept in time order in growable columns, so conditions for any
+    shot time are found by bisection in O(log n), and conditions for many shot
+    times by one searchsorted. Between samples, temperature, wind speed,
+    pressure and humidity are interpolated linearly and wind direction along
+    the shorter arc, so 350° to 10° passes through 0° rather than 180°.
+    Before the first or after the last sample the nearest sample is held. A
+    field missing from either neighbouring sample is unset at that time.
+
+    Args:
+        altitude: Course elevation in feet, added to every set of conditions
+        capacity: Initial number of samples to allocate room for
+    """
+
+    def __init__(self, altitude: Optional[float] = None, capacity: int = 1024):
+        self.altitude = altitude
+        self._size = 0
+        self._times = np.empty(capacity)
+        # Unset values are NaN
+        self._columns = {name: np.empty(capacity) for name in FIELDS}
+        # Window length -> {window number: density}, cleared on every append
+        self._densities: Dict[float, Dict[int, float]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._times[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw samples of one field (NaN where unset), read-only view."""
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def append(self, sample: WeatherSample):
+        """Add a sample; timestamps must not go backwards."""
+        if self._size and sample.timestamp < self._times[self._size - 1]:
+            raise ValueError(f"Sample at {sample.timestamp} is older than the last sample "
+                             f"({self._times[self._size - 1]}); the timeline is append-only")
+        if self._size == len(self._times):
+            self._grow()
+        self._times[self._size] = sample.timestamp
+        for name in FIELDS:
+            value = getattr(sample, name)
+            self._columns[name][self._size] = np.nan if value is None else value
+        self._size += 1
+        self._densities = {}
+
+    def extend(self, samples: Iterable[WeatherSample]):
+        for sample in samples:
+            self.append(sample)
+
+    def append_reading(self, record: Mapping[str, Any]):
+        """Append one weather service reading (see FIELD_ALIASES for accepted names)."""
+        self.append(sample_from_mapping(record))
+
+    def _grow(self):
+        capacity = max(2 * len(self._times), 16)
+        times = np.empty(capacity)
+        times[:self._size] = self._times[:self._size]
+        self._times = times
+        for name, values in self._columns.items():
+            grown = np.empty(capacity)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def _bracket(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Indices of the samples on either side of each time and the weight of the later one."""
+        if not self._size:
+            raise ValueError("The timeline has no samples")
+        stamps = self.timestamps
+        upper = np.clip(np.searchsorted(stamps, times, side="right"), 1, self._size - 1) \
+            if self._size > 1 else np.zeros(times.shape, dtype=np.intp)
+        lower = np.maximum(upper - 1, 0)
+        span = stamps[upper] - stamps[lower]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(span > 0, (times - stamps[lower]) / span, 0.0)
+        return lower, upper, np.clip(weight, 0.0, 1.0)
+
+    def columns(self, timestamps: ArrayLike) -> Dict[str, np.ndarray]:
+        """
+        Interpolated conditions at each timestamp as columns, NaN where unset.
+
+        Returns:
+            Dict: temperature, altitude, wind_speed, wind_direction, pressure and
+                  humidity arrays, ready for calculate_adjusted_yardage_batch
+        """
+        times = _times(timestamps)
+        lower, upper, weight = self._bracket(times)
+        result = {}
+        for name in FIELDS:
+            values = self._columns[name]
+            start, end = values[lower], values[upper]
+            if name == "wind_direction":
+                result[name] = _interpolate_direction(start, end, weight)
+            else:
+                result[name] = start + (end - start) * weight
+        result["altitude"] = np.full(len(times), np.nan if self.altitude is None else self.altitude)
+        return result
+
+    def densities(self, timestamps: ArrayLike, window: float = 300.0) -> np.ndarray:
+        """
+        Air density in kg/m³ at each timestamp, computed once per condition window.
+
+        Timestamps are grouped into windows of the given length aligned to the
+        first sample. Each window's density comes from the interpolated
+        temperature, pressure and humidity at its midpoint and is cached, so
+        every shot in a window, across calls, reuses one value. Unset
+        temperature and pressure fall back to the reference temperature and the
+        standard atmosphere at the course altitude.
+
+        Args:
+            timestamps: Shot times
+            window: Window length in seconds
+
+        Returns:
+            np.ndarray: One density per timestamp, e.g. for BatchTrajectorySimulator.simulate_club
+        """
+        times = _times(timestamps)
+        if not self._size:
+            raise ValueError("The timeline has no samples")
+        origin = self._times[0]
+        numbers, inverse = np.unique(np.floor((times - origin) / window).astype(np.int64),
+                                     return_inverse=True)
+        cache = self._densities.setdefault(window, {})
+        missing = [n for n in numbers.tolist() if n not in cache]
+        if missing:
+            conditions = self.columns(origin + (np.array(missing) + 0.5) * window)
+            temperature = np.where(np.isnan(conditions["temperature"]), REFERENCE_TEMPERATURE,
+                                   conditions["temperature"])
+            altitude = REFERENCE_ALTITUDE if self.altitude is None else self.altitude
+            values = air_density(temperature, conditions["pressure"], conditions["humidity"], altitude)
+            cache.update(zip(missing, np.atleast_1d(values).tolist()))
+        return np.array([cache[n] for n in numbers.tolist()])[inverse.reshape(-1)]
+
+    def sample_at(self, timestamp: Timestamp) -> WeatherSample:
+        """Interpolated weather at one timestamp, located by bisection."""
+        if not self._size:
+            raise ValueError("The timeline has no samples")
+        time = to_timestamp(timestamp)
+        stamps = self.timestamps
+        upper = min(max(bisect.bisect_right(stamps, time), 1), self._size - 1)
+        lower = max(upper - 1, 0)
+        span = stamps[upper] - stamps[lower]
+        weight = min(max((time - stamps[lower]) / span, 0.0), 1.0) if span > 0 else 0.0
+        values = {}
+        for name in FIELDS:
+            start, end = float(self._columns[name][lower]), float(self._columns[name][upper])
+            if name == "wind_direction":
+                value = _interpolate_direction(start, end, weight)
+            else:
+                value = start + (end - start) * weight
+            values[name] = None if math.isnan(value) else float(value)
+        return WeatherSample(timestamp=time, **values)
+
+    def at(self, timestamp: Timestamp) -> Conditions:
+        """Model conditions at one timestamp."""
+        sample = self.sample_at(timestamp)
+        return Conditions(sample.temperature, self.altitude, sample.wind_speed, sample.wind_direction)
+
+    def windows(self, start: Timestamp, stop: Timestamp,
+                interval: float = 300.0) -> List[Tuple[float, Conditions]]:
+        """
+        Step-wise (timestamp, conditions) windows of the given length, each holding the
+        interpolated conditions at its midpoint; the weather timeline of round_planner.plan_round.
+        """
+        start, stop = to_timestamp(start), to_timestamp(stop)
+        edges = np.arange(start, stop, interval) if stop > start else np.array([start])
+        midpoints = edges + interval / 2
+        return [(float(edge), self.at(float(mid))) for edge, mid in zip(edges, midpoints)]
+
+    def replay(self, timestamps: ArrayLike, target_yardage: ArrayLike, club: ArrayLike,
+               ball_model: Optional[ArrayLike] = None,
+               model: Optional[YardageModelEnhanced] = None) -> BatchShotResult:
+        """
+        Adjusted yardage for a sequence of shots, each in the conditions at its timestamp,
+        with one interpolation pass and one batch model call.
+
+        Args:
+            timestamps: Shot times
+            target_yardage, club, ball_model: Per-shot columns or scalars, as in the batch API
+            model: Yardage model (default: YardageModelEnhanced)
+
+        Returns:
+            BatchShotResult: One row per shot
+        """
+        model = model or YardageModelEnhanced()
+        conditions = self.columns(timestamps)
+        return model.calculate_adjusted_yardage_batch(
+            target_yardage, club, conditions["temperature"], conditions["altitude"],
+            conditions["wind_speed"], conditions["wind_direction"],
+            ball_model if ball_model is not None else model.ball_model)
+
+
+def _sorted(samples: List[WeatherSample]) -> List[WeatherSample]:
+    return sorted(samples, key=lambda s: s.timestamp)
+
+
+def load_csv(path: str, altitude: Optional[float] = None) -> ConditionsTimeline:
+    """
+    Timeline from a CSV file with a header row: timestamp plus any of temperature,
+    wind_speed, wind_direction, pressure and humidity (or their FIELD_ALIASES).
+    Rows may be in any order; empty fields are unset.
+    """
+    with open(path, newline="") as f:
+        samples = [sample_from_mapping(row) for row in csv.DictReader(f)]
+    timeline = ConditionsTimeline(altitude, capacity=max(len(samples), 16))
+    timeline.extend(_sorted(samples))
+    return timeline
+
+
+def _records(data: Any) -> List[Mapping[str, Any]]:
+    """
+    Sample records from a JSON document: a list, an object with a "samples" list,
+    or a single reading, optionally wrapped in "data" as weather services return it.
+    """
+    if isinstance(data, Mapping) and "data" in data:
+        data = data["data"]
+    if isinstance(data, Mapping):
+        data = data.get("samples", [data])
+    if not isinstance(data, list):
+        raise ValueError("Weather JSON must be a list of samples or an object with a samples list")
+    # Weather service records often nest the readings under "values"
+    return [{**record.get("values", {}), **{k: v for k, v in record.items() if k != "values"}}
+            for record in data]
+
+
+def load_json(path: str, altitude: Optional[float] = None) -> ConditionsTimeline:
+    """Timeline from a JSON file of samples (see _records for accepted layouts)."""
+    with open(path) as f:
+        samples = [sample_from_mapping(r) for r in _records(json.load(f))]
+    timeline = ConditionsTimeline(altitude, capacity=max(len(samples), 16))
+    timeline.extend(_sorted(samples))
+    return timeline
+
+
+def fetch_json(url: str, timeline: Optional[ConditionsTimeline] = None,
+               timeout: float = 10.0) -> ConditionsTimeline:
+    """
+    Poll a weather endpoint (e.g. a local stand-in service) returning the JSON layouts of
+    load_json and append readings newer than the timeline's last sample.
+    """
+    if timeline is None:
+        timeline = ConditionsTimeline()
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        samples = _sorted([sample_from_mapping(r) for r in _records(json.load(response))])
+    last = timeline.timestamps[-1] if len(timeline) else -math.inf
+    timeline.extend(s for s in samples if s.timestamp > last)
+    return timeline
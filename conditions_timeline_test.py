@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pytest
+
+from conditions_timeline import ConditionsTimeline, WeatherSample, fetch_json
+
+
+def _timeline():
+    timeline = ConditionsTimeline(altitude=5280)
+    timeline.extend([
+        WeatherSample(0.0, temperature=60, wind_speed=10, wind_direction=350),
+        WeatherSample(600.0, temperature=70, wind_speed=20, wind_direction=10),
+    ])
+    return timeline
+
+
+@pytest.mark.parametrize("time, direction", [(0, 350), (150, 355), (300, 0), (450, 5), (600, 10)])
+def test_wind_direction_takes_the_shorter_arc(time, direction):
+    timeline = _timeline()
+    assert timeline.sample_at(time).wind_direction == pytest.approx(direction, abs=1e-9)
+    assert timeline.columns([time])["wind_direction"][0] == pytest.approx(direction, abs=1e-9)
+
+
+def test_columns_match_sample_at():
+    timeline = _timeline()
+    times = np.array([-60.0, 0.0, 123.0, 300.0, 599.0, 900.0])
+    columns = timeline.columns(times)
+    for i, time in enumerate(times):
+        sample = timeline.sample_at(time)
+        assert columns["temperature"][i] == pytest.approx(sample.temperature)
+        assert columns["wind_speed"][i] == pytest.approx(sample.wind_speed)
+        assert columns["wind_direction"][i] == pytest.approx(sample.wind_direction)
+        assert np.isnan(columns["pressure"][i]) and sample.pressure is None
+    assert timeline.at(300).temperature == pytest.approx(65)
+    assert timeline.at(300).altitude == 5280
+
+
+def test_fetch_json_fills_an_empty_timeline(tmp_path):
+    path = tmp_path / "weather.json"
+    path.write_text(json.dumps({"data": [
+        {"startTime": 600, "values": {"temperature": 70, "windSpeed": 20, "windDirection": 10}},
+        {"startTime": 0, "values": {"temperature": 60, "windSpeed": 10, "windDirection": 350}},
+    ]}))
+    timeline = ConditionsTimeline(altitude=5280)
+
+    assert fetch_json(path.as_uri(), timeline) is timeline
+    assert timeline.timestamps.tolist() == [0.0, 600.0]
+    assert timeline.at(300).wind_direction == pytest.approx(0, abs=1e-9)
+
+    # Polling again appends nothing older than the last sample
+    fetch_json(path.as_uri(), timeline)
+    assert len(timeline) == 2
+    assert len(fetch_json(path.as_uri())) == 2
@@ -0,0 +1,228 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, ShotRequest, SkillLevel
+from trajectory_batch import BatchTrajectorySimulator, LaunchPerturbations
+from trajectory_engine import REFERENCE_TEMPERATURE, REFERENCE_ALTITUDE
+
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+# Order of the launch parameters in spread vectors and sensitivity matrices
+LAUNCH_PARAMETERS = ("ball_speed", "launch_angle", "spin_rate", "launch_direction", "spin_axis")
+
+
+@dataclass(frozen=True)
+class SkillSpread:
+    """One standard deviation of shot-to-shot launch variability."""
+    ball_speed: float    # % of the club's stock ball speed
+    launch_angle: float  # degrees
+    spin_rate: float     # % of the club's stock spin rate
+    face_angle: float    # degrees of start direction (+ is right)
+    spin_axis: float     # degrees of axis tilt (+ curves right)
+
+
+@dataclass
+class DispersionEllipse:
+    confidence: float      # Fraction of shots expected inside the ellipse
+    center_carry: float    # Yards
+    center_lateral: float  # Yards (+ is right, - is left)
+    semi_major: float      # Yards
+    semi_minor: float      # Yards
+    angle: float           # Major axis direction in degrees from the target line (+ toward right)
+
+
+@dataclass
+class DispersionResult:
+    request: ShotRequest
+    carry_distance: np.ndarray    # Sampled carries in yards
+    lateral_movement: np.ndarray  # Sampled lateral offsets in yards (+ is right, - is left)
+
+    def __len__(self) -> int:
+        return len(self.carry_distance)
+
+    def percentiles(self, q: Sequence[float] = (10, 50, 90)) -> Dict[str, Dict[float, float]]:
+        """Carry and lateral percentiles, e.g. {"carry": {10: 141.2, 50: 150.1, 90: 158.4}, ...}"""
+        carry = np.percentile(self.carry_distance, q)
+        lateral = np.percentile(self.lateral_movement, q)
+        return {
+            "carry": {p: round(float(v), 1) for p, v in zip(q, carry)},
+            "lateral": {p: round(float(v), 1) for p, v in zip(q, lateral)},
+        }
+
+    def ellipse(self, confidence: float = 0.95) -> DispersionEllipse:
+        """
+        Landing ellipse containing the given fraction of shots, from the sample covariance.
+
+        Args:
+            confidence: Fraction of shots inside the ellipse (0-1)
+
+        Returns:
+            DispersionEllipse: Center, semi-axes and orientation
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        covariance = np.cov(self.carry_distance, self.lateral_movement)
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        # Chi-square quantile with two degrees of freedom
+        scale = math.sqrt(-2 * math.log(1 - confidence))
+        minor, major = np.sqrt(np.maximum(eigenvalues, 0)) * scale
+        major_axis = eigenvectors[:, 1]
+        angle = math.degrees(math.atan2(major_axis[1], major_axis[0]))
+        # Report the axis direction in (-90°, 90°]
+        if angle > 90:
+            angle -= 180
+        elif angle <= -90:
+            angle += 180
+        return DispersionEllipse(
+            confidence=confidence,
+            center_carry=round(float(np.mean(self.carry_distance)), 1),
+            center_lateral=round(float(np.mean(self.lateral_movement)), 1),
+            semi_major=round(float(major), 1),
+            semi_minor=round(float(minor), 1),
+            angle=round(angle, 1),
+        )
+
+    def ellipses(self, confidences: Sequence[float] = (0.5, 0.8, 0.95)) -> List[DispersionEllipse]:
+        return [self.ellipse(c) for c in confidences]
+
+
+class DispersionModel:
+    """
+    Monte Carlo shot dispersion around a yardage model's point answer.
+
+    Launch conditions are sampled per SkillLevel and flown through the batch
+    trajectory simulator. The simulated offsets from the stock flight are scaled
+    to the request's target yardage (the same per-yard convention as
+    TrajectoryYardageModel) and added to the model's adjusted carry and lateral.
+
+    Two modes:
+        linearized - sensitivities of carry and lateral to each launch parameter
+                     come from one small simulator batch (central differences at
+                     ±1 standard deviation); samples are then a matrix product,
+                     so 10k samples cost about a millisecond
+        simulate   - every sample is flown, capturing the full non-linear response
+    """
+
+    # Launch variability by skill level, from tour and amateur launch monitor spreads
+    SKILL_SPREADS = {
+        SkillLevel.PROFESSIONAL: SkillSpread(ball_speed=1.0, launch_angle=0.8, spin_rate=5.0,
+                                             face_angle=1.0, spin_axis=2.5),
+        SkillLevel.ADVANCED: SkillSpread(ball_speed=2.0, launch_angle=1.3, spin_rate=8.0,
+                                         face_angle=2.0, spin_axis=4.5),
+        SkillLevel.INTERMEDIATE: SkillSpread(ball_speed=3.5, launch_angle=2.0, spin_rate=12.0,
+                                             face_angle=3.0, spin_axis=7.0),
+        SkillLevel.BEGINNER: SkillSpread(ball_speed=6.0, launch_angle=3.0, spin_rate=18.0,
+                                         face_angle=4.5, spin_axis=10.0),
+    }
+
+    def __init__(self, model: Optional[YardageModelEnhanced] = None,
+                 simulator: Optional[BatchTrajectorySimulator] = None):
+        self.model = model or YardageModelEnhanced()
+        # float64 state keeps central differences clean at small perturbations
+        self.simulator = simulator or BatchTrajectorySimulator(dtype=np.float64)
+        self._sensitivities: Dict[tuple, np.ndarray] = {}
+
+    def _sigma(self, request: ShotRequest) -> np.ndarray:
+        """Standard deviation of each launch parameter in simulator units."""
+        spread = self.SKILL_SPREADS[request.skill_level]
+        club = request.club_data or self.model.club_data(request.club)
+        return np.array([
+            club.ball_speed * spread.ball_speed / 100,  # mph
+            spread.launch_angle,                        # degrees
+            club.spin_rate * spread.spin_rate / 100,    # rpm
+            spread.face_angle,                          # degrees
+            spread.spin_axis,                           # degrees
+        ])
+
+    def _fly(self, request: ShotRequest, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fly the stock shot in reference conditions, then one ball per offset row in
+        the request's conditions.
+
+        Returns:
+            (carry offsets from the stock flight per yard of target, lateral per yard of target)
+        """
+        club = request.club_data or self.model.club_data(request.club)
+        ball = self.model.BALL_MODELS[request.ball_model]
+        conditions = request.conditions
+        n = len(offsets)
+        # Row 0: reference conditions, row 1: stock launch in the request's conditions
+        offsets = np.vstack([np.zeros((2, len(LAUNCH_PARAMETERS))), offsets])
+        # Unset (None or 0) temperature and altitude and wind without a direction are
+        # ignored, as in the yardage model
+        temperature = np.full(n + 2, conditions.temperature or REFERENCE_TEMPERATURE)
+        altitude = np.full(n + 2, conditions.altitude or REFERENCE_ALTITUDE)
+        wind_speed = np.full(n + 2, 0.0 if conditions.wind_direction is None
+                             else conditions.wind_speed or 0.0)
+        temperature[0], altitude[0], wind_speed[0] = REFERENCE_TEMPERATURE, REFERENCE_ALTITUDE, 0.0
+
+        flight = self.simulator.simulate_club(
+            club, ball,
+            LaunchPerturbations(*(offsets[:, i] for i in range(len(LAUNCH_PARAMETERS)))),
+            temperature=temperature, altitude=altitude, wind_speed=wind_speed,
+            wind_direction=conditions.wind_direction or 0.0)
+        per_yard = 1 / flight.carry_distance[0]
+        return ((flight.carry_distance[2:] - flight.carry_distance[1]) * per_yard,
+                (flight.lateral_movement[2:] - flight.lateral_movement[1]) * per_yard)
+
+    def sensitivities(self, request: ShotRequest) -> np.ndarray:
+        """
+        Carry and lateral change per yard of target for a one-sigma change in each
+        launch parameter, as a (5, 2) matrix ordered like LAUNCH_PARAMETERS.
+        """
+        key = (request.club.lower(), request.club_data, request.ball_model, request.skill_level,
+               request.conditions)
+        if key not in self._sensitivities:
+            steps = np.diag(self._sigma(request))
+            carry, lateral = self._fly(request, np.vstack([steps, -steps]))
+            k = len(LAUNCH_PARAMETERS)
+            self._sensitivities[key] = np.stack(
+                [(carry[:k] - carry[k:]) / 2, (lateral[:k] - lateral[k:]) / 2], axis=-1)
+        return self._sensitivities[key]
+
+    def sample(self, request: ShotRequest, n: int = 10_000, seed: Seed = None,
+               mode: str = "linearized") -> DispersionResult:
+        """
+        Sample n shots around the model's adjusted yardage for the request.
+
+        Args:
+            request: Shot to disperse; skill_level selects the launch spreads
+            n: Number of samples
+            seed: Integer seed, SeedSequence or Generator for a reproducible stream
+            mode: "linearized" (fast) or "simulate" (fly every sample)
+
+        Returns:
+            DispersionResult: Sampled carry and lateral per shot
+        """
+        if request.skill_level not in self.SKILL_SPREADS:
+            raise ValueError(f"No launch spreads for skill level: {request.skill_level}")
+        rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        center = self.model.calculate(request)
+        z = rng.standard_normal((n, len(LAUNCH_PARAMETERS)))
+
+        if mode == "linearized":
+            offsets = z @ self.sensitivities(request)
+            carry, lateral = offsets[:, 0], offsets[:, 1]
+        elif mode == "simulate":
+            carry, lateral = self._fly(request, z * self._sigma(request))
+        else:
+            raise ValueError(f"Unknown dispersion mode: {mode}")
+
+        return DispersionResult(
+            request=request,
+            carry_distance=center.carry_distance + request.target_yardage * carry,
+            lateral_movement=center.lateral_movement + request.target_yardage * lateral,
+        )
+
+    def sample_many(self, requests: Sequence[ShotRequest], n: int = 10_000, seed: Seed = None,
+                    mode: str = "linearized") -> List[DispersionResult]:
+        """Sample several shots from independent RNG streams spawned from one seed."""
+        if isinstance(seed, np.random.Generator):
+            streams = seed.spawn(len(requests))
+        else:
+            sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+            streams = [np.random.default_rng(s) for s in sequence.spawn(len(requests))]
+        return [self.sample(request, n, stream, mode) for request, stream in zip(requests, streams)]
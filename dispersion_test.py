@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+from dispersion import DispersionModel, DispersionResult, LAUNCH_PARAMETERS
+from yardage_model_enhanced import Conditions, ShotRequest, SkillLevel
+
+REQUEST = ShotRequest(150, "7-iron", Conditions(80, 2000, 10, 45))
+
+
+@pytest.fixture(scope="module")
+def dispersion():
+    return DispersionModel()
+
+
+def test_samples_center_on_the_model_and_are_reproducible(dispersion):
+    result = dispersion.sample(REQUEST, n=20_000, seed=1)
+    center = dispersion.model.calculate(REQUEST)
+    assert len(result) == 20_000
+    assert np.mean(result.carry_distance) == pytest.approx(center.carry_distance, abs=0.2)
+    assert np.mean(result.lateral_movement) == pytest.approx(center.lateral_movement, abs=0.2)
+    repeat = dispersion.sample(REQUEST, n=20_000, seed=1)
+    np.testing.assert_array_equal(result.carry_distance, repeat.carry_distance)
+
+    first, second = dispersion.sample_many([REQUEST, REQUEST], n=100, seed=1)
+    assert not np.array_equal(first.carry_distance, second.carry_distance)
+    again = dispersion.sample_many([REQUEST, REQUEST], n=100, seed=np.random.SeedSequence(1))
+    np.testing.assert_array_equal(again[1].carry_distance, second.carry_distance)
+
+
+def test_spread_grows_as_skill_drops(dispersion):
+    widths = []
+    for skill in (SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE, SkillLevel.BEGINNER):
+        request = ShotRequest(150, "7-iron", skill_level=skill)
+        ellipse = dispersion.sample(request, n=5000, seed=0).ellipse(0.95)
+        widths.append((ellipse.semi_major, ellipse.semi_minor))
+    assert widths == sorted(widths)
+    assert dispersion.sensitivities(REQUEST).shape == (len(LAUNCH_PARAMETERS), 2)
+
+
+def test_linearized_matches_simulated_flights(dispersion):
+    linear = dispersion.sample(REQUEST, n=4000, seed=2)
+    flown = dispersion.sample(REQUEST, n=4000, seed=2, mode="simulate")
+    for name in ("carry_distance", "lateral_movement"):
+        a, b = getattr(linear, name), getattr(flown, name)
+        assert np.mean(a) == pytest.approx(np.mean(b), abs=0.5)
+        assert np.std(a) == pytest.approx(np.std(b), rel=0.1)
+
+
+@pytest.mark.parametrize("conditions, unset", [
+    (Conditions(80, 2000, 10, None), Conditions(80, 2000)),
+    (Conditions(0, 0, 10, 45), Conditions(None, None, 10, 45)),
+])
+def test_unset_conditions_are_ignored_as_in_the_model(dispersion, conditions, unset):
+    for mode in ("linearized", "simulate"):
+        result = dispersion.sample(ShotRequest(150, "7-iron", conditions), n=200, seed=3, mode=mode)
+        expected = dispersion.sample(ShotRequest(150, "7-iron", unset), n=200, seed=3, mode=mode)
+        np.testing.assert_array_equal(result.carry_distance, expected.carry_distance)
+        np.testing.assert_array_equal(result.lateral_movement, expected.lateral_movement)
+
+
+def test_ellipse_from_known_covariance():
+    rng = np.random.default_rng(4)
+    # Carry sd 6 yd, lateral sd 2 yd, rotated 30° toward the right
+    angle = math.radians(30)
+    points = rng.standard_normal((200_000, 2)) * [6.0, 2.0]
+    rotation = np.array([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+    carry, lateral = (points @ rotation.T).T
+    result = DispersionResult(REQUEST, carry + 150, lateral)
+    ellipse = result.ellipse(0.95)
+    scale = math.sqrt(-2 * math.log(0.05))
+    assert ellipse.semi_major == pytest.approx(6.0 * scale, abs=0.1)
+    assert ellipse.semi_minor == pytest.approx(2.0 * scale, abs=0.1)
+    assert ellipse.angle == pytest.approx(30.0, abs=0.5)
+    assert (ellipse.center_carry, ellipse.center_lateral) == (150.0, 0.0)
+
+    # About 95% of the shots land inside it
+    u = (points / [ellipse.semi_major, ellipse.semi_minor]) ** 2
+    assert np.mean(u.sum(axis=1) <= 1) == pytest.approx(0.95, abs=0.005)
+    assert [e.confidence for e in result.ellipses()] == [0.5, 0.8, 0.95]
+    assert result.percentiles((50,))["carry"][50] == pytest.approx(150.0, abs=0.1)
+
+
+def test_invalid_arguments(dispersion):
+    with pytest.raises(ValueError):
+        dispersion.sample(REQUEST, n=10, mode="exact")
+    with pytest.raises(ValueError):
+        DispersionResult(REQUEST, np.zeros(3), np.zeros(3)).ellipse(1.0)
@@ -1,91 +1,109 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
 from typing import Dict, Any, List, Tuple
 
+# Common weather scenarios on golf courses
+CONDITIONS = [
+    {
+        "name": "Perfect Morning",
+        "temp": 65,
+        "altitude": 0,
+        "wind_speed": 0,
+        "wind_dir": 0
+    },
+    {
+        "name": "Hot Afternoon",
+        "temp": 95,
+        "altitude": 0,
+        "wind_speed": 8,
+        "wind_dir": 90  # Crosswind
+    },
+    {
+        "name": "Cool Morning with Headwind",
+        "temp": 55,
+        "altitude": 0,
+        "wind_speed": 12,
+        "wind_dir": 180  # Headwind
+    },
+    {
+        "name": "Mountain Course",
+        "temp": 75,
+        "altitude": 5000,
+        "wind_speed": 5,
+        "wind_dir": 45  # Quartering wind
+    },
+    {
+        "name": "Coastal Breeze",
+        "temp": 72,
+        "altitude": 0,
+        "wind_speed": 15,
+        "wind_dir": 135  # Quartering headwind
+    },
+    {
+        "name": "Desert Heat",
+        "temp": 100,
+        "altitude": 2000,
+        "wind_speed": 10,
+        "wind_dir": 270  # Left to right
+    },
+    {
+        "name": "Scottish Links",
+        "temp": 60,
+        "altitude": 0,
+        "wind_speed": 20,
+        "wind_dir": 225  # Quartering into
+    },
+    {
+        "name": "Humid Southeast",
+        "temp": 85,
+        "altitude": 0,
+        "wind_speed": 7,
+        "wind_dir": 315  # Quartering helping
+    },
+    {
+        "name": "High Altitude Morning",
+        "temp": 50,
+        "altitude": 7000,
+        "wind_speed": 5,
+        "wind_dir": 0  # Helping wind
+    },
+    {
+        "name": "Stormy Conditions",
+        "temp": 68,
+        "altitude": 0,
+        "wind_speed": 18,
+        "wind_dir": 90  # Strong crosswind
+    }
+]
+
+BALL_MODEL = "tour_premium"  # Using tour ball for consistency
+CLUB = "driver"
+TARGET_YARDAGE = 300  # Base driver distance
+SKILL_LEVELS = [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_driver_conditions."""
+    return [
+        (f"{skill.value}/{condition['name']}",
+         ShotRequest(TARGET_YARDAGE, CLUB,
+                     Conditions(condition["temp"], condition["altitude"],
+                                condition["wind_speed"], condition["wind_dir"]),
+                     BALL_MODEL, skill))
+        for skill in SKILL_LEVELS for condition in CONDITIONS
+    ]
+
+
 def test_driver_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test driver performance in various realistic golf conditions."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")  # Using tour ball for consistency
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Common weather scenarios on golf courses
-    conditions = [
-        {
-            "name": "Perfect Morning",
-            "temp": 65,
-            "altitude": 0,
-            "wind_speed": 0,
-            "wind_dir": 0
-        },
-        {
-            "name": "Hot Afternoon",
-            "temp": 95,
-            "altitude": 0,
-            "wind_speed": 8,
-            "wind_dir": 90  # Crosswind
-        },
-        {
-            "name": "Cool Morning with Headwind",
-            "temp": 55,
-            "altitude": 0,
-            "wind_speed": 12,
-            "wind_dir": 180  # Headwind
-        },
-        {
-            "name": "Mountain Course",
-            "temp": 75,
-            "altitude": 5000,
-            "wind_speed": 5,
-            "wind_dir": 45  # Quartering wind
-        },
-        {
-            "name": "Coastal Breeze",
-            "temp": 72,
-            "altitude": 0,
-            "wind_speed": 15,
-            "wind_dir": 135  # Quartering headwind
-        },
-        {
-            "name": "Desert Heat",
-            "temp": 100,
-            "altitude": 2000,
-            "wind_speed": 10,
-            "wind_dir": 270  # Left to right
-        },
-        {
-            "name": "Scottish Links",
-            "temp": 60,
-            "altitude": 0,
-            "wind_speed": 20,
-            "wind_dir": 225  # Quartering into
-        },
-        {
-            "name": "Humid Southeast",
-            "temp": 85,
-            "altitude": 0,
-            "wind_speed": 7,
-            "wind_dir": 315  # Quartering helping
-        },
-        {
-            "name": "High Altitude Morning",
-            "temp": 50,
-            "altitude": 7000,
-            "wind_speed": 5,
-            "wind_dir": 0  # Helping wind
-        },
-        {
-            "name": "Stormy Conditions",
-            "temp": 68,
-            "altitude": 0,
-            "wind_speed": 18,
-            "wind_dir": 90  # Strong crosswind
-        }
-    ]
-    
-    for skill in [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]:
+    for skill in SKILL_LEVELS:
         skill_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
                 temperature=condition["temp"],
                 altitude=condition["altitude"],
@@ -94,9 +112,9 @@ def test_driver_conditions() -> Dict[str, List[Dict[str, Any]]]:
             )
             
             result = model.calculate_adjusted_yardage(
-                target_yardage=300,  # Base driver distance
+                target_yardage=TARGET_YARDAGE,
                 skill_level=skill,
-                club="driver"
+                club=CLUB
             )
             
             skill_results.append({
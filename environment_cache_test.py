@@ -0,0 +1,66 @@
+import dataclasses
+
+import pytest
+
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest
+
+CONDITIONS = [Conditions(), Conditions(85, 5280, 12, 200), Conditions(0, 0, 10, None),
+              Conditions(62.4, 1200, 7.5, 93)]
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+def test_exact_cache_gives_uncached_answers(conditions):
+    cached, plain = YardageModelEnhanced(), YardageModelEnhanced()
+    cached.enable_environment_cache()
+    for club in ("driver", "7-iron", "pitching-wedge"):
+        request = ShotRequest(150, club, conditions)
+        assert cached.calculate(request) == plain.calculate(request)
+        assert cached.calculate(request) == plain.calculate(request)
+    assert cached.recommend(150, conditions) == plain.recommend(150, conditions)
+
+
+def test_quantized_keys_share_snapshots():
+    model = YardageModelEnhanced()
+    model.enable_environment_cache(resolution={"temperature": 2.0, "wind_direction": 10.0})
+    first = model.environment_for(Conditions(71.2, 5280, 10, 93))
+    assert (first.temperature, first.wind_direction) == (72.0, 90.0)
+    assert first.altitude == 5280 and first.wind_speed == 10  # Conditions without a step are exact
+    assert model.environment_for(Conditions(72.9, 5280, 10, 87)) is first
+    assert model.environment_for(Conditions(73.1, 5280, 10, 87)) is not first
+
+    # Unset conditions stay unset rather than being rounded
+    unset = model.environment_for(Conditions(None, None, 10, None))
+    assert unset.temperature is None and not unset.has_temperature and not unset.has_wind
+
+    quantized = model.calculate(ShotRequest(150, "7-iron", Conditions(71.2, 5280, 10, 93)))
+    assert quantized == YardageModelEnhanced().calculate(ShotRequest(150, "7-iron", Conditions(72, 5280, 10, 90)))
+
+
+def test_cache_stats_count_repeats_lookups_and_evictions():
+    model = YardageModelEnhanced()
+    assert model.environment_cache_stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 0, "last_hits": 0}
+    model.enable_environment_cache(maxsize=2)
+    a, b, c = Conditions(60), Conditions(70), Conditions(80)
+    for conditions in (a, a, a, b, a, c, b):
+        model.environment_for(conditions)
+    # a, a (last), a (last), b (miss), a (hit), c (miss, evicts b), b (miss)
+    assert model.environment_cache_stats() == {"hits": 3, "misses": 4, "size": 2, "maxsize": 2, "last_hits": 2}
+
+
+def test_cache_is_cleared_with_the_tables_it_was_built_from():
+    model = YardageModelEnhanced()
+    model.enable_environment_cache()
+    conditions = Conditions(85, 5280, 12, 200)
+    before = model.calculate(ShotRequest(150, "7-iron", conditions))
+    model.set_extrapolation("clamp")
+    assert model.environment_cache_stats()["size"] == 0
+
+    # Snapshots hold each club's wind gradient, which depends on its apex height
+    taller = {name: dict(dataclasses.asdict(club), max_height=club.max_height * 2)
+              for name, club in model.CLUB_DATABASE.items()}
+    model.apply_parameters({"CLUB_DATABASE": taller})
+    fresh = YardageModelEnhanced()
+    fresh.apply_parameters({"CLUB_DATABASE": taller})
+    after = model.calculate(ShotRequest(150, "7-iron", conditions))
+    assert after != before
+    assert after == fresh.calculate(ShotRequest(150, "7-iron", conditions))
@@ -0,0 +1,324 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
+from table_store import model_fingerprint
+
+try:
+    from hypothesis import strategies as st
+except ImportError:  # Property-based sweeps fall back to seeded random requests
+    st = None
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_outputs.json")
+
+# Scenario scripts whose tables become golden outputs; each exposes scenario_requests()
+SCENARIO_SCRIPTS = ("driver_test", "seven_iron_test", "wedge_test",
+                    "wind_test", "temperature_test", "altitude_test")
+
+# Randomized sweep domain: wider than the lookup tables so extrapolation is covered,
+# inside the default grid axes so every engine answers the same question
+SWEEP_RANGES = {
+    "target_yardage": (50.0, 320.0),
+    "temperature": (20.0, 115.0),
+    "altitude": (-500.0, 9500.0),
+    "wind_speed": (0.0, 35.0),
+    "wind_direction": (0.0, 360.0),
+}
+SWEEP_UNSET_RATE = 0.1  # Fraction of sweep conditions left as None
+
+# (carry, lateral) arrays for a list of requests
+Evaluator = Callable[[Sequence[ShotRequest]], Tuple[np.ndarray, np.ndarray]]
+
+
+@dataclass
+class GoldenCase:
+    label: str  # "<script>/<row label>"
+    request: ShotRequest
+    carry_distance: float
+    lateral_movement: float
+
+
+@dataclass
+class Mismatch:
+    label: str
+    request: ShotRequest
+    expected: Tuple[float, float]  # (carry, lateral)
+    actual: Tuple[float, float]
+
+
+@dataclass
+class Engine:
+    """
+    A yardage backend that must reproduce the reference model.
+
+    build is called once, on first use, and returns the evaluator; expensive
+    setup such as precomputing a grid happens there. Tolerances are absolute,
+    in yards, and cover rounding and interpolation differences of the engine.
+    """
+    name: str
+    build: Callable[[], Evaluator]
+    carry_tolerance: float = 0.0
+    lateral_tolerance: float = 0.0
+    _evaluate: Optional[Evaluator] = field(default=None, init=False, repr=False)
+
+    def evaluate(self, requests: Sequence[ShotRequest]) -> Tuple[np.ndarray, np.ndarray]:
+        if self._evaluate is None:
+            self._evaluate = self.build()
+        return self._evaluate(requests)
+
+
+ENGINES: Dict[str, Engine] = {}
+
+
+def register_engine(name: str, build: Callable[[], Evaluator],
+                    carry_tolerance: float = 0.0, lateral_tolerance: Optional[float] = None) -> Engine:
+    """
+    Register a backend to be checked against the golden outputs and the random sweep.
+
+    Args:
+        name: Engine name used in reports and test ids
+        build: Returns an evaluator mapping a list of ShotRequests to (carry, lateral) arrays
+        carry_tolerance: Allowed absolute carry difference in yards
+        lateral_tolerance: Allowed absolute lateral difference in yards (defaults to carry_tolerance)
+
+    Returns:
+        Engine: The registered engine
+    """
+    engine = Engine(name, build, carry_tolerance,
+                    carry_tolerance if lateral_tolerance is None else lateral_tolerance)
+    ENGINES[name] = engine
+    return engine
+
+
+def _scalar_evaluator(model: YardageModelEnhanced) -> Evaluator:
+    """Legacy stateful path: set_conditions/set_ball_model, then calculate_adjusted_yardage."""
+    def evaluate(requests):
+        results = []
+        for request in requests:
+            c = request.conditions
+            model.set_conditions(c.temperature, c.altitude, c.wind_speed, c.wind_direction)
+            model.set_ball_model(request.ball_model)
+            result = model.calculate_adjusted_yardage(request.target_yardage, request.skill_level,
+                                                      request.club)
+            results.append((result.carry_distance, result.lateral_movement))
+        return _columns(results)
+    return evaluate
+
+
+def _stateless_evaluator(model: YardageModelEnhanced) -> Evaluator:
+    def evaluate(requests):
+        results = [model.calculate(request) for request in requests]
+        return _columns([(r.carry_distance, r.lateral_movement) for r in results])
+    return evaluate
+
+
+def _batch_evaluator(model: YardageModelEnhanced) -> Evaluator:
+    """One calculate_adjusted_yardage_batch call; unset conditions are passed as NaN."""
+    def evaluate(requests):
+        def column(name):
+            return np.array([np.nan if getattr(r.conditions, name) is None else getattr(r.conditions, name)
+                             for r in requests])
+        result = model.calculate_adjusted_yardage_batch(
+            np.array([r.target_yardage for r in requests]), np.array([r.club for r in requests]),
+            column("temperature"), column("altitude"), column("wind_speed"), column("wind_direction"),
+            np.array([r.ball_model for r in requests]))
+        return result.carry_distance, result.lateral_movement
+    return evaluate
+
+
+def _columns(results: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.array(results, dtype=float).reshape(-1, 2)
+    return values[:, 0], values[:, 1]
+
+
+def _cached_model() -> YardageModelEnhanced:
+    model = YardageModelEnhanced()
+    model.enable_environment_cache()
+    return model
+
+
+def _grid_model() -> YardageModelEnhanced:
+    from yardage_grid import GridYardageModel, build_yardage_grid
+    return GridYardageModel(build_yardage_grid())
+
+
+def _kernel_model() -> YardageModelEnhanced:
+    from yardage_kernel import KernelYardageModel
+    model = KernelYardageModel()
+    model.use_kernel = True  # Checked even where the kernel runs interpreted (no Numba)
+    return model
+
+
+# Reference first: golden outputs are generated from it
+register_engine("reference", lambda: _scalar_evaluator(YardageModelEnhanced()))
+register_engine("stateless", lambda: _stateless_evaluator(YardageModelEnhanced()))
+# Batch rounding can land on the other side of a .05 tie
+register_engine("batch", lambda: _batch_evaluator(YardageModelEnhanced()), carry_tolerance=0.1)
+register_engine("cached", lambda: _scalar_evaluator(_cached_model()))
+# Multilinear interpolation error (~0.35 yd at 320 yd, see interpolation_error) plus rounding
+register_engine("grid", lambda: _stateless_evaluator(_grid_model()), carry_tolerance=0.5)
+register_engine("grid_batch", lambda: _batch_evaluator(_grid_model()), carry_tolerance=0.5)
+# Same rounding ties as batch; compiled sin/cos may differ from NumPy's in the last bit
+register_engine("kernel", lambda: _batch_evaluator(_kernel_model()), carry_tolerance=0.1)
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """Every scenario row of the scenario scripts, labelled "<script>/<row label>"."""
+    requests = []
+    for script in SCENARIO_SCRIPTS:
+        module = importlib.import_module(script)
+        requests.extend((f"{script}/{label}", request) for label, request in module.scenario_requests())
+    return requests
+
+
+def _request_to_dict(request: ShotRequest) -> Dict:
+    return {"target_yardage": request.target_yardage, "club": request.club,
+            "ball_model": request.ball_model, "skill_level": request.skill_level.value,
+            **asdict(request.conditions)}
+
+
+def _request_from_dict(data: Dict) -> ShotRequest:
+    return ShotRequest(data["target_yardage"], data["club"],
+                       Conditions(data["temperature"], data["altitude"],
+                                  data["wind_speed"], data["wind_direction"]),
+                       data["ball_model"], SkillLevel(data["skill_level"]))
+
+
+def generate_goldens(path: str = GOLDEN_PATH) -> List[GoldenCase]:
+    """
+    Evaluate the scenario tables with the reference engine and store them as golden outputs.
+
+    Only regenerate after an intentional model change, and review the diff.
+    """
+    labelled = scenario_requests()
+    carry, lateral = ENGINES["reference"].evaluate([request for _, request in labelled])
+    cases = [GoldenCase(label, request, float(c), float(l))
+             for (label, request), c, l in zip(labelled, carry, lateral)]
+    report = {
+        "source": YardageModelEnhanced.__name__,
+        "fingerprint": model_fingerprint(YardageModelEnhanced()).hex(),
+        "cases": [{"label": case.label, **_request_to_dict(case.request),
+                   "carry_distance": case.carry_distance,
+                   "lateral_movement": case.lateral_movement} for case in cases],
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1, ensure_ascii=False)
+        f.write("\n")
+    return cases
+
+
+def load_goldens(path: str = GOLDEN_PATH) -> List[GoldenCase]:
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return [GoldenCase(case["label"], _request_from_dict(case),
+                       case["carry_distance"], case["lateral_movement"]) for case in report["cases"]]
+
+
+def random_requests(n: int = 2000, seed: int = 0) -> List[ShotRequest]:
+    """Seeded random requests over SWEEP_RANGES, every club and ball, some conditions unset."""
+    model = YardageModelEnhanced
+    rng = np.random.default_rng(seed)
+    values = {name: rng.uniform(low, high, n) for name, (low, high) in SWEEP_RANGES.items()}
+    unset = rng.random((n, 4)) < SWEEP_UNSET_RATE
+    clubs = rng.choice(list(model.CLUB_DATABASE), n)
+    balls = rng.choice(list(model.BALL_MODELS), n)
+    skills = rng.choice(list(SkillLevel), n)
+    names = ("temperature", "altitude", "wind_speed", "wind_direction")
+    return [
+        ShotRequest(float(values["target_yardage"][i]), str(clubs[i]),
+                    Conditions(*(None if unset[i, j] else float(values[name][i])
+                                 for j, name in enumerate(names))),
+                    str(balls[i]), skills[i])
+        for i in range(n)
+    ]
+
+
+def request_strategy():
+    """Hypothesis strategy drawing ShotRequests from the sweep domain (requires hypothesis)."""
+    if st is None:
+        raise ImportError("hypothesis is required for request_strategy")
+
+    def condition(name):
+        low, high = SWEEP_RANGES[name]
+        return st.none() | st.floats(low, high)
+
+    low, high = SWEEP_RANGES["target_yardage"]
+    return st.builds(
+        ShotRequest,
+        st.floats(low, high),
+        st.sampled_from(list(YardageModelEnhanced.CLUB_DATABASE)),
+        st.builds(Conditions, condition("temperature"), condition("altitude"),
+                  condition("wind_speed"), condition("wind_direction")),
+        st.sampled_from(list(YardageModelEnhanced.BALL_MODELS)),
+        st.sampled_from(list(SkillLevel)),
+    )
+
+
+def compare(engine: Engine, labels: Sequence[str], requests: Sequence[ShotRequest],
+            carry: np.ndarray, lateral: np.ndarray) -> List[Mismatch]:
+    """Rows where the engine differs from the expected values by more than its tolerances."""
+    actual_carry, actual_lateral = engine.evaluate(requests)
+    # Small slack so a difference of exactly one tolerance step is not failed by float error
+    bad = ((np.abs(actual_carry - carry) > engine.carry_tolerance + 1e-9) |
+           (np.abs(actual_lateral - lateral) > engine.lateral_tolerance + 1e-9))
+    return [Mismatch(labels[i], requests[i], (float(carry[i]), float(lateral[i])),
+                     (float(actual_carry[i]), float(actual_lateral[i])))
+            for i in np.flatnonzero(bad)]
+
+
+def check_goldens(engine: Engine, cases: Optional[List[GoldenCase]] = None) -> List[Mismatch]:
+    """Compare an engine with the stored golden outputs."""
+    cases = load_goldens() if cases is None else cases
+    return compare(engine, [c.label for c in cases], [c.request for c in cases],
+                   np.array([c.carry_distance for c in cases]),
+                   np.array([c.lateral_movement for c in cases]))
+
+
+def check_requests(engine: Engine, requests: Sequence[ShotRequest]) -> List[Mismatch]:
+    """Compare an engine with the reference engine on arbitrary requests."""
+    carry, lateral = ENGINES["reference"].evaluate(requests)
+    return compare(engine, [f"request[{i}]" for i in range(len(requests))], requests, carry, lateral)
+
+
+def check_sweep(engine: Engine, n: int = 2000, seed: int = 0) -> List[Mismatch]:
+    """Compare an engine with the reference engine on a seeded random sweep."""
+    return check_requests(engine, random_requests(n, seed))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check yardage engines against golden outputs")
+    parser.add_argument("--regenerate", action="store_true",
+                        help="Rewrite the golden outputs from the reference engine")
+    parser.add_argument("--engine", action="append", help="Engine(s) to check (default: all)")
+    parser.add_argument("--samples", type=int, default=2000, help="Random sweep size")
+    parser.add_argument("--seed", type=int, default=0, help="Random sweep seed")
+    args = parser.parse_args(argv)
+
+    if args.regenerate:
+        cases = generate_goldens()
+        print(f"Wrote {len(cases)} golden cases to {GOLDEN_PATH}")
+        return 0
+
+    cases = load_goldens()
+    failed = False
+    for name in args.engine or ENGINES:
+        engine = ENGINES[name]
+        golden = check_goldens(engine, cases)
+        sweep = check_sweep(engine, args.samples, args.seed)
+        failed |= bool(golden or sweep)
+        print(f"{name:<12} golden {len(cases) - len(golden)}/{len(cases)}  "
+              f"sweep {args.samples - len(sweep)}/{args.samples}")
+        for mismatch in (golden + sweep)[:5]:
+            print(f"  {mismatch.label}: expected {mismatch.expected}, got {mismatch.actual}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
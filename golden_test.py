@@ -0,0 +1,39 @@
+import pytest
+
+import golden
+
+try:
+    from hypothesis import given, settings
+except ImportError:
+    given = None
+
+ENGINE_NAMES = sorted(golden.ENGINES)
+
+
+def test_goldens_match_scenario_tables():
+    """Stored goldens cover exactly the rows of the scenario scripts."""
+    stored = [(case.label, case.request) for case in golden.load_goldens()]
+    assert stored == golden.scenario_requests(), \
+        "Scenario tables changed; regenerate with `python golden.py --regenerate`"
+
+
+@pytest.mark.parametrize("name", ENGINE_NAMES)
+def test_engine_matches_goldens(name):
+    mismatches = golden.check_goldens(golden.ENGINES[name])
+    assert not mismatches, mismatches[:5]
+
+
+@pytest.mark.parametrize("name", ENGINE_NAMES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_engine_matches_reference_sweep(name, seed):
+    mismatches = golden.check_sweep(golden.ENGINES[name], n=1000, seed=seed)
+    assert not mismatches, mismatches[:5]
+
+
+if given is not None and golden.st is not None:
+    @pytest.mark.parametrize("name", ENGINE_NAMES)
+    @settings(max_examples=200, deadline=None)
+    @given(request=golden.request_strategy())
+    def test_engine_matches_reference_property(name, request):
+        mismatches = golden.check_requests(golden.ENGINES[name], [request])
+        assert not mismatches, mismatches
@@ -0,0 +1,143 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+_clock = time.perf_counter_ns
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class EngineStats:
+    calls: int = 0
+    rows: int = 0
+    seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+
+
+class StageTimer:
+    """
+    Timestamps for one instrumented call.
+
+    Each mark(stage) charges the time since the previous mark (or the start) to
+    that stage, so the stages of a call partition its total time. Nothing is
+    shared until finish(), so concurrent calls never contend on the timer.
+    """
+
+    __slots__ = ("_instrumentation", "_key", "_stages", "_start", "_last")
+
+    def __init__(self, instrumentation: "Instrumentation", key: Tuple[str, str]):
+        self._instrumentation = instrumentation
+        self._key = key
+        self._stages: List[Tuple[str, int]] = []
+        self._start = self._last = _clock()
+
+    def mark(self, stage: str):
+        now = _clock()
+        self._stages.append((stage, now - self._last))
+        self._last = now
+
+    def finish(self, rows: int = 1):
+        """Record the call; rows is the number of shots it answered."""
+        self._instrumentation._record(self._key, self._stages, self._last - self._start, rows)
+
+
+class Instrumentation:
+    """
+    Opt-in per-stage counters and timers for yardage engines.
+
+    Engines hold an optional Instrumentation and, only when one is attached,
+    open a StageTimer per call with start(engine, path), mark each stage and
+    finish. With nothing attached the hot path pays a single None check per
+    stage. Every engine uses the same engine/path/stage keys, so backends can
+    be compared side by side under the same traffic.
+
+    Export with prometheus() (text exposition format) or snapshot() (JSON-ready dict).
+    """
+
+    def __init__(self, namespace: str = "yardage"):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], EngineStats] = {}
+
+    def start(self, engine: str, path: str = "scalar") -> StageTimer:
+        """Begin timing one call of engine (e.g. the model class) on path ("scalar", "batch", ...)."""
+        return StageTimer(self, (engine, path))
+
+    def _record(self, key: Tuple[str, str], stages: List[Tuple[str, int]], total_ns: int, rows: int):
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EngineStats()
+            stats.calls += 1
+            stats.rows += rows
+            stats.seconds += total_ns / 1e9
+            for stage, elapsed in stages:
+                stage_stats = stats.stages.get(stage)
+                if stage_stats is None:
+                    stage_stats = stats.stages[stage] = StageStats()
+                stage_stats.calls += 1
+                stage_stats.seconds += elapsed / 1e9
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Counters and timers as plain data, keyed engine -> path.
+
+        Returns:
+            Dict: e.g. {"YardageModelEnhanced": {"scalar": {"calls": 10, "rows": 10,
+                  "seconds": 5.1e-05, "mean_us": 5.1, "stages": {"wind": {...}}}}}
+        """
+        with self._lock:
+            items = sorted(self._stats.items())
+            report: Dict[str, Dict[str, Dict]] = {}
+            for (engine, path), stats in items:
+                report.setdefault(engine, {})[path] = {
+                    "calls": stats.calls,
+                    "rows": stats.rows,
+                    "seconds": stats.seconds,
+                    "mean_us": stats.seconds / stats.calls * 1e6 if stats.calls else 0.0,
+                    "stages": {
+                        stage: {"calls": s.calls, "seconds": s.seconds,
+                                "mean_us": s.seconds / s.calls * 1e6 if s.calls else 0.0}
+                        for stage, s in stats.stages.items()
+                    },
+                }
+            return report
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def prometheus(self) -> str:
+        """Counters in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines = []
+        metrics = (
+            (f"{ns}_calls_total", "Instrumented engine calls", "calls", False),
+            (f"{ns}_rows_total", "Shots answered by instrumented calls", "rows", False),
+            (f"{ns}_seconds_total", "Time spent in instrumented calls", "seconds", False),
+            (f"{ns}_stage_calls_total", "Calls reaching each stage", "calls", True),
+            (f"{ns}_stage_seconds_total", "Time spent in each stage", "seconds", True),
+        )
+        with self._lock:
+            items = sorted(self._stats.items())
+            for name, help_text, attribute, per_stage in metrics:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (engine, path), stats in items:
+                    labels = f'engine="{engine}",path="{path}"'
+                    if not per_stage:
+                        lines.append(f"{name}{{{labels}}} {getattr(stats, attribute)}")
+                        continue
+                    for stage, stage_stats in stats.stages.items():
+                        lines.append(f'{name}{{{labels},stage="{stage}"}} {getattr(stage_stats, attribute)}')
+        return "\n".join(lines) + "\n"
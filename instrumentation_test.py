@@ -0,0 +1,98 @@
+import threading
+
+import numpy as np
+import pytest
+
+import instrumentation
+from instrumentation import Instrumentation
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest
+from yardage_kernel import KernelYardageModel
+
+REQUEST = ShotRequest(150, "7-iron", Conditions(85, 5280, 12, 200))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake nanosecond clock advanced by hand."""
+    now = [0]
+    monkeypatch.setattr(instrumentation, "_clock", lambda: now[0])
+    return now
+
+
+def test_stages_partition_the_call(clock):
+    stats = Instrumentation()
+    timer = stats.start("Engine", "batch")
+    clock[0] += 2000
+    timer.mark("environment")
+    clock[0] += 6000
+    timer.mark("wind")
+    timer.finish(rows=4)
+    timer = stats.start("Engine", "batch")
+    clock[0] += 1000
+    timer.mark("environment")
+    timer.finish(rows=2)
+
+    report = stats.snapshot()["Engine"]["batch"]
+    assert (report["calls"], report["rows"]) == (2, 6)
+    assert report["seconds"] == pytest.approx(9e-6)
+    assert report["mean_us"] == pytest.approx(4.5)
+    assert report["stages"]["environment"] == pytest.approx({"calls": 2, "seconds": 3e-6, "mean_us": 1.5})
+    assert report["stages"]["wind"]["calls"] == 1
+
+    text = stats.prometheus()
+    assert '# TYPE yardage_calls_total counter' in text
+    assert 'yardage_rows_total{engine="Engine",path="batch"} 6' in text
+    assert 'yardage_stage_calls_total{engine="Engine",path="batch",stage="wind"} 1' in text
+    assert stats.to_json().startswith("{")
+
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+def test_model_paths_report_their_stages():
+    model, plain = YardageModelEnhanced(), YardageModelEnhanced()
+    stats = Instrumentation()
+    model.set_instrumentation(stats)
+    assert model.calculate(REQUEST) == plain.calculate(REQUEST)
+    args = (np.full(50, 150.0), "7-iron", 85, 5280, 12, 200)
+    np.testing.assert_array_equal(model.calculate_adjusted_yardage_batch(*args).carry_distance,
+                                  plain.calculate_adjusted_yardage_batch(*args).carry_distance)
+
+    report = stats.snapshot()["YardageModelEnhanced"]
+    assert (report["scalar"]["calls"], report["scalar"]["rows"]) == (1, 1)
+    assert (report["batch"]["calls"], report["batch"]["rows"]) == (1, 50)
+    stages = {"environment", "ball", "temperature", "altitude", "wind"}
+    assert set(report["scalar"]["stages"]) == set(report["batch"]["stages"]) == stages
+
+    # Detached models record nothing
+    model.set_instrumentation(None)
+    model.calculate(REQUEST)
+    assert stats.snapshot()["YardageModelEnhanced"]["scalar"]["calls"] == 1
+
+
+def test_engines_share_one_instrumentation():
+    stats = Instrumentation(namespace="golf")
+    kernel = KernelYardageModel()
+    kernel.set_instrumentation(stats)
+    kernel.calculate_adjusted_yardage_batch([150, 160], "7-iron")
+    report = stats.snapshot()["KernelYardageModel"]["batch"]
+    assert report["rows"] == 2 and "environment" in report["stages"]
+    assert 'golf_calls_total{engine="KernelYardageModel",path="batch"} 1' in stats.prometheus()
+
+
+def test_concurrent_calls_are_all_counted():
+    stats = Instrumentation()
+
+    def work():
+        for _ in range(500):
+            timer = stats.start("Engine")
+            timer.mark("stage")
+            timer.finish()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report = stats.snapshot()["Engine"]["scalar"]
+    assert report["calls"] == report["rows"] == report["stages"]["stage"]["calls"] == 4000
@@ -0,0 +1,97 @@
+import bisect
+from typing import Mapping, Union
+
+import numpy as np
+
+Number = Union[float, np.ndarray]
+
+EXTRAPOLATION_POLICIES = ("linear", "clamp", "constant", "raise")
+
+
+class InterpolationTable:
+    """
+    Piecewise-linear lookup over a table of breakpoints, built once and queried
+    by bisection (bisect for scalars, searchsorted for arrays).
+
+    Outside the breakpoints the extrapolation policy applies:
+        linear   - extend the first/last segment
+        clamp    - hold the first/last value
+        constant - return fill_value
+        raise    - raise ValueError
+    """
+
+    def __init__(self, table: Mapping[float, float], extrapolation: str = "linear",
+                 fill_value: float = 1.0):
+        if len(table) < 2:
+            raise ValueError("Interpolation table needs at least two breakpoints")
+        if extrapolation not in EXTRAPOLATION_POLICIES:
+            raise ValueError(f"Unknown extrapolation policy: {extrapolation}")
+        self.keys = sorted(table)
+        self.values = [table[k] for k in self.keys]
+        self.extrapolation = extrapolation
+        self.fill_value = fill_value
+        self._keys = np.array(self.keys, dtype=float)
+        self._values = np.array(self.values, dtype=float)
+
+    def with_extrapolation(self, extrapolation: str, fill_value: float = 1.0) -> "InterpolationTable":
+        """Same breakpoints under a different extrapolation policy."""
+        return InterpolationTable(dict(zip(self.keys, self.values)), extrapolation, fill_value)
+
+    def __call__(self, value: Number) -> Number:
+        if isinstance(value, (int, float)) or (np.ndim(value) == 0 and not isinstance(value, np.ndarray)):
+            return self._scalar(value)
+        return self._array(np.asarray(value, dtype=float))
+
+    def _scalar(self, value: float) -> float:
+        keys = self.keys
+        if not keys[0] <= value <= keys[-1]:
+            if self.extrapolation == "clamp":
+                return self.values[0] if value < keys[0] else self.values[-1]
+            if self.extrapolation == "constant":
+                return self.fill_value
+            if self.extrapolation == "raise":
+                raise ValueError(f"{value} is outside the table range [{keys[0]}, {keys[-1]}]")
+        # First segment [k_i, k_i+1] containing the value; end segments extend linearly
+        i = min(max(bisect.bisect_left(keys, value) - 1, 0), len(keys) - 2)
+        key1, key2 = keys[i], keys[i + 1]
+        value1, value2 = self.values[i], self.values[i + 1]
+        ratio = (value - key1) / (key2 - key1)
+        return value1 + (value2 - value1) * ratio
+
+    def _array(self, values: np.ndarray) -> np.ndarray:
+        keys = self._keys
+        idx = np.clip(np.searchsorted(keys, values, side="left") - 1, 0, len(keys) - 2)
+        key1, key2 = keys[idx], keys[idx + 1]
+        value1, value2 = self._values[idx], self._values[idx + 1]
+        ratio = (values - key1) / (key2 - key1)
+        result = value1 + (value2 - value1) * ratio
+        if self.extrapolation == "linear":
+            return result
+
+        outside = (values < keys[0]) | (values > keys[-1])
+        if self.extrapolation == "raise":
+            if outside.any():
+                raise ValueError(f"Values outside the table range [{keys[0]}, {keys[-1]}]")
+            return result
+        if self.extrapolation == "clamp":
+            return np.where(values < keys[0], self._values[0],
+                            np.where(values > keys[-1], self._values[-1], result))
+        return np.where(outside, self.fill_value, result)
+
+
+class StepTable:
+    """
+    Bucketed lookup: returns the value of the first threshold at or above the
+    input, or above_value past the last threshold.
+    """
+
+    def __init__(self, thresholds: Mapping[float, float], above_value: float):
+        self.keys = sorted(thresholds)
+        self.values = [thresholds[k] for k in self.keys] + [above_value]
+        self._keys = np.array(self.keys, dtype=float)
+        self._values = np.array(self.values, dtype=float)
+
+    def __call__(self, value: Number) -> Number:
+        if isinstance(value, (int, float)) or (np.ndim(value) == 0 and not isinstance(value, np.ndarray)):
+            return self.values[bisect.bisect_left(self.keys, value)]
+        return self._values[np.searchsorted(self._keys, np.asarray(value, dtype=float), side="left")]
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from interpolation import InterpolationTable, StepTable, EXTRAPOLATION_POLICIES
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest, SkillLevel
+
+TABLE = InterpolationTable({40: 0.95, 70: 1.0, 100: 1.04})
+POINTS = [10.0, 40.0, 55.0, 70.0, 99.5, 100.0, 130.0]
+
+
+@pytest.mark.parametrize("policy", EXTRAPOLATION_POLICIES)
+def test_scalar_and_array_lookups_agree(policy):
+    table = TABLE.with_extrapolation(policy, fill_value=0.5)
+    inside = [x for x in POINTS if 40 <= x <= 100]
+    np.testing.assert_allclose(table(np.array(inside)), [table(x) for x in inside])
+    if policy == "raise":
+        for x in (10.0, 130.0):
+            with pytest.raises(ValueError):
+                table(x)
+            with pytest.raises(ValueError):
+                table(np.array([70.0, x]))
+    else:
+        np.testing.assert_allclose(table(np.array(POINTS)), [table(x) for x in POINTS])
+
+
+def test_extrapolation_policies():
+    assert TABLE(55.0) == pytest.approx(0.975)
+    assert TABLE(130.0) == pytest.approx(1.08)
+    assert TABLE.with_extrapolation("clamp")(10.0) == 0.95
+    assert TABLE.with_extrapolation("constant", 0.5)(130.0) == 0.5
+    with pytest.raises(ValueError):
+        InterpolationTable({1: 1.0})
+    with pytest.raises(ValueError):
+        TABLE.with_extrapolation("nearest")
+
+
+def test_step_table_buckets():
+    table = StepTable({10: 1.0, 20: 2.0}, above_value=3.0)
+    assert [table(x) for x in (5, 10, 15, 25)] == [1.0, 1.0, 2.0, 3.0]
+    assert table(np.array([5, 10, 15, 25])).tolist() == [1.0, 1.0, 2.0, 3.0]
+
+
+def test_raise_policy_ignores_unset_conditions():
+    model = YardageModelEnhanced()
+    model.set_extrapolation("raise")
+    expected = model.calculate(ShotRequest(150, "7-iron")).carry_distance
+
+    # No conditions and 0 (unset, as in the scalar path) never reach the tables
+    assert model.calculate_adjusted_yardage_batch(150, "7-iron").carry_distance.tolist() == [expected]
+    result = model.calculate_adjusted_yardage_batch([150, 150], "7-iron", temperature=[np.nan, 0.0],
+                                                    altitude=[0.0, np.nan])
+    assert result.carry_distance.tolist() == [expected, expected]
+    reference = YardageModelEnhanced()
+    assert model.recommend(150, Conditions()) == reference.recommend(150, Conditions())
+    assert model.get_optimal_club(150, SkillLevel.INTERMEDIATE) == \
+        reference.get_optimal_club(150, SkillLevel.INTERMEDIATE)
+
+    # Conditions that are set are still checked
+    with pytest.raises(ValueError):
+        model.calculate_adjusted_yardage_batch([150, 150], "7-iron", temperature=[np.nan, 20.0])
+    with pytest.raises(ValueError):
+        model.recommend(150, Conditions(altitude=20000))
@@ -0,0 +1,182 @@
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, Conditions
+
+TOLERANCE = 0.01       # Yards of carry a solution may miss the target by
+MAX_EVALUATIONS = 12   # Model evaluations per club before giving up
+
+
+@dataclass
+class PlaysLike:
+    club: str
+    stock_yardage: float     # Stock yardage whose adjusted carry is the target ("plays like")
+    carry_distance: float    # Adjusted carry of the stock yardage in yards
+    lateral_movement: float  # Lateral movement in yards (+ is right, - is left)
+    evaluations: int         # Model evaluations spent on this club
+    converged: bool
+
+
+@dataclass
+class InverseSolution:
+    target_yardage: float
+    conditions: Conditions
+    clubs: List[PlaysLike] = field(default_factory=list)  # Bag order
+    evaluations: int = 0  # Batch model calls, each covering every unsolved club
+
+    def for_club(self, club: str) -> PlaysLike:
+        for solution in self.clubs:
+            if solution.club == club.lower():
+                return solution
+        raise ValueError(f"Unknown club: {club}")
+
+
+def solve_increasing(func: Callable[[np.ndarray, np.ndarray], np.ndarray], target: np.ndarray,
+                     guess: np.ndarray, tolerance: float = TOLERANCE,
+                     max_evaluations: int = MAX_EVALUATIONS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Solve func(x) = target row-wise for functions increasing in x, all rows at once.
+
+    Each round evaluates func once for every unsolved row. Until a row has points
+    on both sides of its target it steps along the secant through the origin
+    (exact for functions proportional to x), doubling or halving when that would
+    not move past the known point; once bracketed it continues with Illinois
+    false position, which keeps the bracket and converges superlinearly.
+
+    Args:
+        func: func(x, rows) -> values of the rows (indices into target) at x
+        target: Target value per row
+        guess: Starting point per row, > 0
+        tolerance: Absolute tolerance on func(x) - target
+        max_evaluations: Evaluations per row before giving up
+
+    Returns:
+        Tuple: solution, func at the solution and evaluations spent, per row.
+        Rows that did not converge hold their last iterate.
+    """
+    target = np.asarray(target, dtype=float)
+    n = target.size
+    x = np.array(np.broadcast_to(np.asarray(guess, dtype=float), (n,)))
+    value = np.full(n, np.nan)
+    solution = x.copy()  # Last evaluated point, as x moves on to the next iterate
+    evaluations = np.zeros(n, dtype=int)
+    lo, r_lo = np.full(n, np.nan), np.full(n, np.nan)
+    hi, r_hi = np.full(n, np.nan), np.full(n, np.nan)
+    side = np.zeros(n, dtype=int)  # -1/+1 when lo/hi moved last, for the Illinois step
+    rows = np.arange(n)
+
+    for _ in range(max_evaluations):
+        if not rows.size:
+            break
+        solution[rows] = x[rows]
+        value[rows] = func(x[rows], rows)
+        evaluations[rows] += 1
+        residual = value[rows] - target[rows]
+        # Finished rows: within tolerance, or nothing finite to iterate on
+        keep = (np.abs(residual) > tolerance) & np.isfinite(residual)
+        rows, residual = rows[keep], residual[keep]
+
+        short = residual < 0
+        for moved, point, r_point, r_other, sign in ((short, lo, r_lo, r_hi, -1),
+                                                     (~short, hi, r_hi, r_lo, 1)):
+            updated = rows[moved]
+            # Illinois: the same end moving twice halves the other end's residual
+            repeat = updated[side[updated] == sign]
+            r_other[repeat] *= 0.5
+            point[updated] = x[updated]
+            r_point[updated] = residual[moved]
+            side[updated] = sign
+
+        xs, current = x[rows], value[rows]
+        bracketed = ~np.isnan(lo[rows]) & ~np.isnan(hi[rows])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            false_position = lo[rows] - r_lo[rows] * (hi[rows] - lo[rows]) / (r_hi[rows] - r_lo[rows])
+            secant = np.where(current > 0, xs * target[rows] / current, np.nan)
+        # Unbracketed rows must move past their only point: up when short, down when long
+        secant = np.where(short & ~(secant > xs), xs * 2, secant)
+        secant = np.where(~short & ~(secant < xs), xs / 2, secant)
+        x[rows] = np.where(bracketed, false_position, secant)
+
+    return solution, value, evaluations
+
+
+def _bag_order(model: YardageModelEnhanced, conditions: Conditions,
+               ball_model: str) -> Tuple[List[str], np.ndarray]:
+    """Clubs the model covers in bag order, with their carry per yard of stock yardage."""
+    index = model.carry_indexes([conditions], ball_model)[0]
+    order = sorted(range(len(index.clubs)), key=index.priority.__getitem__)
+    return ([index.clubs[i] for i in order],
+            np.array([index.carry_per_yard[i] for i in order], dtype=float))
+
+
+def plays_like(target_yardage: float, conditions: Conditions = Conditions(),
+               ball_model: str = "mid_range", model: Optional[YardageModelEnhanced] = None,
+               clubs: Optional[Sequence[str]] = None, tolerance: float = TOLERANCE,
+               max_evaluations: int = MAX_EVALUATIONS) -> InverseSolution:
+    """
+    Stock yardage each club has to be played at to carry the target in these conditions.
+
+    The inverse of calculate: for every club, the stock (neutral conditions)
+    yardage whose adjusted carry equals target_yardage. All clubs are solved
+    together, one batch call per iteration, starting from target / carry per
+    yard. The enhanced model is linear in yardage, so each club converges on the
+    first evaluation; models that are not are bracketed and refined with
+    solve_increasing.
+
+    Args:
+        target_yardage: Carry the shot has to produce in yards
+        conditions: Conditions for the shot
+        ball_model: Ball model from BALL_MODELS
+        model: Yardage model (default: YardageModelEnhanced)
+        clubs: Clubs to solve for (default: every club the model covers, bag order)
+        tolerance: Yards of carry a solution may miss the target by
+        max_evaluations: Batch evaluations before giving up on a club
+
+    Returns:
+        InverseSolution: One PlaysLike per club
+    """
+    model = model or YardageModelEnhanced()
+    bag, per_yard = _bag_order(model, conditions, ball_model)
+    if clubs is not None:
+        position = {club: i for i, club in enumerate(bag)}
+        selected = []
+        for club in clubs:
+            if club.lower() not in position:
+                raise ValueError(f"Unknown club: {club}")
+            selected.append(position[club.lower()])
+        bag, per_yard = [bag[i] for i in selected], per_yard[selected]
+
+    names = np.array(bag, dtype=str)
+    # Unset conditions are NaN so the batch path skips them like None
+    condition_values = [np.nan if value is None else value
+                        for value in (conditions.temperature, conditions.altitude,
+                                      conditions.wind_speed, conditions.wind_direction)]
+    lateral = np.full(len(bag), np.nan)
+    calls = [0]
+
+    def carry(stock: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        calls[0] += 1
+        result = model.calculate_adjusted_yardage_batch(
+            stock, names[rows], *condition_values, ball_model, rounded=False)
+        lateral[rows] = result.lateral_movement
+        return result.carry_distance
+
+    target = np.full(len(bag), float(target_yardage))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        guess = np.where(per_yard > 0, target / per_yard, target)
+    stock, carried, evaluations = solve_increasing(carry, target, guess, tolerance, max_evaluations)
+
+    solution = InverseSolution(target_yardage=target_yardage, conditions=conditions)
+    for i, club in enumerate(bag):
+        solution.clubs.append(PlaysLike(
+            club=club,
+            stock_yardage=round(float(stock[i]), 1),
+            carry_distance=round(float(carried[i]), 1),
+            lateral_movement=round(float(lateral[i]), 1),
+            evaluations=int(evaluations[i]),
+            converged=bool(abs(carried[i] - target[i]) <= tolerance),
+        ))
+    solution.evaluations = calls[0]
+    return solution
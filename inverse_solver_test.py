@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from inverse_solver import plays_like, solve_increasing, TOLERANCE, MAX_EVALUATIONS
+from yardage_model_enhanced import YardageModelEnhanced, Conditions
+
+CONDITIONS = [
+    Conditions(),
+    Conditions(temperature=45, altitude=0, wind_speed=15, wind_direction=0),
+    Conditions(temperature=95, altitude=7000, wind_speed=20, wind_direction=180),
+    Conditions(temperature=70, altitude=3000, wind_speed=12, wind_direction=300),
+]
+
+
+@pytest.mark.parametrize("conditions", CONDITIONS)
+@pytest.mark.parametrize("target", [95.0, 150.0, 230.0])
+def test_plays_like_converges_to_the_target(conditions, target):
+    model = YardageModelEnhanced()
+    solution = plays_like(target, conditions, model=model)
+
+    assert solution.clubs and all(club.converged for club in solution.clubs)
+    # The model is linear in yardage, so one batch evaluation solves every club
+    assert solution.evaluations == 1
+    stock = np.array([club.stock_yardage for club in solution.clubs])
+    values = [np.nan if v is None else v for v in (conditions.temperature, conditions.altitude,
+                                                   conditions.wind_speed, conditions.wind_direction)]
+    carried = model.calculate_adjusted_yardage_batch(
+        stock, [club.club for club in solution.clubs], *values, rounded=False).carry_distance
+    # Stock yardages are reported to 0.1 yd, so their carries land within that rounding
+    np.testing.assert_allclose(carried, target, atol=0.1)
+
+
+def test_plays_like_selected_clubs_and_unknown_club():
+    solution = plays_like(160, CONDITIONS[1], clubs=["7-Iron", "driver"])
+    assert [club.club for club in solution.clubs] == ["7-iron", "driver"]
+    assert solution.for_club("7-IRON") is solution.clubs[0]
+    with pytest.raises(ValueError):
+        plays_like(160, clubs=["spoon"])
+
+
+@pytest.mark.parametrize("guess", [0.1, 1.0, 50.0])
+def test_solve_increasing_converges_on_nonlinear_functions(guess):
+    scale = np.array([0.5, 1.0, 2.0, 4.0])
+    target = np.array([10.0, 200.0, 35.0, 1000.0])
+
+    def func(x, rows):
+        return scale[rows] * x ** 1.5 + np.sqrt(x)
+
+    solution, value, evaluations = solve_increasing(func, target, np.full(4, guess))
+    np.testing.assert_allclose(value, target, atol=TOLERANCE)
+    np.testing.assert_allclose(func(solution, np.arange(4)), value)
+    assert evaluations.max() < MAX_EVALUATIONS
+
+
+def test_solve_increasing_reports_unconverged_rows():
+    target = np.array([5.0, 1e6])
+
+    def func(x, rows):
+        return np.minimum(x, 100.0)  # The second target is out of reach
+
+    solution, value, evaluations = solve_increasing(func, target, np.ones(2), max_evaluations=8)
+    assert abs(value[0] - 5.0) <= TOLERANCE
+    assert value[1] == 100.0 and evaluations[1] == 8
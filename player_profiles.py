@@ -0,0 +1,254 @@
+import json
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, Mapping, Optional
+
+from yardage_model_enhanced import YardageModelEnhanced, ClubData, ShotRequest
+
+# Launch-monitor measurements kept per club (ClubData field names)
+PROFILE_FIELDS = ("ball_speed", "launch_angle", "spin_rate", "max_height", "land_angle")
+MIN_SHOTS = 5  # Measurements of a field before the personal mean replaces the stock value
+
+_PLAYER_ID = re.compile(r"[A-Za-z0-9_.@-]{1,128}")
+
+
+@dataclass
+class RunningStats:
+    """Running mean and variance (Welford), O(1) per value."""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0  # Sum of squared deviations from the mean
+
+    def update(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats"):
+        """Fold in statistics gathered elsewhere (Chan et al.), e.g. an aggregate query."""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; 0 with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class ClubProfile:
+    stats: Dict[str, RunningStats] = field(
+        default_factory=lambda: {name: RunningStats() for name in PROFILE_FIELDS})
+
+    @property
+    def shots(self) -> int:
+        return max(s.count for s in self.stats.values())
+
+    def update(self, measurements: Mapping[str, Optional[float]]):
+        for name, value in measurements.items():
+            if name not in self.stats:
+                raise ValueError(f"Unknown club measurement: {name}")
+            # Fields the launch monitor did not report are skipped
+            if value is not None and value == value:
+                self.stats[name].update(float(value))
+
+    def personal_values(self, min_shots: int = MIN_SHOTS) -> Dict[str, float]:
+        """Means of the fields with at least min_shots measurements."""
+        return {name: s.mean for name, s in self.stats.items() if s.count >= min_shots}
+
+
+class PlayerProfile:
+    """
+    Personal ball speed, launch, spin, height and land angle per club.
+
+    log_shot folds one launch-monitor reading into running statistics in O(1);
+    club_data resolves the personalized ClubData, cached per club until the
+    club's next shot, so a request costs one dict lookup.
+    """
+
+    def __init__(self, player_id: str, clubs: Optional[Dict[str, ClubProfile]] = None):
+        self.player_id = player_id
+        self.clubs: Dict[str, ClubProfile] = clubs or {}
+        self._lock = threading.Lock()
+        # id of the stock club table (replaced whole by apply_parameters) -> club -> ClubData
+        self._resolved: Dict[int, Dict[str, Optional[ClubData]]] = {}
+
+    def log_shot(self, club: str, **measurements: Optional[float]):
+        """
+        Record one shot's launch-monitor measurements.
+
+        Args:
+            club: Club name
+            measurements: Any of PROFILE_FIELDS; None or NaN for fields not measured
+        """
+        club = club.lower()
+        with self._lock:
+            self.clubs.setdefault(club, ClubProfile()).update(measurements)
+            # Resolved tables are replaced whole, never edited, so readers need no lock
+            self._resolved = {}
+
+    def merge(self, clubs: Mapping[str, Mapping[str, RunningStats]]):
+        """Fold in per-club statistics gathered elsewhere, e.g. ShotHistory.club_stats."""
+        with self._lock:
+            for club, stats in clubs.items():
+                profile = self.clubs.setdefault(club.lower(), ClubProfile())
+                for name, s in stats.items():
+                    if name not in profile.stats:
+                        raise ValueError(f"Unknown club measurement: {name}")
+                    profile.stats[name].merge(s)
+            self._resolved = {}
+
+    def club_data(self, club: str, model: YardageModelEnhanced,
+                  min_shots: int = MIN_SHOTS) -> Optional[ClubData]:
+        """
+        Personalized ClubData: the model's stock entry with every field that has
+        min_shots measurements replaced by the player's mean.
+
+        A club the model cannot resolve (see YardageModelEnhanced.club_data) starts
+        from the stock club closest in personal ball speed, and needs a personal
+        ball speed to do so.
+
+        Returns:
+            ClubData, or None when the player has no personal values for the club
+        """
+        club = club.lower()
+        resolved = self._resolved
+        by_club = resolved.get(id(model.CLUB_DATABASE))
+        if by_club is None:
+            by_club = resolved[id(model.CLUB_DATABASE)] = {}
+        if club in by_club:
+            return by_club[club]
+
+        profile = self.clubs.get(club)
+        values = profile.personal_values(min_shots) if profile else {}
+        try:
+            stock = model.club_data(club)
+        except ValueError:
+            stock = None
+        if not values:
+            data = None
+        elif stock is not None:
+            data = replace(stock, **values)
+        elif "ball_speed" in values:
+            stock = min(model.CLUB_DATABASE.values(), key=lambda c: abs(c.ball_speed - values["ball_speed"]))
+            data = replace(stock, name=club.replace("-", " ").title(), loft=None, **values)
+        else:
+            data = None
+        by_club[club] = data
+        return data
+
+    def personalize(self, request: ShotRequest, model: YardageModelEnhanced,
+                    min_shots: int = MIN_SHOTS) -> ShotRequest:
+        """The request with the player's ClubData, unchanged when there is none."""
+        data = self.club_data(request.club, model, min_shots)
+        return request if data is None else replace(request, club_data=data)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                "player_id": self.player_id,
+                "clubs": {club: {name: [s.count, s.mean, s.m2] for name, s in profile.stats.items()}
+                          for club, profile in self.clubs.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "PlayerProfile":
+        clubs = {}
+        for club, stats in data.get("clubs", {}).items():
+            profile = ClubProfile()
+            for name, (count, mean, m2) in stats.items():
+                if name in profile.stats:
+                    profile.stats[name] = RunningStats(int(count), float(mean), float(m2))
+            clubs[club] = profile
+        return cls(data["player_id"], clubs)
+
+
+class ProfileStore:
+    """
+    Player profiles with an LRU of hot profiles in memory.
+
+    Without a directory, profiles live only in memory and evicted ones are
+    lost. With a directory, each profile is a JSON file, loaded on first use
+    and written back when evicted or on flush(); shots are never replayed.
+    """
+
+    def __init__(self, directory: Optional[str] = None, capacity: int = 1024):
+        self.directory = directory
+        self.capacity = capacity
+        self._hot: "OrderedDict[str, PlayerProfile]" = OrderedDict()
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, player_id: str) -> str:
+        return os.path.join(self.directory, player_id + ".json")
+
+    def _load(self, player_id: str) -> PlayerProfile:
+        # Ids become file names, so only a safe character set is accepted
+        if not _PLAYER_ID.fullmatch(player_id) or player_id.startswith("."):
+            raise ValueError(f"Invalid player id: {player_id!r}")
+        if self.directory and os.path.exists(self._path(player_id)):
+            with open(self._path(player_id)) as f:
+                return PlayerProfile.from_dict(json.load(f))
+        return PlayerProfile(player_id)
+
+    def _save(self, profile: PlayerProfile):
+        path = self._path(profile.player_id)
+        # Write then rename, so a crash never leaves a truncated profile
+        with open(path + ".tmp", "w") as f:
+            json.dump(profile.to_dict(), f)
+        os.replace(path + ".tmp", path)
+
+    def get(self, player_id: str) -> PlayerProfile:
+        """The player's profile (new if none is stored), marked most recently used."""
+        with self._lock:
+            profile = self._hot.get(player_id)
+            if profile is not None:
+                self.hits += 1
+                self._hot.move_to_end(player_id)
+                return profile
+            self.misses += 1
+            profile = self._hot[player_id] = self._load(player_id)
+            while len(self._hot) > self.capacity:
+                evicted_id, evicted = self._hot.popitem(last=False)
+                if self.directory and evicted_id in self._dirty:
+                    self._save(evicted)
+                self._dirty.discard(evicted_id)
+            return profile
+
+    def log_shot(self, player_id: str, club: str, **measurements: Optional[float]) -> PlayerProfile:
+        """Record a shot for a player; see PlayerProfile.log_shot."""
+        profile = self.get(player_id)
+        profile.log_shot(club, **measurements)
+        with self._lock:
+            self._dirty.add(player_id)
+        return profile
+
+    def flush(self):
+        """Write every changed hot profile to the directory."""
+        with self._lock:
+            if self.directory:
+                for player_id in self._dirty:
+                    if player_id in self._hot:
+                        self._save(self._hot[player_id])
+            self._dirty.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"profiles": len(self._hot), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+from player_profiles import RunningStats, PlayerProfile, ProfileStore, MIN_SHOTS
+from yardage_model_enhanced import YardageModelEnhanced
+
+
+def _stats(values) -> RunningStats:
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+    return stats
+
+
+@pytest.mark.parametrize("split", [0, 1, 7, 20])
+def test_running_stats_merge_matches_one_pass(split):
+    values = np.random.default_rng(split).normal(150, 8, 20)
+    merged = _stats(values[:split])
+    merged.merge(_stats(values[split:]))
+
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(values.var(ddof=1))
+    assert merged.std == pytest.approx(values.std(ddof=1))
+
+
+def test_player_profile_merge_feeds_personal_club_data():
+    model = YardageModelEnhanced()
+    profile = PlayerProfile("alex")
+    profile.log_shot("7-Iron", ball_speed=118.0, launch_angle=17.0)
+    assert profile.club_data("7-iron", model) is None
+
+    profile.merge({"7-IRON": {"ball_speed": _stats([120.0] * (MIN_SHOTS - 1))}})
+    data = profile.club_data("7-iron", model)
+    assert data.ball_speed == pytest.approx((118.0 + 120.0 * (MIN_SHOTS - 1)) / MIN_SHOTS)
+    assert data.launch_angle == model.CLUB_DATABASE["7-iron"].launch_angle
+    with pytest.raises(ValueError):
+        profile.merge({"7-iron": {"smash_factor": RunningStats()}})
+
+
+def test_profile_store_evicts_and_flushes_to_disk(tmp_path):
+    directory = str(tmp_path)
+    store = ProfileStore(directory, capacity=2)
+    for shot in range(3):
+        store.log_shot("alex", "driver", ball_speed=160.0 + shot)
+    store.log_shot("blake", "7-iron", ball_speed=120.0)
+    assert os.listdir(directory) == []
+
+    # A third player evicts the least recently used, whose changes are written back
+    store.log_shot("casey", "wedge", spin_rate=9000.0)
+    assert sorted(os.listdir(directory)) == ["alex.json"]
+    assert store.stats() == {"profiles": 2, "hits": 2, "misses": 3}
+
+    store.flush()
+    assert sorted(os.listdir(directory)) == ["alex.json", "blake.json", "casey.json"]
+
+    reopened = ProfileStore(directory)
+    stats = reopened.get("alex").clubs["driver"].stats["ball_speed"]
+    assert (stats.count, stats.mean) == (3, pytest.approx(161.0))
+    assert stats.variance == pytest.approx(1.0)
+    assert reopened.get("casey").clubs["wedge"].stats["spin_rate"].mean == 9000.0
+
+    with pytest.raises(ValueError):
+        reopened.get("../alex")
+
+
+def test_profile_store_without_directory_drops_evicted_profiles():
+    store = ProfileStore(capacity=1)
+    store.log_shot("alex", "driver", ball_speed=160.0)
+    store.log_shot("blake", "driver", ball_speed=150.0)
+    store.flush()
+    assert store.get("alex").clubs == {}
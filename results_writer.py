@@ -0,0 +1,251 @@
+import abc
+import csv
+import io
+import os
+import warnings
+from dataclasses import fields
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import Conditions, ShotResult
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Parquet/Arrow output is optional; CSV is always available
+    pa = None
+
+# Output schema: the input conditions, then every ShotResult field
+INPUT_SCHEMA: Tuple[Tuple[str, str], ...] = tuple(
+    (f.name, "float64") for f in fields(Conditions)
+) + (("ball_model", "string"), ("club", "string"), ("target_yardage", "float64"))
+RESULT_SCHEMA: Tuple[Tuple[str, str], ...] = tuple((f.name, "float64") for f in fields(ShotResult))
+SCHEMA = INPUT_SCHEMA + RESULT_SCHEMA
+COLUMNS = tuple(name for name, _ in SCHEMA)
+
+FORMAT_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".csv": "csv",
+}
+
+
+def _column_arrays(columns: Mapping[str, Any], names: Sequence[str] = COLUMNS) -> Dict[str, np.ndarray]:
+    """Broadcast a batch of scalar or array columns to equal-length arrays."""
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise ValueError(f"Batch is missing columns: {', '.join(missing)}")
+    arrays = [np.asarray(columns[name]) for name in names]
+    size = max(a.size for a in arrays)
+    return {name: np.broadcast_to(a, (size,)) for name, a in zip(names, arrays)}
+
+
+def csv_values(values: np.ndarray, kind: str) -> list:
+    """Column values for csv.writer; unset (None/NaN) conditions become empty fields."""
+    if kind == "float64" and (values.dtype == object or np.isnan(values).any()):
+        return ["" if v is None or v != v else v for v in values.tolist()]
+    return values.tolist()
+
+
+class ResultsWriter(abc.ABC):
+    """
+    Streaming writer for scenario results with bounded memory.
+
+    Row batches are buffered until row_group_size rows are pending and then
+    written out, so memory never holds more than one row group regardless of
+    how many rows pass through. Use as a context manager or call close().
+    Subclasses implement _write for one flushed row group.
+    """
+
+    format = ""
+
+    def __init__(self, path: str, row_group_size: int = 100_000):
+        self.path = path
+        self.row_group_size = row_group_size
+        self.rows = 0  # Rows accepted so far
+        self._pending: List[Dict[str, np.ndarray]] = []
+        self._pending_rows = 0
+
+    @staticmethod
+    def encode(columns: Mapping[str, Any]) -> Any:
+        """
+        Prepare a batch for write_encoded. Runs in sweep worker processes, so
+        expensive serialization can happen off the writing process.
+        """
+        return _column_arrays(columns)
+
+    def write_encoded(self, payload: Any, rows: int):
+        """Write a batch returned by encode."""
+        self.write_batch(payload)
+
+    def write_batch(self, columns: Mapping[str, Any]):
+        """Queue one batch of rows; columns are keyed by COLUMNS and may be scalars."""
+        batch = _column_arrays(columns)
+        size = len(batch[COLUMNS[0]])
+        self._pending.append(batch)
+        self._pending_rows += size
+        self.rows += size
+        if self._pending_rows >= self.row_group_size:
+            self.flush()
+
+    def write_results(self, conditions: Conditions, ball_model: str, club: str,
+                      target_yardage: float, result: ShotResult):
+        """Convenience for scalar callers: queue a single row."""
+        self.write_batch({"temperature": conditions.temperature, "altitude": conditions.altitude,
+                          "wind_speed": conditions.wind_speed,
+                          "wind_direction": conditions.wind_direction,
+                          "ball_model": ball_model, "club": club, "target_yardage": target_yardage,
+                          "carry_distance": result.carry_distance,
+                          "lateral_movement": result.lateral_movement})
+
+    def flush(self):
+        if not self._pending:
+            return
+        batch = {name: np.concatenate([b[name] for b in self._pending]) for name in COLUMNS}
+        self._pending = []
+        self._pending_rows = 0
+        self._write(batch)
+
+    @abc.abstractmethod
+    def _write(self, batch: Dict[str, np.ndarray]):
+        """Write one flushed row group of equal-length COLUMNS arrays."""
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvResultsWriter(ResultsWriter):
+    """CSV fallback, appended chunk by chunk."""
+
+    format = "csv"
+
+    def __init__(self, path: str, row_group_size: int = 100_000):
+        super().__init__(path, row_group_size)
+        self._file = open(path, "wb")
+        self._file.write((",".join(COLUMNS) + "\r\n").encode())
+
+    @staticmethod
+    def encode(columns: Mapping[str, Any]) -> bytes:
+        """CSV text for a batch, header excluded."""
+        batch = _column_arrays(columns)
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(zip(*(csv_values(batch[name], kind) for name, kind in SCHEMA)))
+        return buffer.getvalue().encode()
+
+    def write_encoded(self, payload: bytes, rows: int):
+        # Already formatted; nothing left to buffer
+        self.flush()
+        self._file.write(payload)
+        self.rows += rows
+
+    def _write(self, batch: Dict[str, np.ndarray]):
+        self._file.write(self.encode(batch))
+
+    def close(self):
+        super().close()
+        self._file.close()
+
+
+class _ArrowResultsWriter(ResultsWriter):
+    """Shared column conversion for the pyarrow-backed writers."""
+
+    def __init__(self, path: str, row_group_size: int = 100_000):
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet/Arrow output")
+        super().__init__(path, row_group_size)
+        self.schema = pa.schema([(name, pa.float64() if kind == "float64" else pa.string())
+                                 for name, kind in SCHEMA])
+
+    def _record_batch(self, batch: Dict[str, np.ndarray]) -> "pa.RecordBatch":
+        arrays = []
+        for (name, kind), field in zip(SCHEMA, self.schema):
+            values = batch[name]
+            if kind == "float64":
+                values = values.astype(float) if values.dtype != object else \
+                    np.array([np.nan if v is None else v for v in values], dtype=float)
+                arrays.append(pa.array(values, type=field.type, from_pandas=True))
+            else:
+                arrays.append(pa.array(values.astype(str), type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class ParquetResultsWriter(_ArrowResultsWriter):
+    """Parquet file with one row group per flushed batch."""
+
+    format = "parquet"
+
+    def __init__(self, path: str, row_group_size: int = 100_000, compression: str = "zstd"):
+        super().__init__(path, row_group_size)
+        self._writer = pa.parquet.ParquetWriter(path, self.schema, compression=compression)
+
+    def _write(self, batch: Dict[str, np.ndarray]):
+        self._writer.write_batch(self._record_batch(batch))
+
+    def close(self):
+        super().close()
+        self._writer.close()
+
+
+class ArrowResultsWriter(_ArrowResultsWriter):
+    """Arrow IPC (Feather v2) file, readable with zero-copy memory mapping."""
+
+    format = "arrow"
+
+    def __init__(self, path: str, row_group_size: int = 100_000):
+        super().__init__(path, row_group_size)
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def _write(self, batch: Dict[str, np.ndarray]):
+        self._writer.write_batch(self._record_batch(batch))
+
+    def close(self):
+        super().close()
+        self._writer.close()
+        self._sink.close()
+
+
+WRITERS = {
+    "parquet": ParquetResultsWriter,
+    "arrow": ArrowResultsWriter,
+    "csv": CsvResultsWriter,
+}
+
+
+def open_results_writer(path: str, format: Optional[str] = None,
+                        row_group_size: int = 100_000) -> ResultsWriter:
+    """
+    Open a streaming results writer.
+
+    The format comes from the argument or the path's extension (.parquet,
+    .arrow/.feather/.ipc, .csv), defaulting to Parquet. Without pyarrow,
+    Parquet and Arrow requests fall back to CSV and the extension is switched
+    to .csv; check writer.path and writer.format for what was written.
+
+    Args:
+        path: Output file path
+        format: "parquet", "arrow" or "csv"
+        row_group_size: Rows buffered before each write
+
+    Returns:
+        ResultsWriter: Open writer; close it (or use it as a context manager) when done
+    """
+    root, extension = os.path.splitext(path)
+    format = format or FORMAT_EXTENSIONS.get(extension.lower(), "parquet")
+    if format not in WRITERS:
+        raise ValueError(f"Unknown results format: {format}")
+    if format != "csv" and pa is None:
+        warnings.warn(f"pyarrow is not installed; writing CSV instead of {format}")
+        format = "csv"
+        path = root + ".csv"
+    return WRITERS[format](path, row_group_size)
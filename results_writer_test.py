@@ -0,0 +1,90 @@
+import csv
+
+import numpy as np
+import pytest
+
+import results_writer
+from results_writer import (ResultsWriter, CsvResultsWriter, open_results_writer, csv_values,
+                            COLUMNS, SCHEMA)
+from yardage_model_enhanced import Conditions, ShotResult
+
+BATCH = {"temperature": [85.0, np.nan, 60.0], "altitude": 0.0, "wind_speed": [5.0, 10.0, np.nan],
+         "wind_direction": [90.0, 180.0, np.nan], "ball_model": "mid_range",
+         "club": ["7-iron", "driver", "sand-wedge"], "target_yardage": [150.0, 250.0, 80.0],
+         "carry_distance": [151.2, 248.7, 80.0], "lateral_movement": [2.1, 0.0, 0.0]}
+
+
+def test_incomplete_writer_fails_at_construction(tmp_path):
+    class NoWrite(ResultsWriter):
+        def __init__(self, path, row_group_size=100_000):
+            super().__init__(path, row_group_size)
+            self._file = open(path, "wb")
+
+    with pytest.raises(TypeError):
+        NoWrite(str(tmp_path / "out.bin"))
+    with pytest.raises(TypeError):
+        ResultsWriter(str(tmp_path / "out.bin"))
+    assert not (tmp_path / "out.bin").exists()
+
+
+def test_csv_values_leave_unset_conditions_empty():
+    assert csv_values(np.array([1.5, np.nan]), "float64") == [1.5, ""]
+    assert csv_values(np.array([None, 2.0], dtype=object), "float64") == ["", 2.0]
+    assert csv_values(np.array(["a", "b"]), "string") == ["a", "b"]
+
+
+def test_csv_round_trip_and_row_groups(tmp_path):
+    path = str(tmp_path / "out.csv")
+    writes = []
+    with CsvResultsWriter(path, row_group_size=4) as writer:
+        original = writer._write
+        writer._write = lambda batch: (writes.append(len(batch["club"])), original(batch))
+        writer.write_batch(BATCH)
+        writer.write_batch(BATCH)
+        writer.write_results(Conditions(temperature=70), "distance", "9-iron", 130.0, ShotResult(131.0, -1.0))
+        writer.write_encoded(CsvResultsWriter.encode(BATCH), 3)
+        assert writer.rows == 10
+    assert writes == [6, 1]
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == COLUMNS and len(rows) == 11
+    first = dict(zip(COLUMNS, rows[1]))
+    assert first["club"] == "7-iron" and float(first["carry_distance"]) == 151.2
+    assert dict(zip(COLUMNS, rows[2]))["temperature"] == ""
+    assert dict(zip(COLUMNS, rows[7]))["altitude"] == ""
+
+
+def test_missing_columns_are_rejected(tmp_path):
+    with CsvResultsWriter(str(tmp_path / "out.csv")) as writer:
+        with pytest.raises(ValueError):
+            writer.write_batch({"club": "7-iron"})
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow"])
+def test_arrow_formats_round_trip(tmp_path, extension):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    path = str(tmp_path / f"out{extension}")
+    with open_results_writer(path, row_group_size=2) as writer:
+        writer.write_batch(BATCH)
+        writer.write_batch(BATCH)
+    table = pa.parquet.read_table(path) if extension == ".parquet" else pa.ipc.open_file(path).read_all()
+    assert table.schema.names == list(COLUMNS)
+    assert table.num_rows == 6
+    assert table.column("temperature").null_count == 2
+    assert table.column("club").to_pylist()[:3] == BATCH["club"]
+    assert [str(t) for t in table.schema.types] == ["double" if kind == "float64" else "string"
+                                                    for _, kind in SCHEMA]
+
+
+def test_open_results_writer_falls_back_to_csv_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_writer, "pa", None)
+    with pytest.warns(UserWarning):
+        writer = open_results_writer(str(tmp_path / "out.parquet"))
+    writer.close()
+    assert writer.format == "csv" and writer.path.endswith("out.csv")
+    with pytest.raises(ValueError):
+        open_results_writer(str(tmp_path / "out.csv"), format="xlsx")
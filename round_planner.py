@@ -0,0 +1,115 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from yardage_model_enhanced import YardageModelEnhanced, Conditions
+from club_selection import ClubRecommendation
+
+# Default pace of play when holes carry no tee times
+HOLE_INTERVAL = 15 * 60  # Seconds between tee times of consecutive holes
+SHOT_INTERVAL = 3 * 60   # Seconds between shots on a hole
+
+# (timestamp in seconds, conditions from then on), e.g. one entry per weather poll
+WeatherTimeline = Sequence[Tuple[float, Conditions]]
+
+
+@dataclass(frozen=True)
+class HoleLayout:
+    number: int
+    shots: Tuple[float, ...]          # Carry target of each planned shot in yards, tee shot first
+    tee_time: Optional[float] = None  # Seconds; defaults to the round's pace of play
+
+
+@dataclass
+class ShotPlan:
+    hole: int
+    shot: int           # 1-based shot number on the hole
+    time: float         # Seconds
+    target_yardage: float
+    conditions: Conditions
+    recommendation: ClubRecommendation
+
+    @property
+    def club(self) -> str:
+        return self.recommendation.club
+
+    @property
+    def carry_distance(self) -> float:
+        """Adjusted carry of the recommended club for this target."""
+        return self.recommendation.best.carry_distance
+
+    @property
+    def lateral_movement(self) -> float:
+        return self.recommendation.best.lateral_movement
+
+
+@dataclass
+class RoundPlan:
+    shots: List[ShotPlan] = field(default_factory=list)
+    windows: int = 0  # Distinct condition windows evaluated
+
+    def by_hole(self) -> Dict[int, List[ShotPlan]]:
+        holes: Dict[int, List[ShotPlan]] = {}
+        for shot in self.shots:
+            holes.setdefault(shot.hole, []).append(shot)
+        return holes
+
+
+def _shot_times(holes: Sequence[HoleLayout], start_time: float,
+                hole_interval: float, shot_interval: float) -> List[Tuple[HoleLayout, int, float]]:
+    times = []
+    for i, hole in enumerate(holes):
+        tee_time = start_time + i * hole_interval if hole.tee_time is None else hole.tee_time
+        times.extend((hole, k, tee_time + k * shot_interval) for k in range(len(hole.shots)))
+    return times
+
+
+def plan_round(holes: Sequence[HoleLayout], timeline: WeatherTimeline,
+               model: Optional[YardageModelEnhanced] = None, ball_model: str = "mid_range",
+               start_time: float = 0.0, hole_interval: float = HOLE_INTERVAL,
+               shot_interval: float = SHOT_INTERVAL, max_alternatives: int = 2) -> RoundPlan:
+    """
+    Club recommendations and adjusted carries for every shot of a round.
+
+    Each shot is assigned to the condition window in effect at its time (the
+    latest timeline entry at or before it; shots before the first entry use the
+    first). Shots are grouped by window and each window's carry index comes
+    from the model's cached environment path (see carry_indexes), so windows
+    that repeat across holes or rounds are not recomputed; each shot is then a
+    lookup in its window's index, giving the same answers as recommend().
+
+    Args:
+        holes: Hole layouts in playing order
+        timeline: (timestamp, conditions) entries; an empty timeline means no conditions
+        model: Yardage model (default: YardageModelEnhanced)
+        ball_model: Ball model from BALL_MODELS
+        start_time: First tee time in seconds, for holes without a tee_time
+        hole_interval: Seconds between holes without tee times
+        shot_interval: Seconds between shots on a hole
+        max_alternatives: Alternative clubs per shot
+
+    Returns:
+        RoundPlan: One ShotPlan per shot in playing order
+    """
+    model = model or YardageModelEnhanced()
+    timeline = sorted(timeline, key=lambda entry: entry[0])
+    times = [t for t, _ in timeline]
+    shots = _shot_times(holes, start_time, hole_interval, shot_interval)
+
+    # Group shots by the window they fall in; identical conditions share a window
+    windows: Dict[Conditions, int] = {}
+    window_of_shot = []
+    for _, _, time in shots:
+        conditions = timeline[max(bisect.bisect_right(times, time) - 1, 0)][1] if timeline else Conditions()
+        window_of_shot.append(windows.setdefault(conditions, len(windows)))
+
+    indexes = model.carry_indexes(list(windows), ball_model)
+    window_conditions = list(windows)
+    plan = RoundPlan(windows=len(windows))
+    for (hole, k, time), window in zip(shots, window_of_shot):
+        target = hole.shots[k]
+        plan.shots.append(ShotPlan(
+            hole=hole.number, shot=k + 1, time=time, target_yardage=target,
+            conditions=window_conditions[window],
+            recommendation=indexes[window].recommend(target, max_alternatives)))
+    return plan
@@ -0,0 +1,76 @@
+import pytest
+
+from round_planner import HoleLayout, plan_round, HOLE_INTERVAL, SHOT_INTERVAL
+from yardage_model_enhanced import YardageModelEnhanced, Conditions
+
+HOLES = [
+    HoleLayout(1, (265.0, 150.0)),
+    HoleLayout(2, (178.0,)),
+    HoleLayout(3, (240.0, 205.0, 95.0)),
+    HoleLayout(4, (160.0, 120.0), tee_time=3 * HOLE_INTERVAL + 600),
+]
+TIMELINE = [
+    (0.0, Conditions(temperature=62, altitude=5280, wind_speed=8, wind_direction=350)),
+    (HOLE_INTERVAL, Conditions(temperature=68, altitude=5280, wind_speed=14, wind_direction=10)),
+    (2 * HOLE_INTERVAL + SHOT_INTERVAL, Conditions(temperature=71, altitude=5280)),
+    (3 * HOLE_INTERVAL, Conditions(temperature=74, altitude=5280, wind_speed=6, wind_direction=180)),
+]
+
+
+def _expected_conditions(time):
+    return [c for t, c in TIMELINE if t <= time][-1]
+
+
+@pytest.mark.parametrize("max_alternatives", [0, 2])
+def test_plan_round_matches_per_shot_recommend(max_alternatives):
+    model = YardageModelEnhanced()
+    plan = plan_round(HOLES, TIMELINE[::-1], model=model, max_alternatives=max_alternatives)
+
+    assert [(s.hole, s.shot) for s in plan.shots] == [
+        (1, 1), (1, 2), (2, 1), (3, 1), (3, 2), (3, 3), (4, 1), (4, 2)]
+    assert plan.windows == len(TIMELINE)
+    for shot in plan.shots:
+        assert shot.conditions == _expected_conditions(shot.time)
+        expected = YardageModelEnhanced().recommend(shot.target_yardage, shot.conditions,
+                                                    max_alternatives=max_alternatives)
+        assert shot.club == expected.club
+        assert [o.club for o in shot.recommendation.alternatives] == \
+            [o.club for o in expected.alternatives]
+        assert shot.carry_distance == pytest.approx(expected.best.carry_distance, abs=1e-9)
+        assert shot.lateral_movement == pytest.approx(expected.best.lateral_movement, abs=1e-9)
+
+
+def test_plan_round_without_timeline_uses_no_conditions():
+    plan = plan_round(HOLES[:1], [])
+    assert plan.windows == 1
+    for shot in plan.shots:
+        assert shot.conditions == Conditions()
+        assert shot.club == YardageModelEnhanced().recommend(shot.target_yardage).club
+
+
+def test_repeated_windows_reuse_the_model_caches():
+    model = YardageModelEnhanced()
+    model.enable_environment_cache(maxsize=16)
+    plan_round(HOLES, TIMELINE, model=model)
+    misses = model.environment_cache_stats()["misses"]
+    built = model._carry_index_cache.cache_info().misses
+    assert misses == built == len(TIMELINE)
+
+    # A second round in the same weather computes nothing new
+    plan_round(HOLES, TIMELINE, model=model)
+    stats = model.environment_cache_stats()
+    assert stats["misses"] == misses and stats["hits"] >= len(TIMELINE)
+    assert model._carry_index_cache.cache_info().misses == built
+
+
+def test_plan_round_follows_cache_quantization():
+    model = YardageModelEnhanced()
+    model.enable_environment_cache(resolution={"temperature": 5.0, "wind_direction": 10.0})
+    timeline = [(0.0, Conditions(temperature=71, wind_speed=10, wind_direction=92)),
+                (HOLE_INTERVAL, Conditions(temperature=72, wind_speed=10, wind_direction=88))]
+    plan = plan_round(HOLES[:2], timeline, model=model)
+    assert plan.windows == 2
+    assert model.environment_cache_stats()["misses"] == 1
+    for shot in plan.shots:
+        expected = model.recommend(shot.target_yardage, shot.conditions)
+        assert shot.club == expected.club and shot.carry_distance == expected.best.carry_distance
@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.server import YardageService, HTTPError
+from shot_history import ShotHistory
+
+
+def _call(service, path, payload=None, method="POST", body=None):
+    """Dispatch one request; returns (status, response) like the HTTP handler."""
+    if body is None:
+        body = b"" if payload is None else json.dumps(payload).encode()
+    try:
+        return asyncio.run(service.dispatch(method, path, body))
+    except HTTPError as e:
+        return e.status, {"error": e.message}
+
+
+@pytest.fixture
+def service():
+    return YardageService()
+
+
+def test_valid_requests(service):
+    status, result = _call(service, "/shot", {"target_yardage": 150, "club": "7-Iron", "temperature": 85})
+    assert status == 200 and set(result) == {"carry_distance", "lateral_movement"}
+    status, result = _call(service, "/shots/batch", {"target_yardage": [150, 160], "club": "7-iron",
+                                                     "ball_model": ["mid_range", "distance"]})
+    assert status == 200 and len(result["carry_distance"]) == 2
+    status, result = _call(service, "/club/optimal", {"target_yardage": 150, "max_alternatives": 0})
+    assert status == 200 and result["alternatives"] == []
+    assert _call(service, "/health", method="GET")[0] == 200
+
+
+@pytest.mark.parametrize("method, path, body, status", [
+    ("GET", "/nowhere", b"", 404),
+    ("GET", "/shot", b"", 405),
+    ("POST", "/shot", b"{not json", 400),
+    ("POST", "/shot", b"[1, 2]", 400),
+])
+def test_routing_and_body_errors(service, method, path, body, status):
+    assert _call(service, path, method=method, body=body)[0] == status
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/shot", {"club": "7-iron"}),
+    ("/shot", {"target_yardage": "150", "club": "7-iron"}),
+    ("/shot", {"target_yardage": True, "club": "7-iron"}),
+    ("/shot", {"target_yardage": 150, "club": "putter"}),
+    ("/shot", {"target_yardage": 150, "club": ["7-iron"]}),
+    ("/shot", {"target_yardage": 150, "club": "7-iron", "ball_model": ["a"]}),
+    ("/shot", {"target_yardage": 150, "club": "7-iron", "ball_model": {"a": 1}}),
+    ("/shot", {"target_yardage": 150, "club": "7-iron", "ball_model": "rock"}),
+    ("/shot", {"target_yardage": 150, "club": "7-iron", "wind_speed": "calm"}),
+    ("/shot", {"target_yardage": 150, "club": "7-iron", "skill_level": "legend"}),
+    ("/shots/batch", {"club": "7-iron"}),
+    ("/shots/batch", {"target_yardage": 150, "club": "7-iron", "ball_model": []}),
+    ("/shots/batch", {"target_yardage": 150, "club": "7-iron", "ball_model": ""}),
+    ("/shots/batch", {"target_yardage": 150, "club": "7-iron", "ball_model": ["mid_range", ["a"]]}),
+    ("/shots/batch", {"target_yardage": [150, 160, 170], "club": ["7-iron", "driver"]}),
+    ("/shots/batch", {"target_yardage": 150, "club": "putter"}),
+    ("/club/optimal", {}),
+    ("/club/optimal", {"target_yardage": 150, "max_alternatives": -3}),
+    ("/club/optimal", {"target_yardage": 150, "max_alternatives": None}),
+    ("/club/optimal", {"target_yardage": 150, "max_alternatives": True}),
+    ("/club/optimal", {"target_yardage": 150, "max_alternatives": 1.5}),
+    ("/club/optimal", {"target_yardage": 150, "ball_model": ["a"]}),
+    ("/profile/shot", {"player_id": "alex"}),
+    ("/profile/shot", {"player_id": "alex", "club": "putter", "ball_speed": 100}),
+    ("/profile/shot", {"player_id": "alex", "club": ["driver"], "ball_speed": 160}),
+    ("/profile/shot", {"player_id": "alex", "club": "driver", "ball_speed": "fast"}),
+    ("/profile/shot", {"player_id": "../alex", "club": "driver", "ball_speed": 160}),
+])
+def test_malformed_payloads_are_400(service, path, payload):
+    status, result = _call(service, path, payload)
+    assert status == 400, result
+    assert result["error"]
+
+
+def test_rejected_profile_readings_are_not_recorded():
+    history = ShotHistory()
+    service = YardageService(history=history)
+    assert _call(service, "/profile/shot", {"player_id": "alex", "club": "putter", "ball_speed": 100})[0] == 400
+    assert _call(service, "/profile/shot", {"player_id": "alex", "club": "driver", "ball_speed": 160,
+                                            "ball_model": ["a"]})[0] == 400
+    assert service.profiles.get("alex").clubs == {}
+    assert len(history) == 0
+
+    status, result = _call(service, "/profile/shot", {"player_id": "alex", "club": "Driver",
+                                                      "ball_speed": 160, "carry_distance": 251})
+    assert status == 200 and result["ball_speed"]["count"] == 1
+    logged = history.query(["club", "actual_carry"])
+    assert logged["club"].tolist() == ["driver"] and logged["actual_carry"].tolist() == [251.0]
+
+
+@pytest.mark.parametrize("content_length, status", [
+    ("abc", 400), ("-5", 400), ("1e3", 400), (str(1 << 21), 413), ("2", 200),
+])
+def test_content_length_is_validated(service, content_length, status):
+    async def request():
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET /health HTTP/1.1\r\nContent-Length: {content_length}\r\n"
+                     f"Connection: close\r\n\r\n{{}}".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+
+    assert asyncio.run(request()).startswith(f"HTTP/1.1 {status} ".encode())
@@ -1,91 +1,109 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
 from typing import Dict, Any, List, Tuple
 
+# Common weather scenarios on golf courses
+CONDITIONS = [
+    {
+        "name": "Early Morning Dew",
+        "temp": 58,
+        "altitude": 0,
+        "wind_speed": 3,
+        "wind_dir": 45  # Light quartering wind
+    },
+    {
+        "name": "Midday Heat",
+        "temp": 88,
+        "altitude": 0,
+        "wind_speed": 12,
+        "wind_dir": 180  # Into wind
+    },
+    {
+        "name": "Mountain Approach",
+        "temp": 65,
+        "altitude": 6000,
+        "wind_speed": 8,
+        "wind_dir": 90  # Right to left
+    },
+    {
+        "name": "Sea Level Calm",
+        "temp": 72,
+        "altitude": 0,
+        "wind_speed": 0,
+        "wind_dir": 0
+    },
+    {
+        "name": "Desert Afternoon",
+        "temp": 98,
+        "altitude": 1500,
+        "wind_speed": 15,
+        "wind_dir": 270  # Left to right
+    },
+    {
+        "name": "Cool Evening",
+        "temp": 62,
+        "altitude": 0,
+        "wind_speed": 10,
+        "wind_dir": 135  # Quartering into
+    },
+    {
+        "name": "High Elevation",
+        "temp": 70,
+        "altitude": 8000,
+        "wind_speed": 5,
+        "wind_dir": 315  # Quartering helping
+    },
+    {
+        "name": "Coastal Links",
+        "temp": 67,
+        "altitude": 0,
+        "wind_speed": 18,
+        "wind_dir": 225  # Strong quartering into
+    },
+    {
+        "name": "Humid Afternoon",
+        "temp": 82,
+        "altitude": 500,
+        "wind_speed": 7,
+        "wind_dir": 160  # Into and left
+    },
+    {
+        "name": "Light Rain",
+        "temp": 64,
+        "altitude": 0,
+        "wind_speed": 12,
+        "wind_dir": 45  # Quartering helping
+    }
+]
+
+BALL_MODEL = "tour_premium"  # Using tour ball for consistency
+CLUB = "7-iron"
+TARGET_YARDAGE = 180  # Base 7-iron distance
+SKILL_LEVELS = [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_seven_iron_conditions."""
+    return [
+        (f"{skill.value}/{condition['name']}",
+         ShotRequest(TARGET_YARDAGE, CLUB,
+                     Conditions(condition["temp"], condition["altitude"],
+                                condition["wind_speed"], condition["wind_dir"]),
+                     BALL_MODEL, skill))
+        for skill in SKILL_LEVELS for condition in CONDITIONS
+    ]
+
+
 def test_seven_iron_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test 7-iron performance in various realistic golf conditions."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")  # Using tour ball for consistency
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Common weather scenarios on golf courses
-    conditions = [
-        {
-            "name": "Early Morning Dew",
-            "temp": 58,
-            "altitude": 0,
-            "wind_speed": 3,
-            "wind_dir": 45  # Light quartering wind
-        },
-        {
-            "name": "Midday Heat",
-            "temp": 88,
-            "altitude": 0,
-            "wind_speed": 12,
-            "wind_dir": 180  # Into wind
-        },
-        {
-            "name": "Mountain Approach",
-            "temp": 65,
-            "altitude": 6000,
-            "wind_speed": 8,
-            "wind_dir": 90  # Right to left
-        },
-        {
-            "name": "Sea Level Calm",
-            "temp": 72,
-            "altitude": 0,
-            "wind_speed": 0,
-            "wind_dir": 0
-        },
-        {
-            "name": "Desert Afternoon",
-            "temp": 98,
-            "altitude": 1500,
-            "wind_speed": 15,
-            "wind_dir": 270  # Left to right
-        },
-        {
-            "name": "Cool Evening",
-            "temp": 62,
-            "altitude": 0,
-            "wind_speed": 10,
-            "wind_dir": 135  # Quartering into
-        },
-        {
-            "name": "High Elevation",
-            "temp": 70,
-            "altitude": 8000,
-            "wind_speed": 5,
-            "wind_dir": 315  # Quartering helping
-        },
-        {
-            "name": "Coastal Links",
-            "temp": 67,
-            "altitude": 0,
-            "wind_speed": 18,
-            "wind_dir": 225  # Strong quartering into
-        },
-        {
-            "name": "Humid Afternoon",
-            "temp": 82,
-            "altitude": 500,
-            "wind_speed": 7,
-            "wind_dir": 160  # Into and left
-        },
-        {
-            "name": "Light Rain",
-            "temp": 64,
-            "altitude": 0,
-            "wind_speed": 12,
-            "wind_dir": 45  # Quartering helping
-        }
-    ]
-    
-    for skill in [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]:
+    for skill in SKILL_LEVELS:
         skill_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
                 temperature=condition["temp"],
                 altitude=condition["altitude"],
@@ -94,9 +112,9 @@ def test_seven_iron_conditions() -> Dict[str, List[Dict[str, Any]]]:
             )
             
             result = model.calculate_adjusted_yardage(
-                target_yardage=180,  # Base 7-iron distance
+                target_yardage=TARGET_YARDAGE,
                 skill_level=skill,
-                club="7-iron"
+                club=CLUB
             )
             
             skill_results.append({
@@ -0,0 +1,446 @@
+import csv
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import ShotRequest, ShotResult
+from calibration import ShotTable
+from player_profiles import PlayerProfile, ClubProfile, RunningStats, PROFILE_FIELDS
+from results_writer import FORMAT_EXTENSIONS, csv_values
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Parquet/Arrow export is optional; CSV is always available
+    pa = None
+
+SCHEMA_VERSION = 1
+BATCH_SIZE = 1000       # Logged shots buffered before one transaction writes them
+WIND_BUCKET = 5.0       # mph per wind speed bucket in the error summary
+SECONDS_PER_DAY = 86400
+
+STRING_COLUMNS = ("player_id", "club", "ball_model")
+
+# Table layout; None and NaN are stored as NULL (unset / not measured)
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS shots ("
+    " id INTEGER PRIMARY KEY,"
+    " timestamp REAL NOT NULL,"          # Unix seconds
+    " player_id TEXT,"
+    " club TEXT NOT NULL,"
+    " ball_model TEXT NOT NULL,"
+    " target_yardage REAL,"              # Stock yardage the shot was played at
+    " temperature REAL, altitude REAL, wind_speed REAL, wind_direction REAL,"
+    " predicted_carry REAL, predicted_lateral REAL,"
+    " actual_carry REAL, actual_lateral REAL,"
+    " ball_speed REAL, launch_angle REAL, spin_rate REAL, max_height REAL, land_angle REAL)",
+    # Club / time range queries; altitude is filtered inside the range, and carry
+    # aggregates read only the index
+    "CREATE INDEX IF NOT EXISTS shots_club_time"
+    " ON shots (club, timestamp, altitude, actual_carry, predicted_carry)",
+    "CREATE INDEX IF NOT EXISTS shots_player_club_time ON shots (player_id, club, timestamp)",
+    # Carry error (actual - predicted) moments per club, ball, wind bucket and UTC day,
+    # kept up to date on every write so error distributions never scan the shots;
+    # keyed by wind bucket first so the per-bucket GROUP BY streams without a sort
+    "CREATE TABLE IF NOT EXISTS error_summary ("
+    " club TEXT NOT NULL, ball_model TEXT NOT NULL, wind_bucket INTEGER NOT NULL, day INTEGER NOT NULL,"
+    " count INTEGER NOT NULL, total REAL NOT NULL, total_squares REAL NOT NULL,"
+    " PRIMARY KEY (wind_bucket, club, ball_model, day)) WITHOUT ROWID",
+)
+
+
+@dataclass
+class ShotRecord:
+    """One logged shot; unknown values are None."""
+    club: str
+    ball_model: str = "mid_range"
+    timestamp: Optional[float] = None          # Unix seconds (default: when logged)
+    player_id: Optional[str] = None
+    target_yardage: Optional[float] = None
+    temperature: Optional[float] = None
+    altitude: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_direction: Optional[float] = None
+    predicted_carry: Optional[float] = None    # Model carry in yards
+    predicted_lateral: Optional[float] = None
+    actual_carry: Optional[float] = None       # Measured carry in yards
+    actual_lateral: Optional[float] = None
+    ball_speed: Optional[float] = None         # Launch-monitor measurements (PROFILE_FIELDS)
+    launch_angle: Optional[float] = None
+    spin_rate: Optional[float] = None
+    max_height: Optional[float] = None
+    land_angle: Optional[float] = None
+
+    @classmethod
+    def from_request(cls, request: ShotRequest, result: Optional[ShotResult] = None,
+                     **values: Any) -> "ShotRecord":
+        """A record of a computed shot; values adds the player, measurements or time."""
+        conditions = request.conditions
+        record = cls(club=request.club.lower(), ball_model=request.ball_model,
+                     target_yardage=request.target_yardage,
+                     temperature=conditions.temperature, altitude=conditions.altitude,
+                     wind_speed=conditions.wind_speed, wind_direction=conditions.wind_direction,
+                     **values)
+        if result is not None:
+            record.predicted_carry = result.carry_distance
+            record.predicted_lateral = result.lateral_movement
+        return record
+
+
+COLUMNS = tuple(f.name for f in fields(ShotRecord))
+_INSERT = f"INSERT INTO shots ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+_UPSERT_ERROR = (
+    "INSERT INTO error_summary VALUES (?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (wind_bucket, club, ball_model, day) DO UPDATE SET"
+    " count = count + excluded.count, total = total + excluded.total,"
+    " total_squares = total_squares + excluded.total_squares")
+
+
+def _sql_value(value: Any) -> Any:
+    """Column value for sqlite3: NaN is unset, numpy scalars become Python numbers."""
+    if value is None or isinstance(value, str):
+        return value
+    value = float(value)
+    return None if value != value else value
+
+
+def _stats(count: int, total: float, total_squares: float) -> RunningStats:
+    """RunningStats from count, sum and sum of squares, as SQL aggregates return them."""
+    if not count:
+        return RunningStats()
+    mean = total / count
+    return RunningStats(int(count), mean, max(total_squares - total * mean, 0.0))
+
+
+def wind_bucket(wind_speed: Any) -> Any:
+    """Error summary bucket: 0 for calm or unset, then one per WIND_BUCKET mph; scalar or array."""
+    speed = np.asarray(wind_speed, dtype=float)  # None is NaN, i.e. unset
+    bucket = np.where(speed > 0, np.floor(speed / WIND_BUCKET) + 1, 0).astype(np.int64)
+    return int(bucket) if bucket.ndim == 0 else bucket
+
+
+def _error_summary(club: np.ndarray, ball_model: np.ndarray, wind_speed: np.ndarray,
+                   timestamp: np.ndarray, error: np.ndarray) -> List[Tuple]:
+    """error_summary rows (count, sum, sum of squares) for a batch; NaN errors are skipped."""
+    measured = ~np.isnan(error)
+    if not measured.any():
+        return []
+    # One integer key per (club, ball, wind bucket, day) so grouping is a single integer unique
+    codes = []
+    for values in (club[measured], ball_model[measured], wind_bucket(wind_speed[measured]),
+                   (timestamp[measured] // SECONDS_PER_DAY).astype(np.int64)):
+        labels, code = np.unique(values, return_inverse=True)
+        codes.append((labels, code.ravel()))
+    key = np.zeros(int(measured.sum()), dtype=np.int64)
+    for labels, code in codes:
+        key = key * len(labels) + code
+    unique, inverse = np.unique(key, return_inverse=True)
+    error = error[measured]
+    count = np.bincount(inverse)
+    total = np.bincount(inverse, error)
+    squares = np.bincount(inverse, error * error)
+    parts = []
+    for labels, _ in reversed(codes):
+        parts.append(labels[unique % len(labels)].tolist())
+        unique = unique // len(labels)
+    c, b, w, d = reversed(parts)
+    return list(zip(c, b, w, d, count.tolist(), total.tolist(), squares.tolist()))
+
+
+class ShotHistory:
+    """
+    Every computed and hit shot in an embedded SQLite database.
+
+    log() buffers records and writes BATCH_SIZE of them per transaction, so a
+    logged shot costs a list append; reads flush first and always see every
+    logged shot. Range queries use the (club, time) and (player, club, time)
+    indexes, the former covering carry aggregates such as carry_stats; error
+    distributions read the pre-aggregated error_summary table,
+    and results come back as numpy columns ready for calibration.fit and
+    PlayerProfile. Use as a context manager or call close().
+    """
+
+    def __init__(self, path: str = ":memory:", batch_size: int = BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[Tuple] = []
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # Readers never block the writer; one sync per checkpoint rather than per commit
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"Unsupported shot history schema {version} in {path}")
+        with self._db:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # Writes
+
+    def log(self, record: ShotRecord):
+        """Queue one shot; written with the next batch."""
+        if record.timestamp is None:
+            record.timestamp = time.time()
+        record.club = record.club.lower()
+        with self._lock:
+            self._pending.append(tuple(_sql_value(getattr(record, name)) for name in COLUMNS))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def log_prediction(self, request: ShotRequest, result: ShotResult, **values: Any):
+        """Queue a computed shot; values adds the player, actual carry or measurements."""
+        self.log(ShotRecord.from_request(request, result, **values))
+
+    def log_batch(self, columns: Mapping[str, Any]):
+        """
+        Write a batch of shots from columns keyed by COLUMNS, in one transaction.
+
+        Columns may be scalars or arrays and broadcast to the longest; club is
+        required, missing columns are unset and a missing timestamp is now.
+        """
+        if "club" not in columns:
+            raise ValueError("Shot batch needs a club column")
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown shot columns: {', '.join(sorted(unknown))}")
+        values = dict(columns)
+        values["club"] = np.char.lower(np.asarray(values["club"], dtype=str))
+        values.setdefault("ball_model", "mid_range")
+        values.setdefault("timestamp", time.time())
+        arrays = {name: np.asarray(values[name], dtype=str if name in STRING_COLUMNS else float)
+                  for name in COLUMNS if values.get(name) is not None}
+        size = max(a.size for a in arrays.values())
+        arrays = {name: np.broadcast_to(a, (size,)) for name, a in arrays.items()}
+        # NaN binds as NULL, so numeric columns go to sqlite3 as plain floats
+        rows = list(zip(*(arrays[name].tolist() if name in arrays else [None] * size for name in COLUMNS)))
+        error = (arrays.get("actual_carry", np.full(size, np.nan))
+                 - arrays.get("predicted_carry", np.full(size, np.nan)))
+        summary = _error_summary(arrays["club"], arrays["ball_model"],
+                                 arrays.get("wind_speed", np.full(size, np.nan)), arrays["timestamp"], error)
+        with self._lock:
+            self.flush()
+            self._write(rows, summary)
+
+    def flush(self):
+        """Write every queued shot and its error summary in one transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            column = {name: i for i, name in enumerate(COLUMNS)}
+
+            def values(name: str, dtype: type) -> np.ndarray:
+                return np.array([row[column[name]] for row in rows], dtype=dtype)
+
+            summary = _error_summary(values("club", str), values("ball_model", str),
+                                     values("wind_speed", float), values("timestamp", float),
+                                     values("actual_carry", float) - values("predicted_carry", float))
+            self._write(rows, summary)
+
+    def _write(self, rows: Sequence[Tuple], summary: Sequence[Tuple]):
+        with self._db:
+            self._db.executemany(_INSERT, rows)
+            self._db.executemany(_UPSERT_ERROR, summary)
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+    def __enter__(self) -> "ShotHistory":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM shots").fetchone()[0]
+
+    # Reads
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        with self._lock:
+            self.flush()
+            return self._db.execute(sql, params)
+
+    @staticmethod
+    def _where(club: Optional[str] = None, player_id: Optional[str] = None,
+               ball_model: Optional[str] = None, since: Optional[float] = None,
+               until: Optional[float] = None, days: Optional[float] = None,
+               min_altitude: Optional[float] = None, max_altitude: Optional[float] = None,
+               measured: bool = False) -> Tuple[str, List[Any]]:
+        """WHERE clause and parameters shared by every shot query."""
+        if days is not None:
+            start = time.time() - days * SECONDS_PER_DAY
+            since = start if since is None else max(since, start)
+        terms, params = [], []
+        for column, op, value in (("club", "=", club and club.lower()), ("player_id", "=", player_id),
+                                  ("ball_model", "=", ball_model),
+                                  ("timestamp", ">=", since), ("timestamp", "<", until),
+                                  ("altitude", ">=", min_altitude), ("altitude", "<", max_altitude)):
+            if value is not None:
+                terms.append(f"{column} {op} ?")
+                params.append(value)
+        if measured:
+            terms.append("actual_carry IS NOT NULL")
+        return (" WHERE " + " AND ".join(terms)) if terms else "", params
+
+    def _chunks(self, names: Sequence[str], chunk_rows: Optional[int],
+                **filters: Any) -> Iterator[Dict[str, np.ndarray]]:
+        where, params = self._where(**filters)
+        unknown = set(names) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown shot columns: {', '.join(sorted(unknown))}")
+        strings = [name for name in names if name in STRING_COLUMNS]
+        numbers = [name for name in names if name not in STRING_COLUMNS]
+        cursor = self._execute(f"SELECT {', '.join(strings + numbers)} FROM shots{where} ORDER BY id",
+                               params)
+        first = True
+        while True:
+            rows = cursor.fetchmany(chunk_rows) if chunk_rows else cursor.fetchall()
+            if not rows and not first:
+                return
+            first = False
+            # NULL becomes "" in string columns and NaN in float columns
+            columns = {name: np.array([row[i] or "" for row in rows], dtype=str)
+                       for i, name in enumerate(strings)}
+            data = np.array([row[len(strings):] for row in rows], dtype=float).reshape(len(rows), len(numbers))
+            for i, name in enumerate(numbers):
+                columns[name] = data[:, i]
+            yield {name: columns[name] for name in names}
+            if not chunk_rows or len(rows) < chunk_rows:
+                return
+
+    def query(self, columns: Sequence[str] = COLUMNS, **filters: Any) -> Dict[str, np.ndarray]:
+        """
+        Matching shots as numpy columns, in logging order.
+
+        Args:
+            columns: Columns to return (default: all of COLUMNS)
+            filters: club, player_id, ball_model, since/until (Unix seconds), days
+                (last n days), min_altitude/max_altitude (feet, max exclusive) and
+                measured (only shots with an actual carry)
+
+        Returns:
+            Dict: Column name -> array; NaN / "" where unset
+        """
+        return next(self._chunks(columns, None, **filters))
+
+    def count(self, **filters: Any) -> int:
+        where, params = self._where(**filters)
+        return self._execute(f"SELECT COUNT(*) FROM shots{where}", params).fetchone()[0]
+
+    def carry_stats(self, **filters: Any) -> RunningStats:
+        """Actual carry statistics of the matching shots, e.g. club="7-iron", min_altitude=5000, days=90."""
+        where, params = self._where(measured=True, **filters)
+        row = self._execute("SELECT COUNT(*), SUM(actual_carry), SUM(actual_carry * actual_carry)"
+                            f" FROM shots{where}", params).fetchone()
+        return _stats(row[0], row[1] or 0.0, row[2] or 0.0)
+
+    def error_by_wind(self, club: Optional[str] = None, ball_model: Optional[str] = None,
+                      since: Optional[float] = None, until: Optional[float] = None,
+                      days: Optional[float] = None) -> Dict[int, RunningStats]:
+        """
+        Carry error (actual - predicted, yards) per wind bucket (see wind_bucket).
+
+        Reads error_summary, so the cost depends on the number of buckets and days,
+        not shots. Time filters are applied per whole UTC day.
+        """
+        if days is not None:
+            start = time.time() - days * SECONDS_PER_DAY
+            since = start if since is None else max(since, start)
+        terms, params = [], []
+        for column, op, value in (("club", "=", club and club.lower()), ("ball_model", "=", ball_model),
+                                  ("day", ">=", None if since is None else int(since // SECONDS_PER_DAY)),
+                                  ("day", "<", None if until is None
+                                   else math.ceil(until / SECONDS_PER_DAY))):
+            if value is not None:
+                terms.append(f"{column} {op} ?")
+                params.append(value)
+        where = (" WHERE " + " AND ".join(terms)) if terms else ""
+        rows = self._execute("SELECT wind_bucket, SUM(count), SUM(total), SUM(total_squares)"
+                             f" FROM error_summary{where} GROUP BY wind_bucket ORDER BY wind_bucket",
+                             params).fetchall()
+        return {bucket: _stats(count, total, squares) for bucket, count, total, squares in rows}
+
+    # Calibration and personalization
+
+    def to_shot_table(self, **filters: Any) -> ShotTable:
+        """Measured shots as a calibration.ShotTable, ready for calibration.fit."""
+        names = [f.name for f in fields(ShotTable)]
+        renamed = {"carry": "actual_carry", "lateral": "actual_lateral"}
+        data = self.query([renamed.get(name, name) for name in names], measured=True, **filters)
+        return ShotTable(**{name: data[renamed.get(name, name)] for name in names})
+
+    def club_stats(self, player_id: str, since: Optional[float] = None,
+                   days: Optional[float] = None) -> Dict[str, Dict[str, RunningStats]]:
+        """Per-club statistics of the player's launch-monitor measurements, one indexed query."""
+        where, params = self._where(player_id=player_id, since=since, days=days)
+        aggregates = ", ".join(f"COUNT({name}), SUM({name}), SUM({name} * {name})" for name in PROFILE_FIELDS)
+        rows = self._execute(f"SELECT club, {aggregates} FROM shots{where} GROUP BY club", params).fetchall()
+        return {row[0]: {name: _stats(*(v or 0 for v in row[1 + 3 * i:4 + 3 * i]))
+                         for i, name in enumerate(PROFILE_FIELDS)}
+                for row in rows}
+
+    def profile(self, player_id: str, since: Optional[float] = None,
+                days: Optional[float] = None) -> PlayerProfile:
+        """A PlayerProfile built from the player's logged shots."""
+        return PlayerProfile(player_id, {club: ClubProfile(stats) for club, stats in
+                                         self.club_stats(player_id, since, days).items()})
+
+    def merge_into(self, profile: PlayerProfile, since: Optional[float] = None,
+                   days: Optional[float] = None):
+        """Fold the player's logged shots into an existing profile."""
+        profile.merge(self.club_stats(profile.player_id, since, days))
+
+    # Export
+
+    def export(self, path: str, columns: Sequence[str] = COLUMNS, chunk_rows: int = 100_000,
+               **filters: Any) -> int:
+        """
+        Write matching shots to Parquet, Arrow IPC or CSV (by extension), one
+        chunk_rows chunk in memory at a time.
+
+        Returns:
+            int: Rows written
+        """
+        format = FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Unknown export format: {path}")
+        if format != "csv" and pa is None:
+            raise ImportError(f"pyarrow is required to write {format} files")
+        rows = 0
+        writer = None
+        csv_file = None
+        try:
+            for chunk in self._chunks(columns, chunk_rows, **filters):
+                rows += len(chunk[columns[0]])
+                if format == "csv":
+                    if csv_file is None:
+                        csv_file = open(path, "w", newline="")
+                        writer = csv.writer(csv_file)
+                        writer.writerow(columns)
+                    writer.writerows(zip(*(csv_values(chunk[name], "string" if name in STRING_COLUMNS
+                                                      else "float64") for name in columns)))
+                    continue
+                table = pa.table(chunk)
+                if writer is None:
+                    writer = (pa.parquet.ParquetWriter(path, table.schema) if format == "parquet"
+                              else pa.ipc.new_file(path, table.schema))
+                writer.write_table(table)
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+            elif writer is not None:
+                writer.close()
+        return rows
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from shot_history import ShotHistory, ShotRecord, wind_bucket, SECONDS_PER_DAY
+
+START = 1_700_000_000.0
+CLUBS = np.array(["driver", "7-iron", "pitching-wedge"])
+
+
+def _shots(n: int = 2000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    predicted = rng.uniform(100, 260, n)
+    wind = rng.uniform(0, 30, n)
+    wind[rng.random(n) < 0.2] = np.nan  # Unset wind
+    actual = predicted + rng.normal(0, 4, n) - 0.2 * np.nan_to_num(wind)
+    actual[rng.random(n) < 0.1] = np.nan  # Not measured
+    return {
+        "timestamp": START + rng.uniform(0, 10 * SECONDS_PER_DAY, n),
+        "club": rng.choice(CLUBS, n),
+        "ball_model": rng.choice(["mid_range", "tour_premium"], n),
+        "altitude": rng.uniform(0, 8000, n),
+        "wind_speed": wind,
+        "wind_direction": rng.uniform(0, 360, n),
+        "predicted_carry": predicted,
+        "actual_carry": actual,
+    }
+
+
+def _history(shots) -> ShotHistory:
+    history = ShotHistory(batch_size=64)
+    half = len(shots["club"]) // 2
+    # Half through the columnar path, half through single records and the buffer
+    history.log_batch({name: values[:half] for name, values in shots.items()})
+    for i in range(half, len(shots["club"])):
+        history.log(ShotRecord(**{name: values[i].item() for name, values in shots.items()}))
+    return history
+
+
+def _assert_stats(stats, values):
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.variance == pytest.approx(values.var(ddof=1), rel=1e-6)
+
+
+def test_error_by_wind_matches_the_shots():
+    shots = _shots()
+    with _history(shots) as history:
+        error = shots["actual_carry"] - shots["predicted_carry"]
+        measured = ~np.isnan(error)
+        buckets = wind_bucket(shots["wind_speed"])
+
+        by_wind = history.error_by_wind()
+        assert sorted(by_wind) == sorted(set(buckets[measured].tolist()))
+        for bucket, stats in by_wind.items():
+            _assert_stats(stats, error[measured & (buckets == bucket)])
+
+        # Time filters apply per whole UTC day
+        since, until = START + 2 * SECONDS_PER_DAY, START + 5 * SECONDS_PER_DAY
+        day = shots["timestamp"] // SECONDS_PER_DAY
+        selected = (measured & (shots["club"] == "7-iron") & (shots["ball_model"] == "mid_range")
+                    & (day >= since // SECONDS_PER_DAY) & (day < np.ceil(until / SECONDS_PER_DAY)))
+        filtered = history.error_by_wind(club="7-Iron", ball_model="mid_range", since=since, until=until)
+        assert sum(s.count for s in filtered.values()) == selected.sum()
+        for bucket, stats in filtered.items():
+            _assert_stats(stats, error[selected & (buckets == bucket)])
+
+
+def test_carry_stats_matches_the_shots():
+    shots = _shots(seed=1)
+    with _history(shots) as history:
+        assert len(history) == len(shots["club"])
+        measured = ~np.isnan(shots["actual_carry"])
+        _assert_stats(history.carry_stats(), shots["actual_carry"][measured])
+
+        since = START + 3 * SECONDS_PER_DAY
+        selected = (measured & (shots["club"] == "driver") & (shots["altitude"] >= 5000)
+                    & (shots["timestamp"] >= since))
+        stats = history.carry_stats(club="DRIVER", min_altitude=5000, since=since)
+        _assert_stats(stats, shots["actual_carry"][selected])
+        assert history.count(club="driver", min_altitude=5000, since=since, measured=True) == selected.sum()
+
+        assert history.carry_stats(club="sand-wedge").count == 0
+
+
+def test_wind_bucket():
+    assert wind_bucket(None) == 0
+    assert wind_bucket(0.0) == 0
+    assert wind_bucket(0.1) == 1
+    assert wind_bucket(12.0) == 3
+    assert wind_bucket([np.nan, 4.9, 5.0]).tolist() == [0, 1, 2]
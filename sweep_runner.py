@@ -0,0 +1,190 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced
+from results_writer import INPUT_SCHEMA, open_results_writer
+
+INPUT_COLUMNS = tuple(name for name, _ in INPUT_SCHEMA)
+
+
+@dataclass
+class SweepSpec:
+    """Full cartesian product of conditions, balls, clubs and targets."""
+    temperatures: Sequence[float] = (70,)
+    altitudes: Sequence[float] = (0,)
+    wind_speeds: Sequence[float] = (0,)
+    wind_directions: Sequence[float] = (0,)
+    ball_models: Sequence[str] = ("mid_range",)
+    clubs: Sequence[str] = ("driver", "3-wood", "5-iron", "7-iron", "pitching-wedge")
+    target_yardages: Sequence[float] = (150,)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(len(axis) for axis in self.axes())
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def axes(self) -> Tuple[Sequence, ...]:
+        """Axes in INPUT_COLUMNS order; the last axis varies fastest."""
+        return (self.temperatures, self.altitudes, self.wind_speeds, self.wind_directions,
+                self.ball_models, self.clubs, self.target_yardages)
+
+    def rows(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Input columns for flat row indices [start, stop) of the product."""
+        index = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: np.asarray(axis)[i] for name, axis, i in zip(INPUT_COLUMNS, self.axes(), index)}
+
+
+@dataclass
+class SweepSummary:
+    path: str
+    rows: int
+    seconds: float
+    workers: int
+    chunks: int = 0
+    rows_per_second: float = field(init=False)
+
+    def __post_init__(self):
+        self.rows_per_second = self.rows / self.seconds if self.seconds else 0.0
+
+
+class ProgressReporter:
+    """Rows done, throughput and ETA on one updating stderr line."""
+
+    def __init__(self, total: int, stream=None, interval: float = 0.5):
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.interval = interval  # Seconds between redraws
+        self.start = time.perf_counter()
+        self._last_draw = 0.0
+
+    def __call__(self, done: int):
+        now = time.perf_counter()
+        if done < self.total and now - self._last_draw < self.interval:
+            return
+        self._last_draw = now
+        elapsed = now - self.start
+        rate = done / elapsed if elapsed else 0.0
+        eta = (self.total - done) / rate if rate else float("inf")
+        self.stream.write(f"\r{done:,}/{self.total:,} rows ({100 * done / self.total:5.1f}%) "
+                          f"{rate:,.0f} rows/s  ETA {eta:6.1f}s")
+        if done >= self.total:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+# Each worker process builds its model once and reuses it for every chunk
+_worker_model: Optional[YardageModelEnhanced] = None
+
+
+def _init_worker(model_class: type):
+    global _worker_model
+    _worker_model = model_class()
+
+
+def _run_chunk(spec: SweepSpec, encode: Callable[[Dict[str, np.ndarray]], Any],
+               start: int, stop: int) -> Tuple[int, Any]:
+    """
+    Evaluate rows [start, stop) with one batch call.
+
+    Returns the row count and the rows already encoded for the results writer.
+    CSV formatting costs more than the model itself, so it happens here in the
+    worker and the parent only appends bytes.
+    """
+    rows = spec.rows(start, stop)
+    result = _worker_model.calculate_adjusted_yardage_batch(
+        rows["target_yardage"], rows["club"],
+        rows["temperature"], rows["altitude"], rows["wind_speed"], rows["wind_direction"],
+        rows["ball_model"])
+    rows["carry_distance"] = result.carry_distance
+    rows["lateral_movement"] = result.lateral_movement
+    return stop - start, encode(rows)
+
+
+def _chunks(total: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, total, chunk_size):
+        yield start, min(start + chunk_size, total)
+
+
+def run_sweep(spec: SweepSpec, path: str, workers: Optional[int] = None,
+              chunk_size: int = 50_000, model_class: type = YardageModelEnhanced,
+              progress: Optional[Callable[[int], None]] = None,
+              show_progress: bool = True, format: Optional[str] = None) -> SweepSummary:
+    """
+    Evaluate every point of a sweep across worker processes and stream rows to disk.
+
+    The product is split into contiguous chunks of flat row indices; workers
+    rebuild their rows from the spec, so only two integers travel to each task.
+    At most two chunks per worker are in flight, and finished chunks are written
+    in completion order, so memory stays bounded by the chunk size.
+
+    Args:
+        spec: Conditions, balls, clubs and targets to sweep
+        path: Output path; Parquet, Arrow IPC or CSV by extension (see open_results_writer)
+        workers: Worker processes (default: os.cpu_count())
+        chunk_size: Rows per task
+        model_class: Model with the YardageModelEnhanced batch API, built once per worker
+        progress: Called with the number of rows written after each chunk
+        show_progress: Draw a progress/ETA line on stderr when no callback is given
+        format: Override the output format inferred from the path
+
+    Returns:
+        SweepSummary: Output path, row count and throughput
+    """
+    workers = workers or os.cpu_count() or 1
+    total = spec.size
+    if progress is None and show_progress:
+        progress = ProgressReporter(total)
+
+    start_time = time.perf_counter()
+    done = 0
+    chunks = 0
+    tasks = _chunks(total, chunk_size)
+    with open_results_writer(path, format, row_group_size=chunk_size) as writer, \
+            ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_class,)) as pool:
+        encode = type(writer).encode
+        pending = set()
+        while True:
+            while len(pending) < 2 * workers:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                pending.add(pool.submit(_run_chunk, spec, encode, *task))
+            if not pending:
+                break
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                count, data = future.result()
+                writer.write_encoded(data, count)
+                done += count
+                chunks += 1
+                if progress:
+                    progress(done)
+
+    return SweepSummary(path=writer.path, rows=done, seconds=time.perf_counter() - start_time,
+                        workers=workers, chunks=chunks)
+
+
+if __name__ == "__main__":
+    # Calibration sweep over the full condition range
+    summary = run_sweep(
+        SweepSpec(
+            temperatures=range(30, 111, 5),
+            altitudes=range(0, 9001, 500),
+            wind_speeds=range(0, 31, 5),
+            wind_directions=range(0, 360, 15),
+            ball_models=tuple(YardageModelEnhanced.BALL_MODELS),
+            target_yardages=range(100, 301, 25),
+        ),
+        sys.argv[1] if len(sys.argv) > 1 else "sweep_results.parquet",
+    )
+    print(f"{summary.rows:,} rows in {summary.seconds:.1f}s "
+          f"({summary.rows_per_second:,.0f} rows/s) -> {summary.path}")
@@ -0,0 +1,184 @@
+import hashlib
+import mmap
+import struct
+import zlib
+from dataclasses import asdict, is_dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# File layout (little-endian):
+#   header   magic, schema version, array count, source fingerprint, payload CRC32, metadata size
+#   index    one entry per array: name, ndim, shape, payload offset
+#   metadata NUL-separated UTF-8 key/value pairs
+#   payload  float32 arrays, each aligned to PAYLOAD_ALIGNMENT bytes
+MAGIC = b"YDTB"
+SCHEMA_VERSION = 1
+MAX_DIMS = 8
+PAYLOAD_ALIGNMENT = 64
+
+HEADER = struct.Struct("<4sHH32sII")
+INDEX_ENTRY = struct.Struct(f"<32sB3x{MAX_DIMS}IQ")
+PAYLOAD_DTYPE = np.dtype("<f4")
+
+
+class StaleTableError(ValueError):
+    """Raised when a table was built from different model constants than the running code."""
+
+
+def model_fingerprint(model) -> bytes:
+    """SHA-256 over the lookup tables and factors a precomputed table depends on."""
+    digest = hashlib.sha256(type(model).__name__.encode())
+    for name in ("CLUB_DATABASE", "BALL_MODELS", "ALTITUDE_EFFECTS",
+                 "AIR_DENSITY_TABLE", "SPIN_DECAY_RATES", "WIND_GRADIENTS"):
+        table = getattr(model, name, None)
+        if table is None:
+            continue
+        entries = sorted((str(k), asdict(v) if is_dataclass(v) else v) for k, v in table.items())
+        digest.update(name.encode())
+        digest.update(repr(entries).encode())
+    for name in getattr(model, "WIND_FACTORS", ()):
+        value = getattr(model, name, None)
+        if value is not None:
+            digest.update(f"{name}:{value!r}".encode())
+    for name in ("ALTITUDE_EFFECT_LOOKUP", "AIR_DENSITY_LOOKUP"):
+        lookup = getattr(model, name, None)
+        if lookup is not None:
+            digest.update(f"{name}:{lookup.extrapolation}:{lookup.fill_value}".encode())
+    return digest.digest()
+
+
+def _align(offset: int) -> int:
+    return (offset + PAYLOAD_ALIGNMENT - 1) // PAYLOAD_ALIGNMENT * PAYLOAD_ALIGNMENT
+
+
+def write_table(path: str, arrays: Dict[str, np.ndarray],
+                fingerprint: bytes = b"", metadata: Optional[Dict[str, str]] = None):
+    """
+    Write float32 arrays and string metadata to a memory-mappable table file.
+
+    Args:
+        path: Output file path
+        arrays: Named arrays (names up to 32 UTF-8 bytes), stored as float32 with up to MAX_DIMS dimensions
+        fingerprint: Source model fingerprint checked when the table is opened
+        metadata: String key/value pairs (axis definitions, club names, ...)
+    """
+    metadata = metadata or {}
+    meta_bytes = b"\0".join(f"{k}\0{v}".encode() for k, v in metadata.items())
+    payloads = [np.ascontiguousarray(a, dtype=PAYLOAD_DTYPE) for a in arrays.values()]
+
+    offset = _align(HEADER.size + INDEX_ENTRY.size * len(arrays) + len(meta_bytes))
+    index = b""
+    offsets = []
+    for name, payload in zip(arrays, payloads):
+        if payload.ndim > MAX_DIMS:
+            raise ValueError(f"Array {name} has more than {MAX_DIMS} dimensions")
+        shape = list(payload.shape) + [0] * (MAX_DIMS - payload.ndim)
+        encoded = name.encode()
+        if len(encoded) > 32:
+            raise ValueError(f"Array name {name!r} is longer than 32 bytes")
+        index += INDEX_ENTRY.pack(encoded, payload.ndim, *shape, offset)
+        offsets.append(offset)
+        offset = _align(offset + payload.nbytes)
+
+    crc = 0
+    for payload in payloads:
+        crc = zlib.crc32(payload.tobytes(), crc)
+    header = HEADER.pack(MAGIC, SCHEMA_VERSION, len(arrays), fingerprint.ljust(32, b"\0"),
+                         crc, len(meta_bytes))
+
+    with open(path, "wb") as f:
+        f.write(header + index + meta_bytes)
+        for start, payload in zip(offsets, payloads):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(payload.tobytes())
+
+
+class TableFile:
+    """
+    Read-only memory-mapped view of a table written by write_table.
+
+    Arrays are zero-copy NumPy views onto the shared mapping, so every process
+    that opens the same file shares its pages through the OS page cache.
+    """
+
+    def __init__(self, path: str, expected_fingerprint: Optional[bytes] = None, verify: bool = False):
+        """
+        Args:
+            path: Table file to open
+            expected_fingerprint: Raise StaleTableError unless the stored fingerprint matches
+            verify: Check the payload CRC32 (touches every page)
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            entries = self._validate(expected_fingerprint, verify)
+        except Exception:
+            # No views exist yet, so the mapping can always be released here
+            self._mmap.close()
+            raise
+
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, shape, offset, size in entries:
+            view = np.frombuffer(self._mmap, dtype=PAYLOAD_DTYPE, count=size, offset=offset)
+            self.arrays[name] = view.reshape(shape)
+
+    def _validate(self, expected_fingerprint: Optional[bytes],
+                  verify: bool) -> List[Tuple[str, tuple, int, int]]:
+        """Check the header, index and (optionally) checksum; returns (name, shape, offset, size) per array."""
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"Not a yardage table: {self.path}")
+        magic, version, count, fingerprint, crc, meta_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a yardage table: {self.path}")
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported table schema version {version} (expected {SCHEMA_VERSION})")
+        self.version = version
+        self.fingerprint = fingerprint
+        if expected_fingerprint is not None and fingerprint != expected_fingerprint.ljust(32, b"\0"):
+            raise StaleTableError(f"{self.path} was built from different model tables; rebuild it")
+
+        entries = []
+        position = HEADER.size
+        if position + INDEX_ENTRY.size * count + meta_size > len(self._mmap):
+            raise ValueError(f"Truncated table index in {self.path}")
+        for _ in range(count):
+            name, ndim, *rest = INDEX_ENTRY.unpack_from(self._mmap, position)
+            shape, offset = tuple(rest[:ndim]), rest[MAX_DIMS]
+            size = int(np.prod(shape)) if shape else 1
+            if offset + size * PAYLOAD_DTYPE.itemsize > len(self._mmap):
+                raise ValueError(f"Truncated table payload in {self.path}")
+            entries.append((name.rstrip(b"\0").decode(), shape, offset, size))
+            position += INDEX_ENTRY.size
+
+        fields = bytes(self._mmap[position:position + meta_size]).decode().split("\0") if meta_size else []
+        self.metadata: Dict[str, str] = dict(zip(fields[::2], fields[1::2]))
+
+        if verify:
+            # Slices copy out of the mapping, so a mismatch leaves nothing holding it open
+            actual = 0
+            for _, _, offset, size in entries:
+                actual = zlib.crc32(self._mmap[offset:offset + size * PAYLOAD_DTYPE.itemsize], actual)
+            if actual != crc:
+                raise ValueError(f"Checksum mismatch in {self.path}; the file is corrupt")
+        return entries
+
+    def close(self):
+        """
+        Unmap the file; the descriptor is released with the mapping.
+
+        Raises BufferError while arrays taken from the table are still referenced.
+        """
+        self.arrays = {}
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def __enter__(self) -> "TableFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from table_store import (TableFile, write_table, model_fingerprint, StaleTableError, HEADER, INDEX_ENTRY)
+from yardage_model_enhanced import YardageModelEnhanced
+
+ARRAYS = {"carry": np.arange(24, dtype=float).reshape(2, 3, 4), "scale": np.array([1.5]),
+          "empty": np.zeros((0, 3))}
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "table.bin")
+    write_table(path, ARRAYS, fingerprint=b"abc", metadata={"clubs": "driver,7-iron", "axis": "0:1"})
+    return path
+
+
+def _corrupt(path, position, value=b"\xff"):
+    with open(path, "r+b") as f:
+        f.seek(position)
+        f.write(value)
+
+
+def test_round_trip(path):
+    with TableFile(path, expected_fingerprint=b"abc", verify=True) as table:
+        assert set(table.arrays) == set(ARRAYS)
+        for name, values in ARRAYS.items():
+            np.testing.assert_array_equal(table[name], values.astype(np.float32))
+        assert table.metadata == {"clubs": "driver,7-iron", "axis": "0:1"}
+        assert table["carry"].ctypes.data % 64 == 0
+        assert not table["carry"].flags.writeable
+    assert table._mmap.closed and table.arrays == {}
+
+
+def test_stale_fingerprint_is_rejected(path):
+    with pytest.raises(StaleTableError):
+        TableFile(path, expected_fingerprint=b"abd")
+    model = YardageModelEnhanced()
+    fingerprint = model_fingerprint(model)
+    model.set_extrapolation("clamp")
+    assert model_fingerprint(model) != fingerprint
+    assert model_fingerprint(YardageModelEnhanced()) == fingerprint
+
+
+def _corrupt_payload(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    _corrupt(path, data.index(np.float32(23.0).tobytes()))  # Last value of "carry"
+
+
+def test_corrupt_payload_fails_the_checksum(path):
+    _corrupt_payload(path)
+    TableFile(path).close()  # Unverified opens do not read the payload
+    with pytest.raises(ValueError, match="Checksum"):
+        TableFile(path, verify=True)
+
+
+@pytest.mark.parametrize("position, value", [(0, b"XXXX"), (4, b"\x09\x00")])
+def test_bad_header_is_rejected(path, position, value):
+    _corrupt(path, position, value)
+    with pytest.raises(ValueError):
+        TableFile(path)
+
+
+def test_truncated_file_is_rejected(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    for size in (HEADER.size - 1, HEADER.size + INDEX_ENTRY.size, len(data) - 4):
+        with open(path, "wb") as f:
+            f.write(data[:size])
+        with pytest.raises(ValueError):
+            TableFile(path)
+
+
+def test_failed_validation_releases_the_mapping(path, monkeypatch):
+    opened = []
+    original = TableFile._validate
+
+    def validate(self, *args):
+        opened.append(self._mmap)
+        return original(self, *args)
+
+    monkeypatch.setattr(TableFile, "_validate", validate)
+    with pytest.raises(StaleTableError):
+        TableFile(path, expected_fingerprint=b"other")
+    _corrupt_payload(path)
+    with pytest.raises(ValueError):
+        TableFile(path, verify=True)
+    assert len(opened) == 2 and all(m.closed for m in opened)
+
+
+def test_long_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="32 bytes"):
+        write_table(str(tmp_path / "t.bin"), {"x" * 33: np.zeros(2)})
+    with pytest.raises(ValueError):
+        write_table(str(tmp_path / "t.bin"), {"é" * 17: np.zeros(2)})  # 34 bytes in UTF-8
+    write_table(str(tmp_path / "t.bin"), {"x" * 32: np.zeros(2)})
+    with TableFile(str(tmp_path / "t.bin")) as table:
+        assert list(table.arrays) == ["x" * 32]
+
+
+def test_close_refuses_while_arrays_are_referenced(path):
+    table = TableFile(path)
+    carry = table["carry"]
+    with pytest.raises(BufferError):
+        table.close()
+    del carry
+    table.close()
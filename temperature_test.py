@@ -1,72 +1,89 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Temperature test conditions
+CONDITIONS = [
+    {
+        "name": "Very Cold",
+        "temp": 40
+    },
+    {
+        "name": "Cold",
+        "temp": 50
+    },
+    {
+        "name": "Cool Morning",
+        "temp": 60
+    },
+    {
+        "name": "Standard",
+        "temp": 70
+    },
+    {
+        "name": "Warm",
+        "temp": 80
+    },
+    {
+        "name": "Hot",
+        "temp": 90
+    },
+    {
+        "name": "Very Hot",
+        "temp": 100
+    },
+    {
+        "name": "Desert Hot",
+        "temp": 105
+    },
+    {
+        "name": "Early Morning",
+        "temp": 45
+    },
+    {
+        "name": "Late Evening",
+        "temp": 65
+    }
+]
+
+CLUBS = {
+    "driver": 300,
+    "7-iron": 180,
+    "pitching-wedge": 140
+}
+
+BALL_MODEL = "tour_premium"
+ALTITUDE = 0  # Sea level
+WIND_SPEED = 0  # No wind
+WIND_DIRECTION = 0
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_temperature_conditions."""
+    return [
+        (f"{club_name}/{condition['name']}",
+         ShotRequest(target_distance, club_name,
+                     Conditions(condition["temp"], ALTITUDE, WIND_SPEED, WIND_DIRECTION),
+                     BALL_MODEL, SkillLevel.PROFESSIONAL))
+        for club_name, target_distance in CLUBS.items() for condition in CONDITIONS
+    ]
+
 
 def test_temperature_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test temperature effects with no wind and sea level altitude."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Temperature test conditions
-    conditions = [
-        {
-            "name": "Very Cold",
-            "temp": 40
-        },
-        {
-            "name": "Cold",
-            "temp": 50
-        },
-        {
-            "name": "Cool Morning",
-            "temp": 60
-        },
-        {
-            "name": "Standard",
-            "temp": 70
-        },
-        {
-            "name": "Warm",
-            "temp": 80
-        },
-        {
-            "name": "Hot",
-            "temp": 90
-        },
-        {
-            "name": "Very Hot",
-            "temp": 100
-        },
-        {
-            "name": "Desert Hot",
-            "temp": 105
-        },
-        {
-            "name": "Early Morning",
-            "temp": 45
-        },
-        {
-            "name": "Late Evening",
-            "temp": 65
-        }
-    ]
-    
-    clubs = {
-        "driver": 300,
-        "7-iron": 180,
-        "pitching-wedge": 140
-    }
-    
-    for club_name, target_distance in clubs.items():
+    for club_name, target_distance in CLUBS.items():
         club_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
                 temperature=condition["temp"],
-                altitude=0,     # Sea level
-                wind_speed=0,   # No wind
-                wind_direction=0
+                altitude=ALTITUDE,
+                wind_speed=WIND_SPEED,
+                wind_direction=WIND_DIRECTION
             )
             
             result = model.calculate_adjusted_yardage(
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from trajectory_batch import BatchTrajectorySimulator, LaunchPerturbations
+from trajectory_engine import TrajectoryEngine, density_at
+from yardage_model_enhanced import YardageModelEnhanced
+
+MODEL = YardageModelEnhanced()
+BALL = MODEL.BALL_MODELS["mid_range"]
+FINE = TrajectoryEngine(tolerance=1e-6)
+
+
+@pytest.mark.parametrize("club", ["driver", "7-iron", "pitching-wedge"])
+@pytest.mark.parametrize("wind_speed, wind_direction", [(0, 0), (15, 45), (10, 180)])
+def test_matches_fine_step_engine(club, wind_speed, wind_direction):
+    conditions = dict(temperature=85, altitude=5000, wind_speed=wind_speed, wind_direction=wind_direction)
+    expected = FINE.simulate_club(MODEL.CLUB_DATABASE[club], BALL, **conditions)
+    result = BatchTrajectorySimulator().simulate_club(MODEL.CLUB_DATABASE[club], BALL, n=1, **conditions)
+    assert len(result) == 1
+    assert result.carry_distance[0] == pytest.approx(expected.carry_distance, abs=0.05)
+    assert result.lateral_movement[0] == pytest.approx(expected.lateral_movement, abs=0.05)
+    assert result.max_height[0] == pytest.approx(expected.max_height, abs=0.05)
+    assert result.flight_time[0] == pytest.approx(expected.flight_time, abs=0.01)
+    assert result.land_angle[0] == pytest.approx(expected.land_angle, abs=0.05)
+
+
+def test_lockstep_flights_match_flights_run_alone():
+    # Short and long flights together: balls landing early are retired mid-run
+    simulator = BatchTrajectorySimulator(dtype=np.float64)
+    launch = dict(ball_speed=[60.0, 165.0, 120.0, 100.0], launch_angle=[40.0, 11.0, 16.0, 25.0],
+                  spin_rate=[9000.0, 2600.0, 7000.0, 8500.0], spin_decay=0.04,
+                  density=[1.2, 1.1, 1.225, 1.0], wind_speed=[0.0, 10.0, 5.0, 20.0],
+                  wind_direction=[0.0, 90.0, 200.0, 330.0], launch_direction=[0.0, -2.0, 1.0, 0.0],
+                  spin_axis=[0.0, 5.0, -10.0, 0.0])
+    together = simulator.simulate(**launch)
+    for i in range(4):
+        alone = simulator.simulate(**{k: v[i] if isinstance(v, list) else v for k, v in launch.items()})
+        for name in ("carry_distance", "lateral_movement", "max_height", "flight_time", "land_angle"):
+            assert getattr(together, name)[i] == pytest.approx(getattr(alone, name)[0], rel=1e-9)
+    assert together.flight_time[0] < together.flight_time[1]
+
+
+def test_perturbations_and_conditions_per_ball():
+    club = MODEL.CLUB_DATABASE["7-iron"]
+    simulator = BatchTrajectorySimulator()
+    stock = simulator.simulate_club(club, BALL, n=3)
+    np.testing.assert_array_equal(stock.carry_distance, stock.carry_distance[0])
+
+    spread = simulator.simulate_club(club, BALL, LaunchPerturbations(
+        ball_speed=np.array([-5.0, 0.0, 5.0]), launch_direction=np.array([0.0, 0.0, 0.0]),
+        spin_axis=np.array([-8.0, 0.0, 8.0])))
+    assert spread.carry_distance[0] < spread.carry_distance[1] < spread.carry_distance[2]
+    assert spread.lateral_movement[0] < 0 < spread.lateral_movement[2]
+    assert spread.carry_distance[1] == stock.carry_distance[0]
+
+    windows = simulator.simulate_club(club, BALL, n=3, altitude=np.array([0.0, 5000.0, 5000.0]),
+                                      humidity=np.array([np.nan, np.nan, 90.0]))
+    assert windows.carry_distance[0] < windows.carry_distance[1] < windows.carry_distance[2]
+    density = density_at(70.0, np.array([0.0, 5000.0, 5000.0]), humidity=np.array([np.nan, np.nan, 90.0]))
+    np.testing.assert_array_equal(simulator.simulate_club(club, BALL, n=3, density=density).carry_distance,
+                                  windows.carry_distance)
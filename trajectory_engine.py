@@ -0,0 +1,357 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import (
+    YardageModelEnhanced, ShotResult, BatchShotResult, ClubData, BallModel, ArrayLike,
+    ShotRequest
+)
+from club_selection import ClubCarryIndex
+from air_density import REFERENCE_TEMPERATURE, REFERENCE_ALTITUDE, air_density as moist_air_density
+
+# Ball properties (USGA limits) from implementation-guide.md
+BALL_MASS = 0.04593      # kg
+BALL_RADIUS = 0.021335   # m
+BALL_AREA = math.pi * BALL_RADIUS ** 2
+
+GRAVITY = 9.80665        # m/s²
+MPH_TO_MS = 0.44704
+M_TO_YARDS = 1.0936133
+RPM_TO_RAD_S = 2 * math.pi / 60
+
+# Aerodynamic coefficients fitted to the wind tunnel tables in validation-data.md
+DRAG_BASE = 0.171        # Cd at zero spin
+DRAG_SPIN = 0.62         # Cd increase per unit spin factor
+LIFT_BASE = 0.083        # Cl intercept
+LIFT_SPIN = 0.885        # Cl increase per unit spin factor
+LIFT_MAX = 0.35          # Cl saturation
+
+# Ball core temperature effect on launch speed, scaled by BallModel.temp_sensitivity
+BALL_TEMP_SPEED_COEFF = 0.001  # per °F from 70°F
+
+# State layout: x (downrange), y (height), z (lateral, + is right), vx, vy, vz, spin (rad/s)
+State = Tuple[float, float, float, float, float, float, float]
+
+
+@dataclass
+class TrajectoryResult:
+    carry_distance: float    # Carry in yards
+    lateral_movement: float  # Lateral offset at landing in yards (+ is right, - is left)
+    max_height: float        # Apex in yards
+    flight_time: float       # Seconds
+    land_angle: float        # Descent angle in degrees
+    steps: int               # Accepted integration steps
+
+
+def density_at(temperature: float, altitude: float, *, pressure: Optional[float] = None,
+               humidity: Optional[float] = None) -> float:
+    """
+    Air density in kg/m³ for a temperature (°F) and altitude (ft); standard-atmosphere
+    pressure and dry air unless station pressure (hPa) and relative humidity (%) are given.
+    Named apart from air_density.air_density, whose positional order differs.
+    """
+    return moist_air_density(temperature, pressure=pressure, humidity=humidity, altitude=altitude)
+
+
+def wind_speed_at_height(ground_speed: float, height_m: float) -> float:
+    """Wind profile from implementation-guide.md (heights converted to feet)."""
+    height_ft = height_m * 3.28084
+    if height_ft <= 0:
+        return ground_speed * 0.7
+    elif height_ft < 30:
+        return ground_speed * (0.7 + 0.3 * height_ft / 30)
+    else:
+        return ground_speed * (1 + 0.1 * math.log(height_ft / 30))
+
+
+class TrajectoryEngine:
+    """
+    Adaptive RK4 integrator for a spinning golf ball with drag, Magnus lift and
+    exponential spin decay, following detailed-ball-flight/implementation-guide.md.
+
+    Step size is controlled by step doubling: each step is taken once at dt and
+    twice at dt/2, and the difference drives the next dt. Integration stops at
+    ground contact, with the landing point found by a final partial step.
+    """
+
+    def __init__(self, tolerance: float = 0.01, initial_step: float = 0.1,
+                 min_step: float = 1e-3, max_step: float = 0.5, max_time: float = 15.0):
+        self.tolerance = tolerance        # Allowed position error per step in metres
+        self.initial_step = initial_step  # Seconds
+        self.min_step = min_step
+        self.max_step = max_step
+        self.max_time = max_time
+
+    @staticmethod
+    def _derivatives(state: State, k_air: float, spin_decay: float,
+                     axis_y: float, axis_z: float,
+                     wind_x: float, wind_z: float) -> State:
+        """Accelerations from gravity, drag and Magnus lift for the current state."""
+        _, y, _, vx, vy, vz, spin = state
+        # Air velocity relative to the ball, using the wind at the ball's height
+        if wind_x or wind_z:
+            gradient = wind_speed_at_height(1.0, y)
+            rx = vx - wind_x * gradient
+            rz = vz - wind_z * gradient
+        else:
+            rx = vx
+            rz = vz
+        speed = math.sqrt(rx * rx + vy * vy + rz * rz)
+        if speed == 0:
+            return (vx, vy, vz, 0.0, -GRAVITY, 0.0, -spin_decay * spin)
+
+        spin_factor = BALL_RADIUS * spin / speed
+        drag = DRAG_BASE + DRAG_SPIN * spin_factor
+        lift = min(LIFT_BASE + LIFT_SPIN * spin_factor, LIFT_MAX)
+
+        # Drag opposes relative velocity; lift follows spin axis × relative velocity
+        # with the spin axis (0, axis_y, axis_z)
+        drag_k = k_air * drag * speed
+        lift_k = k_air * lift * speed
+        return (
+            vx, vy, vz,
+            -drag_k * rx + lift_k * (axis_y * rz - axis_z * vy),
+            -drag_k * vy + lift_k * axis_z * rx - GRAVITY,
+            -drag_k * rz - lift_k * axis_y * rx,
+            -spin_decay * spin,
+        )
+
+    def _rk4_step(self, state: State, dt: float, params: tuple, k1: State) -> State:
+        """Classic fourth-order Runge-Kutta step, given the derivatives k1 at state."""
+        d = self._derivatives
+        x, y, z, vx, vy, vz, w = state
+        h = dt / 2
+        k2 = d((x + k1[0] * h, y + k1[1] * h, z + k1[2] * h, vx + k1[3] * h,
+                vy + k1[4] * h, vz + k1[5] * h, w + k1[6] * h), *params)
+        k3 = d((x + k2[0] * h, y + k2[1] * h, z + k2[2] * h, vx + k2[3] * h,
+                vy + k2[4] * h, vz + k2[5] * h, w + k2[6] * h), *params)
+        k4 = d((x + k3[0] * dt, y + k3[1] * dt, z + k3[2] * dt, vx + k3[3] * dt,
+                vy + k3[4] * dt, vz + k3[5] * dt, w + k3[6] * dt), *params)
+        s = dt / 6
+        return (
+            x + (k1[0] + 2 * (k2[0] + k3[0]) + k4[0]) * s,
+            y + (k1[1] + 2 * (k2[1] + k3[1]) + k4[1]) * s,
+            z + (k1[2] + 2 * (k2[2] + k3[2]) + k4[2]) * s,
+            vx + (k1[3] + 2 * (k2[3] + k3[3]) + k4[3]) * s,
+            vy + (k1[4] + 2 * (k2[4] + k3[4]) + k4[4]) * s,
+            vz + (k1[5] + 2 * (k2[5] + k3[5]) + k4[5]) * s,
+            w + (k1[6] + 2 * (k2[6] + k3[6]) + k4[6]) * s,
+        )
+
+    def simulate(self, ball_speed: float, launch_angle: float, spin_rate: float,
+                 spin_decay: float, density: float,
+                 wind_speed: float = 0.0, wind_direction: float = 0.0,
+                 launch_direction: float = 0.0, spin_axis: float = 0.0) -> TrajectoryResult:
+        """
+        Integrate one ball flight to ground contact.
+
+        Args:
+            ball_speed: Ball speed in mph
+            launch_angle: Vertical launch angle in degrees
+            spin_rate: Total spin in rpm
+            spin_decay: Spin decay rate per second
+            density: Air density in kg/m³
+            wind_speed: Wind speed in mph
+            wind_direction: Wind direction in degrees (0° is headwind, 180° is tailwind)
+            launch_direction: Horizontal start direction in degrees (+ is right)
+            spin_axis: Spin axis tilt in degrees (+ curves right)
+
+        Returns:
+            TrajectoryResult: Landing point and flight characteristics
+        """
+        speed = ball_speed * MPH_TO_MS
+        launch_rad = math.radians(launch_angle)
+        direction_rad = math.radians(launch_direction)
+        axis_rad = math.radians(spin_axis)
+        wind_rad = math.radians(wind_direction)
+        wind = wind_speed * MPH_TO_MS
+
+        k_air = 0.5 * density * BALL_AREA / BALL_MASS
+        params = (k_air, spin_decay, -math.sin(axis_rad), math.cos(axis_rad),
+                  -wind * math.cos(wind_rad), wind * math.sin(wind_rad))
+        state = (
+            0.0, 0.0, 0.0,
+            speed * math.cos(launch_rad) * math.cos(direction_rad),
+            speed * math.sin(launch_rad),
+            speed * math.cos(launch_rad) * math.sin(direction_rad),
+            spin_rate * RPM_TO_RAD_S,
+        )
+
+        t = 0.0
+        dt = self.initial_step
+        apex = 0.0
+        steps = 0
+        k1 = self._derivatives(state, *params)
+        while t < self.max_time:
+            # Step doubling: one step of dt against two of dt/2, sharing the first stage
+            full = self._rk4_step(state, dt, params, k1)
+            midpoint = self._rk4_step(state, dt / 2, params, k1)
+            half = self._rk4_step(midpoint, dt / 2, params, self._derivatives(midpoint, *params))
+            error = max(abs(half[0] - full[0]), abs(half[1] - full[1]), abs(half[2] - full[2]))
+            if error > self.tolerance and dt > self.min_step:
+                dt = max(dt * max(0.9 * (self.tolerance / error) ** 0.2, 0.2), self.min_step)
+                continue
+
+            if half[1] <= 0 and t > 0:
+                # Ground contact: land with a partial step from the last airborne state
+                fraction = state[1] / (state[1] - half[1])
+                state = self._rk4_step(state, dt * fraction, params, k1)
+                t += dt * fraction
+                steps += 1
+                break
+
+            state = half
+            k1 = self._derivatives(state, *params)
+            t += dt
+            steps += 1
+            apex = max(apex, state[1])
+            growth = 0.9 * (self.tolerance / error) ** 0.2 if error > 0 else 5.0
+            dt = min(dt * min(growth, 5.0), self.max_step)
+
+        _, _, _, vx, vy, vz, _ = state
+        return TrajectoryResult(
+            carry_distance=state[0] * M_TO_YARDS,
+            lateral_movement=state[2] * M_TO_YARDS,
+            max_height=apex * M_TO_YARDS,
+            flight_time=t,
+            land_angle=math.degrees(math.atan2(-vy, math.hypot(vx, vz))),
+            steps=steps,
+        )
+
+    def simulate_club(self, club_data: ClubData, ball: BallModel,
+                      temperature: float = REFERENCE_TEMPERATURE,
+                      altitude: float = REFERENCE_ALTITUDE,
+                      wind_speed: float = 0.0, wind_direction: float = 0.0,
+                      pressure: Optional[float] = None, humidity: Optional[float] = None,
+                      density: Optional[float] = None) -> TrajectoryResult:
+        """
+        Integrate a stock shot for a club and ball model in the given conditions.
+
+        Air density comes from temperature, altitude and the optional station pressure
+        (hPa) and humidity (%), unless a precomputed density (kg/m³) is passed.
+        """
+        ball_temp_effect = 1 + (temperature - REFERENCE_TEMPERATURE) * BALL_TEMP_SPEED_COEFF * ball.temp_sensitivity
+        if density is None:
+            density = density_at(temperature, altitude, pressure=pressure, humidity=humidity)
+        return self.simulate(
+            ball_speed=club_data.ball_speed * ball.speed_factor * ball_temp_effect,
+            launch_angle=club_data.launch_angle,
+            spin_rate=club_data.spin_rate * ball.spin_factor,
+            spin_decay=club_data.spin_decay,
+            density=density,
+            wind_speed=wind_speed,
+            wind_direction=wind_direction,
+        )
+
+
+class TrajectoryYardageModel(YardageModelEnhanced):
+    """
+    Drop-in replacement for YardageModelEnhanced that derives adjustments from
+    simulated flights instead of the closed-form multipliers.
+
+    Each club's stock yardage is taken to be its carry in reference conditions
+    (70°F, sea level, no wind). The target yardage is scaled by the ratio of the
+    simulated carry in the current conditions to that reference carry, and the
+    lateral offset is scaled the same way.
+    """
+
+    def __init__(self, engine: Optional[TrajectoryEngine] = None):
+        super().__init__()
+        self.engine = engine or TrajectoryEngine()
+        self._reference_carry: Dict[Tuple[ClubData, str], float] = {}
+
+    def _per_yard(self, club: str, ball_model: str, temperature: Optional[float],
+                  altitude: Optional[float], wind_speed: Optional[float],
+                  wind_direction: Optional[float],
+                  club_data: Optional[ClubData] = None) -> Tuple[float, float]:
+        """Simulated carry and lateral movement per yard of target (club_data overrides the club)."""
+        club_data = club_data or self.club_data(club)
+        if ball_model not in self.BALL_MODELS:
+            raise ValueError(f"Unknown ball model: {ball_model}")
+        ball = self.BALL_MODELS[ball_model]
+        key = (club_data, ball_model)
+        if key not in self._reference_carry:
+            self._reference_carry[key] = self.engine.simulate_club(club_data, ball).carry_distance
+        reference_carry = self._reference_carry[key]
+
+        # Unset conditions as in the reference model: 0 or None temperature and altitude,
+        # and wind without a direction, are left out
+        flight = self.engine.simulate_club(
+            club_data, ball,
+            temperature=temperature or REFERENCE_TEMPERATURE,
+            altitude=altitude or REFERENCE_ALTITUDE,
+            wind_speed=0.0 if wind_direction is None else wind_speed or 0.0,
+            wind_direction=wind_direction or 0.0,
+        )
+        return flight.carry_distance / reference_carry, flight.lateral_movement / reference_carry
+
+    def calculate(self, request: ShotRequest) -> ShotResult:
+        """Calculate the adjusted yardage from a simulated flight in the request's conditions."""
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__)
+        conditions = request.conditions
+        carry, lateral = self._per_yard(request.club.lower(), request.ball_model,
+                                        conditions.temperature, conditions.altitude,
+                                        conditions.wind_speed, conditions.wind_direction,
+                                        request.club_data)
+        result = ShotResult(
+            carry_distance=round(request.target_yardage * carry, 1),
+            lateral_movement=round(request.target_yardage * lateral, 1)
+        )
+        if timer is not None:
+            timer.mark("simulate")
+            timer.finish()
+        return result
+
+    def _build_carry_index(self, temperature: Optional[float], altitude: Optional[float],
+                           wind_speed: Optional[float], wind_direction: Optional[float],
+                           ball_model: str) -> ClubCarryIndex:
+        """Carry-per-yard index from one simulated flight per club."""
+        clubs = list(self.CLUB_DATABASE)
+        per_yard = [self._per_yard(club, ball_model, temperature, altitude, wind_speed, wind_direction)
+                    for club in clubs]
+        return ClubCarryIndex(clubs, [carry for carry, _ in per_yard],
+                              [lateral for _, lateral in per_yard])
+
+    def calculate_adjusted_yardage_batch(self, target_yardage: ArrayLike,
+                                         club: ArrayLike,
+                                         temperature: Optional[ArrayLike] = None,
+                                         altitude: Optional[ArrayLike] = None,
+                                         wind_speed: Optional[ArrayLike] = None,
+                                         wind_direction: Optional[ArrayLike] = None,
+                                         ball_model: Optional[ArrayLike] = None,
+                                         rounded: bool = True) -> BatchShotResult:
+        """Batch API of YardageModelEnhanced, simulating one flight per row."""
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__, "batch")
+        size = max(np.size(v) for v in (target_yardage, club, temperature, altitude,
+                                        wind_speed, wind_direction, ball_model) if v is not None)
+
+        def column(values, default, dtype=float):
+            if values is None:
+                return [default] * size
+            values = np.broadcast_to(np.asarray(values, dtype=dtype), (size,)).tolist()
+            if dtype is float:
+                # NaN marks an unset condition, like None
+                values = [None if v != v else v for v in values]
+            return values
+
+        rows = zip(column(club, None, str),
+                   column(ball_model, self.ball_model, str),
+                   column(temperature, self.temperature),
+                   column(altitude, self.altitude),
+                   column(wind_speed, self.wind_speed),
+                   column(wind_direction, self.wind_direction))
+        per_yard = np.array([self._per_yard(c.lower(), *rest) for c, *rest in rows]).reshape(size, 2)
+        target = np.broadcast_to(np.asarray(target_yardage, dtype=float), (size,))
+        carry = target * per_yard[:, 0]
+        lateral = target * per_yard[:, 1]
+        if rounded:
+            carry = np.round(carry, 1)
+            lateral = np.round(lateral, 1)
+        if timer is not None:
+            timer.mark("simulate")
+            timer.finish(size)
+        return BatchShotResult(carry_distance=carry, lateral_movement=lateral)
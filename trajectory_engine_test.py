@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+
+from trajectory_engine import TrajectoryEngine, TrajectoryYardageModel, MPH_TO_MS, M_TO_YARDS, GRAVITY
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest
+
+NEUTRAL = Conditions(temperature=70)
+# Each case leaves out the same inputs as NEUTRAL: 0 or None temperature and
+# altitude, calm air, and wind speed without a direction
+UNSET = [
+    Conditions(),
+    Conditions(temperature=0, altitude=0),
+    Conditions(temperature=70, altitude=None, wind_speed=10, wind_direction=None),
+    Conditions(temperature=None, altitude=0, wind_speed=0, wind_direction=90),
+    Conditions(wind_speed=None, wind_direction=180),
+]
+
+
+@pytest.fixture(scope="module")
+def model():
+    return TrajectoryYardageModel()
+
+
+def test_vacuum_flight_matches_projectile_motion():
+    speed, angle = 100.0, 30.0
+    flight = TrajectoryEngine(tolerance=1e-4).simulate(speed, angle, spin_rate=0.0, spin_decay=0.0,
+                                                       density=1e-12)
+    v = speed * MPH_TO_MS
+    assert flight.carry_distance == pytest.approx(v * v * math.sin(math.radians(2 * angle)) / GRAVITY
+                                                  * M_TO_YARDS, rel=5e-3)
+    assert flight.flight_time == pytest.approx(2 * v * math.sin(math.radians(angle)) / GRAVITY, rel=5e-3)
+    assert flight.land_angle == pytest.approx(angle, abs=0.1)
+    assert flight.lateral_movement == 0.0
+
+
+def test_adaptive_step_converges(model):
+    club, ball = model.CLUB_DATABASE["7-iron"], model.BALL_MODELS["mid_range"]
+    coarse = model.engine.simulate_club(club, ball)
+    fine = TrajectoryEngine(tolerance=1e-5).simulate_club(club, ball)
+    assert coarse.carry_distance == pytest.approx(fine.carry_distance, abs=0.25)
+    assert coarse.steps < fine.steps
+
+
+@pytest.mark.parametrize("conditions", UNSET)
+def test_unset_conditions_are_left_out_as_in_the_reference(model, conditions):
+    reference = YardageModelEnhanced()
+    for backend in (model, reference):
+        expected = backend.calculate(ShotRequest(150, "7-iron", NEUTRAL))
+        assert backend.calculate(ShotRequest(150, "7-iron", conditions)) == expected
+    # Stock yardage is the simulated carry in reference conditions
+    assert model.calculate(ShotRequest(150, "7-iron", conditions)).carry_distance == 150.0
+
+
+def test_conditions_move_the_carry_like_the_reference(model):
+    reference = YardageModelEnhanced()
+
+    def carry(backend, conditions):
+        return backend.calculate(ShotRequest(150, "7-iron", conditions))
+
+    for backend in (model, reference):
+        calm = carry(backend, NEUTRAL)
+        assert carry(backend, Conditions(70, 0, 10, 0)).carry_distance < calm.carry_distance
+        assert carry(backend, Conditions(70, 0, 10, 180)).carry_distance > calm.carry_distance
+        assert carry(backend, Conditions(70, 7000)).carry_distance > calm.carry_distance
+        assert carry(backend, Conditions(40)).carry_distance < calm.carry_distance
+        assert carry(backend, Conditions(70, 0, 10, 90)).lateral_movement > 0
+
+
+def test_batch_matches_scalar(model):
+    conditions = [Conditions(), Conditions(85, 5000, 12, 45), Conditions(70, 0, 10, None)]
+    result = model.calculate_adjusted_yardage_batch(
+        150, "7-Iron",
+        [np.nan if c.temperature is None else c.temperature for c in conditions],
+        [np.nan if c.altitude is None else c.altitude for c in conditions],
+        [np.nan if c.wind_speed is None else c.wind_speed for c in conditions],
+        [np.nan if c.wind_direction is None else c.wind_direction for c in conditions])
+    expected = [model.calculate(ShotRequest(150, "7-iron", c)) for c in conditions]
+    assert result.carry_distance.tolist() == [r.carry_distance for r in expected]
+    assert result.lateral_movement.tolist() == [r.lateral_movement for r in expected]
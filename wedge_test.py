@@ -1,91 +1,109 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
 from typing import Dict, Any, List, Tuple
 
+# Common weather scenarios on golf courses
+CONDITIONS = [
+    {
+        "name": "Dewy Morning",
+        "temp": 55,
+        "altitude": 0,
+        "wind_speed": 0,
+        "wind_dir": 0  # Calm
+    },
+    {
+        "name": "Afternoon Breeze",
+        "temp": 78,
+        "altitude": 0,
+        "wind_speed": 8,
+        "wind_dir": 45  # Quartering helping
+    },
+    {
+        "name": "Mountain Green",
+        "temp": 68,
+        "altitude": 4500,
+        "wind_speed": 12,
+        "wind_dir": 180  # Into wind
+    },
+    {
+        "name": "Links Course",
+        "temp": 62,
+        "altitude": 0,
+        "wind_speed": 22,
+        "wind_dir": 90  # Full crosswind
+    },
+    {
+        "name": "Desert Approach",
+        "temp": 95,
+        "altitude": 2500,
+        "wind_speed": 15,
+        "wind_dir": 135  # Quartering into
+    },
+    {
+        "name": "Calm Evening",
+        "temp": 70,
+        "altitude": 0,
+        "wind_speed": 5,
+        "wind_dir": 270  # Left to right
+    },
+    {
+        "name": "High Altitude",
+        "temp": 58,
+        "altitude": 7000,
+        "wind_speed": 8,
+        "wind_dir": 225  # Quartering into
+    },
+    {
+        "name": "Coastal Morning",
+        "temp": 65,
+        "altitude": 0,
+        "wind_speed": 18,
+        "wind_dir": 315  # Quartering helping
+    },
+    {
+        "name": "Hot Approach",
+        "temp": 92,
+        "altitude": 1000,
+        "wind_speed": 10,
+        "wind_dir": 160  # Into and left
+    },
+    {
+        "name": "Light Drizzle",
+        "temp": 61,
+        "altitude": 0,
+        "wind_speed": 12,
+        "wind_dir": 200  # Into and right
+    }
+]
+
+BALL_MODEL = "tour_premium"  # Using tour ball for consistency
+CLUB = "pitching-wedge"
+TARGET_YARDAGE = 140  # Base pitching wedge distance
+SKILL_LEVELS = [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_wedge_conditions."""
+    return [
+        (f"{skill.value}/{condition['name']}",
+         ShotRequest(TARGET_YARDAGE, CLUB,
+                     Conditions(condition["temp"], condition["altitude"],
+                                condition["wind_speed"], condition["wind_dir"]),
+                     BALL_MODEL, skill))
+        for skill in SKILL_LEVELS for condition in CONDITIONS
+    ]
+
+
 def test_wedge_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test pitching wedge performance in various realistic golf conditions."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")  # Using tour ball for consistency
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Common weather scenarios on golf courses
-    conditions = [
-        {
-            "name": "Dewy Morning",
-            "temp": 55,
-            "altitude": 0,
-            "wind_speed": 0,
-            "wind_dir": 0  # Calm
-        },
-        {
-            "name": "Afternoon Breeze",
-            "temp": 78,
-            "altitude": 0,
-            "wind_speed": 8,
-            "wind_dir": 45  # Quartering helping
-        },
-        {
-            "name": "Mountain Green",
-            "temp": 68,
-            "altitude": 4500,
-            "wind_speed": 12,
-            "wind_dir": 180  # Into wind
-        },
-        {
-            "name": "Links Course",
-            "temp": 62,
-            "altitude": 0,
-            "wind_speed": 22,
-            "wind_dir": 90  # Full crosswind
-        },
-        {
-            "name": "Desert Approach",
-            "temp": 95,
-            "altitude": 2500,
-            "wind_speed": 15,
-            "wind_dir": 135  # Quartering into
-        },
-        {
-            "name": "Calm Evening",
-            "temp": 70,
-            "altitude": 0,
-            "wind_speed": 5,
-            "wind_dir": 270  # Left to right
-        },
-        {
-            "name": "High Altitude",
-            "temp": 58,
-            "altitude": 7000,
-            "wind_speed": 8,
-            "wind_dir": 225  # Quartering into
-        },
-        {
-            "name": "Coastal Morning",
-            "temp": 65,
-            "altitude": 0,
-            "wind_speed": 18,
-            "wind_dir": 315  # Quartering helping
-        },
-        {
-            "name": "Hot Approach",
-            "temp": 92,
-            "altitude": 1000,
-            "wind_speed": 10,
-            "wind_dir": 160  # Into and left
-        },
-        {
-            "name": "Light Drizzle",
-            "temp": 61,
-            "altitude": 0,
-            "wind_speed": 12,
-            "wind_dir": 200  # Into and right
-        }
-    ]
-    
-    for skill in [SkillLevel.PROFESSIONAL, SkillLevel.ADVANCED, SkillLevel.INTERMEDIATE]:
+    for skill in SKILL_LEVELS:
         skill_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
                 temperature=condition["temp"],
                 altitude=condition["altitude"],
@@ -94,9 +112,9 @@ def test_wedge_conditions() -> Dict[str, List[Dict[str, Any]]]:
             )
             
             result = model.calculate_adjusted_yardage(
-                target_yardage=140,  # Base pitching wedge distance
+                target_yardage=TARGET_YARDAGE,
                 skill_level=skill,
-                club="pitching-wedge"
+                club=CLUB
             )
             
             skill_results.append({
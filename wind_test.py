@@ -1,80 +1,96 @@
-from yardage_model_enhanced import YardageModelEnhanced, SkillLevel
+from yardage_model_enhanced import YardageModelEnhanced, SkillLevel, Conditions, ShotRequest
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Wind test conditions
+CONDITIONS = [
+    {
+        "name": "No Wind",
+        "speed": 0,
+        "direction": 0
+    },
+    {
+        "name": "Light Helping",
+        "speed": 5,
+        "direction": 180
+    },
+    {
+        "name": "Strong Helping",
+        "speed": 15,
+        "direction": 180
+    },
+    {
+        "name": "Light Quartering",
+        "speed": 5,
+        "direction": 135
+    },
+    {
+        "name": "Strong Quartering",
+        "speed": 15,
+        "direction": 135
+    },
+    {
+        "name": "Light Crosswind",
+        "speed": 5,
+        "direction": 90
+    },
+    {
+        "name": "Strong Crosswind",
+        "speed": 15,
+        "direction": 90
+    },
+    {
+        "name": "Light Into Quarter",
+        "speed": 5,
+        "direction": 45
+    },
+    {
+        "name": "Strong Into Quarter",
+        "speed": 15,
+        "direction": 45
+    },
+    {
+        "name": "Direct Headwind",
+        "speed": 15,
+        "direction": 0
+    }
+]
+
+CLUBS = {
+    "driver": 300,
+    "7-iron": 180,
+    "pitching-wedge": 140
+}
+
+BALL_MODEL = "tour_premium"
+TEMPERATURE = 70  # Standard temperature
+ALTITUDE = 0  # Sea level
+
+
+def scenario_requests() -> List[Tuple[str, ShotRequest]]:
+    """(label, request) for every shot evaluated by test_wind_conditions."""
+    return [
+        (f"{club_name}/{condition['name']}",
+         ShotRequest(target_distance, club_name,
+                     Conditions(TEMPERATURE, ALTITUDE, condition["speed"], condition["direction"]),
+                     BALL_MODEL, SkillLevel.PROFESSIONAL))
+        for club_name, target_distance in CLUBS.items() for condition in CONDITIONS
+    ]
+
 
 def test_wind_conditions() -> Dict[str, List[Dict[str, Any]]]:
     """Test wind effects with standard temperature (70°F) and sea level altitude."""
     
     model = YardageModelEnhanced()
-    model.set_ball_model("tour_premium")
+    model.set_ball_model(BALL_MODEL)
     results = {}
     
-    # Wind test conditions
-    conditions = [
-        {
-            "name": "No Wind",
-            "speed": 0,
-            "direction": 0
-        },
-        {
-            "name": "Light Helping",
-            "speed": 5,
-            "direction": 180
-        },
-        {
-            "name": "Strong Helping",
-            "speed": 15,
-            "direction": 180
-        },
-        {
-            "name": "Light Quartering",
-            "speed": 5,
-            "direction": 135
-        },
-        {
-            "name": "Strong Quartering",
-            "speed": 15,
-            "direction": 135
-        },
-        {
-            "name": "Light Crosswind",
-            "speed": 5,
-            "direction": 90
-        },
-        {
-            "name": "Strong Crosswind",
-            "speed": 15,
-            "direction": 90
-        },
-        {
-            "name": "Light Into Quarter",
-            "speed": 5,
-            "direction": 45
-        },
-        {
-            "name": "Strong Into Quarter",
-            "speed": 15,
-            "direction": 45
-        },
-        {
-            "name": "Direct Headwind",
-            "speed": 15,
-            "direction": 0
-        }
-    ]
-    
-    clubs = {
-        "driver": 300,
-        "7-iron": 180,
-        "pitching-wedge": 140
-    }
-    
-    for club_name, target_distance in clubs.items():
+    for club_name, target_distance in CLUBS.items():
         club_results = []
-        for condition in conditions:
+        for condition in CONDITIONS:
             model.set_conditions(
-                temperature=70,  # Standard temperature
-                altitude=0,     # Sea level
+                temperature=TEMPERATURE,
+                altitude=ALTITUDE,
                 wind_speed=condition["speed"],
                 wind_direction=condition["direction"]
             )
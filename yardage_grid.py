@@ -0,0 +1,358 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import (
+    YardageModelEnhanced, ShotResult, BatchShotResult, ArrayLike, Conditions, ShotRequest
+)
+from club_selection import ClubCarryIndex
+from table_store import TableFile, write_table, model_fingerprint
+
+# Carry and lateral scale linearly with target yardage in every model backend, so the
+# grid stores both per yard of target, sampled at a long reference shot
+REFERENCE_TARGET = 1000.0
+
+# Conditions used when set_conditions has not been called (no temperature/altitude/wind effect)
+NEUTRAL_TEMPERATURE = 70.0
+
+
+@dataclass(frozen=True)
+class GridAxis:
+    """Uniformly spaced sample points for one condition."""
+    name: str
+    start: float
+    step: float
+    count: int
+
+    @property
+    def points(self) -> np.ndarray:
+        return self.start + self.step * np.arange(self.count)
+
+    @property
+    def stop(self) -> float:
+        return self.start + self.step * (self.count - 1)
+
+
+# Default axes: table breakpoints fall on grid nodes, and wind direction nodes include
+# 90° and 270° where the headwind multiplier switches on
+DEFAULT_AXES = (
+    GridAxis("temperature", 10.0, 10.0, 12),     # 10-120°F
+    GridAxis("altitude", -1000.0, 1000.0, 12),   # -1000-10000 ft
+    GridAxis("wind_speed", 0.0, 5.0, 9),         # 0-40 mph
+    GridAxis("wind_direction", 0.0, 10.0, 37),   # 0-360°
+)
+
+
+@dataclass
+class GridErrorReport:
+    samples: int
+    max_carry_error: float      # Yards
+    rms_carry_error: float      # Yards
+    max_lateral_error: float    # Yards
+    rms_lateral_error: float    # Yards
+
+
+@dataclass
+class YardageGrid:
+    """
+    Carry and lateral movement per yard of target, sampled over the condition axes.
+
+    values has shape (clubs, balls, temperature, altitude, wind_speed, wind_direction, 2)
+    with carry in [..., 0] and lateral movement in [..., 1].
+    """
+    clubs: List[str]
+    balls: List[str]
+    axes: Tuple[GridAxis, ...]
+    values: np.ndarray
+    source: str = ""
+    fingerprint: bytes = b""  # model_fingerprint of the source model
+
+    def save(self, path: str):
+        """Write the grid as a memory-mappable table file."""
+        write_table(
+            path,
+            {"values": self.values},
+            fingerprint=self.fingerprint,
+            metadata={
+                "clubs": ",".join(self.clubs),
+                "balls": ",".join(self.balls),
+                "axes": ";".join(f"{a.name}:{a.start!r}:{a.step!r}:{a.count}" for a in self.axes),
+                "source": self.source,
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str, model: Optional[YardageModelEnhanced] = None,
+             verify: bool = False) -> "YardageGrid":
+        """
+        Open a grid written by save without copying its values.
+
+        Args:
+            path: Table file to open
+            model: Raise StaleTableError unless the grid was built from this model's tables
+            verify: Check the payload checksum
+
+        Returns:
+            YardageGrid: values is a read-only view onto the shared mapping
+        """
+        table = TableFile(path, expected_fingerprint=model_fingerprint(model) if model else None,
+                          verify=verify)
+        axes = []
+        for spec in table.metadata["axes"].split(";"):
+            name, start, step, count = spec.split(":")
+            axes.append(GridAxis(name, float(start), float(step), int(count)))
+        return cls(clubs=table.metadata["clubs"].split(","), balls=table.metadata["balls"].split(","),
+                   axes=tuple(axes), values=table["values"], source=table.metadata["source"],
+                   fingerprint=table.fingerprint)
+
+
+def _has_batch_path(model: YardageModelEnhanced) -> bool:
+    """True when the model's batch API comes from the same class as its scalar path."""
+    def owner(name: str) -> type:
+        return next(c for c in type(model).__mro__ if name in c.__dict__)
+    return owner("calculate_adjusted_yardage_batch") is owner("calculate")
+
+
+def _sample_model(model: YardageModelEnhanced, club: str, ball: str,
+                  temperature: np.ndarray, altitude: np.ndarray,
+                  wind_speed: np.ndarray, wind_direction: np.ndarray) -> np.ndarray:
+    """Carry and lateral per yard of target at each condition row."""
+    if _has_batch_path(model):
+        result = model.calculate_adjusted_yardage_batch(
+            REFERENCE_TARGET, club, temperature, altitude, wind_speed, wind_direction,
+            ball_model=ball, rounded=False)
+        carry, lateral = result.carry_distance, result.lateral_movement
+    else:
+        # Backends without a batch path are sampled one shot at a time
+        carry = np.empty(len(temperature))
+        lateral = np.empty(len(temperature))
+        for i in range(len(temperature)):
+            conditions = Conditions(float(temperature[i]), float(altitude[i]),
+                                    float(wind_speed[i]), float(wind_direction[i]))
+            shot = model.calculate(ShotRequest(REFERENCE_TARGET, club, conditions, ball))
+            carry[i], lateral[i] = shot.carry_distance, shot.lateral_movement
+    return np.stack([carry, lateral], axis=-1) / REFERENCE_TARGET
+
+
+def build_yardage_grid(model: Optional[YardageModelEnhanced] = None,
+                       clubs: Optional[Sequence[str]] = None,
+                       balls: Optional[Sequence[str]] = None,
+                       axes: Sequence[GridAxis] = DEFAULT_AXES) -> YardageGrid:
+    """
+    Sample a yardage model onto a dense condition grid for each club/ball pair.
+
+    Args:
+        model: Source model (YardageModelEnhanced or a drop-in backend); defaults to the table model
+        clubs: Clubs to include, defaults to every club in CLUB_DATABASE
+        balls: Ball models to include, defaults to every model in BALL_MODELS
+        axes: Condition axes in the order temperature, altitude, wind_speed, wind_direction
+
+    Returns:
+        YardageGrid: Values ready for GridYardageModel
+    """
+    model = model or YardageModelEnhanced()
+    clubs = list(clubs or model.CLUB_DATABASE)
+    balls = list(balls or model.BALL_MODELS)
+    axes = tuple(axes)
+    mesh = np.meshgrid(*(a.points for a in axes), indexing="ij")
+    conditions = [m.ravel() for m in mesh]
+    shape = tuple(a.count for a in axes)
+
+    values = np.empty((len(clubs), len(balls)) + shape + (2,), dtype=np.float32)
+    for i, club in enumerate(clubs):
+        for j, ball in enumerate(balls):
+            values[i, j] = _sample_model(model, club, ball, *conditions).reshape(shape + (2,))
+    return YardageGrid(clubs=clubs, balls=balls, axes=axes, values=values,
+                       source=type(model).__name__, fingerprint=model_fingerprint(model))
+
+
+class GridYardageModel(YardageModelEnhanced):
+    """
+    Constant-time yardage model answering queries by multilinear interpolation
+    over a precomputed YardageGrid.
+
+    Conditions outside the grid are clamped to its edges, and wind direction
+    wraps around 360°.
+    """
+
+    def __init__(self, grid: YardageGrid):
+        super().__init__()
+        self.grid = grid
+        self._club_index = {c: i for i, c in enumerate(grid.clubs)}
+        self._ball_index = {b: i for i, b in enumerate(grid.balls)}
+        self._starts = np.array([a.start for a in grid.axes])
+        self._steps = np.array([a.step for a in grid.axes])
+        self._counts = np.array([a.count for a in grid.axes])
+
+    def _lookup(self, name: str, index: Dict[str, int], kind: str) -> int:
+        if name not in index:
+            raise ValueError(f"Unknown {kind}: {name}")
+        return index[name]
+
+    def _cell(self, conditions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower corner index and fractional position inside the cell for each axis."""
+        position = (conditions - self._starts) / self._steps
+        position = np.clip(position, 0, self._counts - 1)
+        lower = np.minimum(np.floor(position), self._counts - 2).astype(np.intp)
+        return lower, position - lower
+
+    def _interpolate(self, club: np.ndarray, ball: np.ndarray, conditions: np.ndarray) -> np.ndarray:
+        """Multilinear interpolation over the 16 cell corners for each row."""
+        lower, fraction = self._cell(conditions)
+        result = np.zeros((len(conditions), 2))
+        for corner in range(16):
+            offsets = [(corner >> axis) & 1 for axis in range(4)]
+            weight = np.ones(len(conditions))
+            for axis, offset in enumerate(offsets):
+                weight *= fraction[:, axis] if offset else 1 - fraction[:, axis]
+            idx = tuple(lower[:, axis] + offset for axis, offset in enumerate(offsets))
+            result += weight[:, None] * self.grid.values[(club, ball) + idx]
+        return result
+
+    def _condition_rows(self, size: int, temperature, altitude, wind_speed, wind_direction) -> np.ndarray:
+        """Stack per-row conditions, filling unset (None, NaN or 0 temperature) values with neutral conditions."""
+        columns = []
+        for values, default, neutral in ((temperature, self.temperature, NEUTRAL_TEMPERATURE),
+                                         (altitude, self.altitude, 0.0),
+                                         (wind_speed, self.wind_speed, 0.0),
+                                         (wind_direction, self.wind_direction, 0.0)):
+            if values is None:
+                values = neutral if default is None else default
+            columns.append(np.broadcast_to(np.asarray(values, dtype=float), (size,)))
+        conditions = np.stack(columns, axis=-1)
+        # Wind without a direction and a 0 temperature have no effect in the source model
+        conditions[np.isnan(conditions[:, 3]), 2] = 0.0
+        conditions[conditions[:, 0] == 0, 0] = np.nan
+        conditions = np.where(np.isnan(conditions), [NEUTRAL_TEMPERATURE, 0.0, 0.0, 0.0], conditions)
+        conditions[:, 3] %= 360
+        return conditions
+
+    def calculate_adjusted_yardage_batch(self, target_yardage: ArrayLike,
+                                         club: ArrayLike,
+                                         temperature: Optional[ArrayLike] = None,
+                                         altitude: Optional[ArrayLike] = None,
+                                         wind_speed: Optional[ArrayLike] = None,
+                                         wind_direction: Optional[ArrayLike] = None,
+                                         ball_model: Optional[ArrayLike] = None,
+                                         rounded: bool = True) -> BatchShotResult:
+        """Vectorized grid lookup with the same signature as the source model's batch API."""
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__, "batch")
+        size = max(np.size(v) for v in (target_yardage, club, temperature, altitude,
+                                        wind_speed, wind_direction, ball_model) if v is not None)
+        clubs = np.broadcast_to(np.char.lower(np.asarray(club, dtype=str)), (size,))
+        balls = np.broadcast_to(np.asarray(self.ball_model if ball_model is None else ball_model,
+                                           dtype=str), (size,))
+        club_idx = np.array([self._lookup(c, self._club_index, "club") for c in clubs], dtype=np.intp)
+        ball_idx = np.array([self._lookup(b, self._ball_index, "ball model") for b in balls], dtype=np.intp)
+        conditions = self._condition_rows(size, temperature, altitude, wind_speed, wind_direction)
+        if timer is not None:
+            timer.mark("environment")
+
+        per_yard = self._interpolate(club_idx, ball_idx, conditions)
+        target = np.broadcast_to(np.asarray(target_yardage, dtype=float), (size,))
+        carry = target * per_yard[:, 0]
+        lateral = target * per_yard[:, 1]
+        if rounded:
+            carry = np.round(carry, 1)
+            lateral = np.round(lateral, 1)
+        if timer is not None:
+            timer.mark("interpolate")
+            timer.finish(size)
+        return BatchShotResult(carry_distance=carry, lateral_movement=lateral)
+
+    def calculate(self, request: ShotRequest) -> ShotResult:
+        """Calculate the adjusted yardage by interpolating the precomputed grid."""
+        if request.club_data is not None:
+            raise ValueError("The grid only covers stock clubs; use its source model for personal club data")
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__)
+        club_i = self._lookup(request.club.lower(), self._club_index, "club")
+        ball_i = self._lookup(request.ball_model, self._ball_index, "ball model")
+        conditions = self._neutral_conditions(request.conditions)
+        if timer is not None:
+            timer.mark("environment")
+
+        # Locate the cell with plain float arithmetic, then collapse the 2x2x2x2
+        # corner block one axis at a time
+        lower = []
+        fraction = []
+        for value, axis in zip(conditions, self.grid.axes):
+            position = min(max((value - axis.start) / axis.step, 0.0), axis.count - 1)
+            index = min(int(position), axis.count - 2)
+            lower.append(index)
+            fraction.append(position - index)
+        cell = self.grid.values[club_i, ball_i,
+                                lower[0]:lower[0] + 2, lower[1]:lower[1] + 2,
+                                lower[2]:lower[2] + 2, lower[3]:lower[3] + 2].reshape(16, 2).tolist()
+        for f in fraction:
+            half = len(cell) // 2
+            cell = [[a + (b - a) * f for a, b in zip(low, high)]
+                    for low, high in zip(cell[:half], cell[half:])]
+        cell = cell[0]
+        result = ShotResult(
+            carry_distance=round(request.target_yardage * float(cell[0]), 1),
+            lateral_movement=round(request.target_yardage * float(cell[1]), 1)
+        )
+        if timer is not None:
+            timer.mark("interpolate")
+            timer.finish()
+        return result
+
+    @staticmethod
+    def _neutral_conditions(conditions: Conditions) -> Tuple[float, float, float, float]:
+        """Grid coordinates for a set of conditions, with unset values at neutral."""
+        # Wind without a direction and a 0 temperature have no effect in the source model
+        wind_speed = 0.0 if conditions.wind_direction is None else conditions.wind_speed or 0.0
+        return (conditions.temperature or NEUTRAL_TEMPERATURE,
+                conditions.altitude or 0.0, wind_speed, (conditions.wind_direction or 0.0) % 360)
+
+    def _build_carry_index(self, temperature: Optional[float], altitude: Optional[float],
+                           wind_speed: Optional[float], wind_direction: Optional[float],
+                           ball_model: str) -> ClubCarryIndex:
+        """Carry-per-yard index over the grid's clubs for one set of conditions."""
+        clubs = list(self.grid.clubs)
+        conditions = self._neutral_conditions(Conditions(temperature, altitude, wind_speed, wind_direction))
+        per_yard = self.calculate_adjusted_yardage_batch(1.0, clubs, *conditions, ball_model, rounded=False)
+        return ClubCarryIndex(clubs, per_yard.carry_distance, per_yard.lateral_movement)
+
+    def interpolation_error(self, source: Optional[YardageModelEnhanced] = None,
+                            samples: int = 10000, seed: int = 0) -> GridErrorReport:
+        """
+        Compare grid answers with the source model at random in-range conditions.
+
+        Args:
+            source: Model the grid was built from; defaults to the table model
+            samples: Number of random shots to compare
+            seed: RNG seed for reproducible reports
+
+        Returns:
+            GridErrorReport: Max and RMS carry/lateral error in yards, unrounded
+        """
+        source = source or YardageModelEnhanced()
+        rng = np.random.default_rng(seed)
+        clubs = rng.choice(self.grid.clubs, samples)
+        balls = rng.choice(self.grid.balls, samples)
+        target = rng.uniform(50, 320, samples)
+        conditions = [rng.uniform(a.start, a.stop, samples) for a in self.grid.axes]
+
+        expected = np.empty((samples, 2))
+        for club in self.grid.clubs:
+            for ball in self.grid.balls:
+                rows = (clubs == club) & (balls == ball)
+                if rows.any():
+                    expected[rows] = _sample_model(source, club, ball, *(c[rows] for c in conditions))
+        expected *= target[:, None]
+        actual = self.calculate_adjusted_yardage_batch(target, clubs, *conditions,
+                                                       ball_model=balls, rounded=False)
+        carry_error = np.abs(actual.carry_distance - expected[:, 0])
+        lateral_error = np.abs(actual.lateral_movement - expected[:, 1])
+        return GridErrorReport(
+            samples=samples,
+            max_carry_error=float(carry_error.max()),
+            rms_carry_error=float(math.sqrt(np.mean(carry_error ** 2))),
+            max_lateral_error=float(lateral_error.max()),
+            rms_lateral_error=float(math.sqrt(np.mean(lateral_error ** 2))),
+        )
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from yardage_grid import build_yardage_grid, GridYardageModel, YardageGrid
+from yardage_model_enhanced import YardageModelEnhanced, Conditions, ShotRequest
+from table_store import StaleTableError
+
+CLUBS = ["driver", "7-iron", "sand-wedge"]
+UNSET_TEMPERATURE = [
+    Conditions(temperature=0),
+    Conditions(temperature=0, altitude=5280, wind_speed=10, wind_direction=45),
+    Conditions(temperature=0, wind_speed=12, wind_direction=None),
+]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return build_yardage_grid(clubs=CLUBS)
+
+
+@pytest.mark.parametrize("conditions", UNSET_TEMPERATURE)
+def test_zero_temperature_is_unset_like_the_model(grid, conditions):
+    model, reference = GridYardageModel(grid), YardageModelEnhanced()
+    unset = Conditions(None, conditions.altitude, conditions.wind_speed, conditions.wind_direction)
+    for club in CLUBS:
+        expected = reference.calculate(ShotRequest(150, club, conditions))
+        assert expected == reference.calculate(ShotRequest(150, club, unset))
+        assert model.calculate(ShotRequest(150, club, conditions)) == expected
+        assert model.calculate(ShotRequest(150, club, unset)) == expected
+    assert model.recommend(150, conditions) == model.recommend(150, unset)
+
+
+def test_batch_zero_temperature_is_unset(grid):
+    model, reference = GridYardageModel(grid), YardageModelEnhanced()
+    args = ([150, 150, 150, 150], "7-iron", [0.0, np.nan, 70.0, 40.0], [5280.0, 5280.0, 5280.0, 0.0])
+    carry = model.calculate_adjusted_yardage_batch(*args).carry_distance
+    assert carry[0] == carry[1] == carry[2]
+    np.testing.assert_array_equal(carry, reference.calculate_adjusted_yardage_batch(*args).carry_distance)
+
+    # A temperature of 0 set on the model is unset as well
+    model.set_conditions(0, 5280, 0, 0)
+    assert model.calculate_adjusted_yardage_batch(150, "7-iron").carry_distance[0] == carry[1]
+
+
+def test_grid_round_trips_through_a_table_file(grid, tmp_path):
+    path = str(tmp_path / "grid.bin")
+    grid.save(path)
+    loaded = YardageGrid.load(path, model=YardageModelEnhanced(), verify=True)
+    assert (loaded.clubs, loaded.axes) == (grid.clubs, grid.axes)
+    np.testing.assert_array_equal(loaded.values, grid.values)
+
+    stale = YardageModelEnhanced()
+    stale.set_extrapolation("clamp")
+    with pytest.raises(StaleTableError):
+        YardageGrid.load(path, model=stale)
@@ -0,0 +1,263 @@
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from yardage_model_enhanced import YardageModelEnhanced, BatchShotResult, ArrayLike
+from interpolation import InterpolationTable, EXTRAPOLATION_POLICIES
+
+try:
+    import numba
+except ImportError:  # Without Numba the batch path stays on NumPy (see KernelYardageModel.use_kernel)
+    numba = None
+
+# Per-club and per-ball columns of the kernel's lookup tables (_club_columns/_ball_columns names)
+CLUB_COLUMNS = ("ball_speed", "launch_angle", "spin_rate", "max_height", "wind_multiplier")
+BALL_COLUMNS = ("speed_factor", "spin_factor", "temp_sensitivity")
+
+SAMPLE_ROWS = 4096  # Rows sampled for the distinct names of a column in factorize
+
+
+def _jit(func):
+    """Compile with Numba when it is installed; otherwise the function runs as plain Python."""
+    return numba.njit(cache=True, nogil=True)(func) if numba is not None else func
+
+
+@_jit
+def _interpolate(keys, values, x, policy, fill_value):
+    """InterpolationTable lookup; policy is the index of its extrapolation in EXTRAPOLATION_POLICIES."""
+    n = keys.shape[0]
+    if policy == 1 or policy == 2:  # clamp, constant ("raise" is checked before the kernel runs)
+        if x < keys[0]:
+            return values[0] if policy == 1 else fill_value
+        if x > keys[n - 1]:
+            return values[n - 1] if policy == 1 else fill_value
+    # First segment whose upper key is >= x, as searchsorted(side="left") - 1
+    i = 0
+    while i < n - 2 and keys[i + 1] < x:
+        i += 1
+    ratio = (x - keys[i]) / (keys[i + 1] - keys[i])
+    return values[i] + (values[i + 1] - values[i]) * ratio
+
+
+@_jit
+def adjusted_kernel(target, club, ball, temperature, altitude, wind_speed, wind_direction,
+                    club_table, ball_table, density_keys, density_values, density_policy, density_fill,
+                    altitude_keys, altitude_values, altitude_policy, altitude_fill,
+                    headwind_factor, head_tail_scale, crosswind_factor, lateral_scale,
+                    carry, lateral):
+    """
+    Unrounded carry and lateral movement, one pass per row: ball, temperature,
+    altitude, then wind, in the operation order of _adjusted_columns.
+
+    club and ball index the rows of club_table (CLUB_COLUMNS) and ball_table
+    (BALL_COLUMNS); NaN conditions are unset. Results go to carry and lateral.
+    """
+    for i in range(target.shape[0]):
+        c = club[i]
+        b = ball[i]
+        speed_factor = ball_table[b, 0]
+        adjusted = target[i] * speed_factor
+
+        # Temperature and altitude are skipped when unset or 0, as in the scalar path
+        t = temperature[i]
+        if t == t and t != 0:
+            air_density_factor = _interpolate(density_keys, density_values, t, density_policy, density_fill)
+            ball_temp_effect = 1 + ((t - 70) * 0.003 * ball_table[b, 2])
+            adjusted = adjusted * ((2 * ball_temp_effect + air_density_factor) / 3)
+
+        a = altitude[i]
+        if a == a and a != 0:
+            adjusted = adjusted * _interpolate(altitude_keys, altitude_values, a, altitude_policy, altitude_fill)
+
+        w = wind_speed[i]
+        d = wind_direction[i]
+        if not (w == w and w != 0 and d == d):
+            carry[i] = adjusted
+            lateral[i] = 0.0
+            continue
+        wind_rad = math.radians(d)
+        distance_factor = adjusted / 300
+        club_speed_factor = math.sqrt(171 / (club_table[c, 0] * speed_factor))
+        effective_wind = w * club_table[c, 4]
+
+        wind_factor = math.cos(wind_rad)
+        if wind_factor > 0:
+            wind_factor = wind_factor * headwind_factor
+        head_tail_effect = effective_wind * wind_factor * distance_factor * club_speed_factor * head_tail_scale
+        head_tail_effect = head_tail_effect * math.sqrt(club_table[c, 3] / 35)
+        carry[i] = adjusted - head_tail_effect
+
+        cross_wind_effect = effective_wind * math.sin(wind_rad) * crosswind_factor
+        lateral_base = (cross_wind_effect * distance_factor * club_speed_factor) * lateral_scale
+        spin_factor = math.sqrt((club_table[c, 2] * ball_table[b, 1]) / 2545)
+        loft_factor = math.sqrt(club_table[c, 1] / 10.4)
+        lateral[i] = lateral_base * (1 + (spin_factor + loft_factor - 2) * 0.2)
+
+
+@_jit
+def _match_rows(units, name_units, codes):
+    """Index of each row's name in name_units (UTF-32 code units per row), or -1."""
+    for i in range(units.shape[0]):
+        codes[i] = -1
+        for j in range(name_units.shape[0]):
+            k = 0
+            while k < units.shape[1] and units[i, k] == name_units[j, k]:
+                k += 1
+            if k == units.shape[1]:
+                codes[i] = j
+                break
+
+
+def _hash_rows(values: np.ndarray, units: np.ndarray, names: np.ndarray) -> Optional[np.ndarray]:
+    """NumPy _match_rows: hash lookup confirmed by one string comparison; None on a collision."""
+    # Polynomial hash of the code units, wrapping in uint32
+    weights = np.uint32(2654435761) ** np.arange(units.shape[1], dtype=np.uint32)
+    keys = units @ weights
+    name_keys = names.view(np.uint32).reshape(len(names), units.shape[1]) @ weights
+    order = np.argsort(name_keys)
+    if len(np.unique(name_keys)) < len(names):
+        return None
+    codes = order[np.minimum(np.searchsorted(name_keys[order], keys), len(names) - 1)]
+    found = name_keys[codes] == keys
+    if ((names[codes] != values) & found).any():
+        return None
+    return np.where(found, codes, -1)
+
+
+def factorize(values: ArrayLike, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Integer codes and distinct values of a scalar or 1-D string column.
+
+    A scalar costs nothing. For arrays the distinct names of a sample of rows
+    are matched against every row by comparing UTF-32 code units (_match_rows,
+    compiled with Numba) or by hash (_hash_rows); rows the sample missed are
+    factorized recursively. Far cheaper than np.unique on strings for the few
+    distinct clubs and balls of a sweep.
+
+    Returns:
+        Tuple: codes (intp, one per row) and the distinct values they index
+    """
+    values = np.asarray(values, dtype=str)
+    if values.ndim == 0:
+        return np.zeros(size, dtype=np.intp), values.reshape(1)
+    values = np.ascontiguousarray(np.broadcast_to(values, (size,)))
+    if not size:
+        return np.zeros(0, dtype=np.intp), values
+    names = np.unique(values[::max(size // SAMPLE_ROWS, 1)])
+    units = values.view(np.uint32).reshape(size, -1)
+    if numba is not None:
+        codes = np.empty(size, dtype=np.intp)
+        _match_rows(units, names.view(np.uint32).reshape(len(names), -1), codes)
+    else:
+        codes = _hash_rows(values, units, names)
+        if codes is None:
+            # Two names share a hash: exact but slow
+            names, codes = np.unique(values, return_inverse=True)
+            return codes.ravel().astype(np.intp), names
+    missed = codes < 0
+    if missed.any():
+        more_codes, more_names = factorize(values[missed], int(missed.sum()))
+        codes[missed] = more_codes + len(names)
+        names = np.concatenate([names, more_names])
+    return codes.astype(np.intp, copy=False), names
+
+
+def _condition(values: Optional[ArrayLike], default: Optional[float], size: int) -> np.ndarray:
+    """A condition column for the kernel, NaN where unset (None falls back to set_conditions)."""
+    if values is None:
+        values = default
+    return np.broadcast_to(np.asarray(np.nan if values is None else values, dtype=float), (size,))
+
+
+def _lookup_arguments(lookup: InterpolationTable, column: np.ndarray) -> Tuple:
+    """Kernel arguments for a lookup; the raise policy is checked here on the rows that use it."""
+    keys = np.array(lookup.keys, dtype=float)
+    if lookup.extrapolation == "raise":
+        used = column[~np.isnan(column) & (column != 0)]
+        if used.size and (used.min() < keys[0] or used.max() > keys[-1]):
+            raise ValueError(f"Values outside the table range [{keys[0]}, {keys[-1]}]")
+    return (keys, np.array(lookup.values, dtype=float),
+            EXTRAPOLATION_POLICIES.index(lookup.extrapolation), float(lookup.fill_value))
+
+
+class KernelYardageModel(YardageModelEnhanced):
+    """
+    YardageModelEnhanced with the batch math fused into one compiled loop.
+
+    Club and ball names become integer codes into small per-club and per-ball
+    tables (factorize), and adjusted_kernel runs the whole temperature ->
+    altitude -> wind pipeline per row, with no temporaries between stages.
+    Without Numba the batch path is YardageModelEnhanced's NumPy one, using the
+    same factorized club and ball columns. Results match the reference model.
+    Large sweeps use it with sweep_runner.run_sweep(..., model_class=KernelYardageModel).
+    """
+
+    use_kernel = numba is not None  # Set True to run the kernel interpreted, e.g. to check it
+
+    def _club_codes(self, club: ArrayLike, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        codes, names = factorize(club, size)
+        clubs = [self.club_data(str(name)) for name in names]
+        table = np.array([[c.ball_speed, c.launch_angle, c.spin_rate, c.max_height,
+                           self._calculate_wind_gradient(c.max_height * 3)] for c in clubs], dtype=float)
+        return codes, table.reshape(len(clubs), len(CLUB_COLUMNS))
+
+    def _ball_codes(self, ball_model: Optional[ArrayLike], size: int) -> Tuple[np.ndarray, np.ndarray]:
+        codes, names = factorize(self.ball_model if ball_model is None else ball_model, size)
+        for name in names:
+            if name not in self.BALL_MODELS:
+                raise ValueError(f"Unknown ball model: {name}")
+        balls = [self.BALL_MODELS[str(name)] for name in names]
+        table = np.array([[b.speed_factor, b.spin_factor, b.temp_sensitivity] for b in balls], dtype=float)
+        return codes, table.reshape(len(balls), len(BALL_COLUMNS))
+
+    def _club_columns(self, club: ArrayLike, size: int) -> Dict[str, np.ndarray]:
+        codes, table = self._club_codes(club, size)
+        return {name: table[codes, i] for i, name in enumerate(CLUB_COLUMNS)}
+
+    def _ball_columns(self, ball_model: Optional[ArrayLike], size: int) -> Dict[str, np.ndarray]:
+        codes, table = self._ball_codes(ball_model, size)
+        return {name: table[codes, i] for i, name in enumerate(BALL_COLUMNS)}
+
+    def calculate_adjusted_yardage_batch(self, target_yardage: ArrayLike,
+                                         club: ArrayLike,
+                                         temperature: Optional[ArrayLike] = None,
+                                         altitude: Optional[ArrayLike] = None,
+                                         wind_speed: Optional[ArrayLike] = None,
+                                         wind_direction: Optional[ArrayLike] = None,
+                                         ball_model: Optional[ArrayLike] = None,
+                                         rounded: bool = True) -> BatchShotResult:
+        """See YardageModelEnhanced.calculate_adjusted_yardage_batch."""
+        if not self.use_kernel:
+            return super().calculate_adjusted_yardage_batch(
+                target_yardage, club, temperature, altitude, wind_speed, wind_direction, ball_model, rounded)
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__, "batch")
+        size = max(np.size(v) for v in (target_yardage, club, temperature, altitude,
+                                        wind_speed, wind_direction, ball_model) if v is not None)
+        target = np.broadcast_to(np.asarray(target_yardage, dtype=float), (size,))
+        club_codes, club_table = self._club_codes(club, size)
+        ball_codes, ball_table = self._ball_codes(ball_model, size)
+        temperature, altitude, wind_speed, wind_direction = (
+            _condition(values, getattr(self, name), size) for name, values in
+            (("temperature", temperature), ("altitude", altitude),
+             ("wind_speed", wind_speed), ("wind_direction", wind_direction)))
+        density = _lookup_arguments(self.AIR_DENSITY_LOOKUP, temperature)
+        altitude_effect = _lookup_arguments(self.ALTITUDE_EFFECT_LOOKUP, altitude)
+        if timer is not None:
+            timer.mark("environment")
+
+        carry = np.empty(size)
+        lateral = np.empty(size)
+        adjusted_kernel(target, club_codes, ball_codes, temperature, altitude, wind_speed, wind_direction,
+                        club_table, ball_table, *density, *altitude_effect,
+                        self.HEADWIND_FACTOR, self.HEAD_TAIL_SCALE, self.CROSSWIND_FACTOR,
+                        self.LATERAL_SCALE, carry, lateral)
+        if timer is not None:
+            timer.mark("kernel")
+        if rounded:
+            carry = np.round(carry, 1)
+            lateral = np.round(lateral, 1)
+        if timer is not None:
+            timer.finish(size)
+        return BatchShotResult(carry_distance=carry, lateral_movement=lateral)
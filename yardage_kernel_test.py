@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import yardage_kernel
+from yardage_kernel import KernelYardageModel, factorize
+from yardage_model_enhanced import YardageModelEnhanced
+from interpolation import EXTRAPOLATION_POLICIES
+
+CLUBS = ["driver", "Driver", "7-IRON", "7-iron", "Pitching-Wedge", "sand-wedge", "56-degree", "3-Wood"]
+BALLS = ["mid_range", "tour_premium", "distance", "two_piece"]
+
+
+def _columns(n: int = 3000, seed: int = 0, in_range: bool = False):
+    """
+    Batch arguments with mixed-case clubs and unset (NaN) and zero conditions;
+    in_range keeps set temperatures and altitudes inside the research tables.
+    """
+    rng = np.random.default_rng(seed)
+
+    def condition(low, high):
+        values = rng.uniform(low, high, n)
+        values[rng.random(n) < 0.2] = np.nan
+        values[rng.random(n) < 0.05] = 0.0
+        return values
+
+    temperature, altitude = ((40, 100), (0, 8000)) if in_range else ((20, 110), (-500, 9000))
+    return (rng.uniform(50, 300, n), rng.choice(CLUBS, n), condition(*temperature), condition(*altitude),
+            condition(0, 30), condition(0, 360), rng.choice(BALLS, n))
+
+
+def _kernel_model() -> KernelYardageModel:
+    model = KernelYardageModel()
+    model.use_kernel = True  # Interpreted when Numba is not installed
+    return model
+
+
+def _assert_identical(kernel, reference):
+    np.testing.assert_array_equal(kernel.carry_distance, reference.carry_distance)
+    np.testing.assert_array_equal(kernel.lateral_movement, reference.lateral_movement)
+
+
+@pytest.mark.parametrize("rounded", [False, True])
+@pytest.mark.parametrize("policy", EXTRAPOLATION_POLICIES)
+def test_kernel_matches_numpy_batch_bit_for_bit(policy, rounded):
+    # Under "raise" only set conditions are checked, so unset and 0 rows still pass
+    columns = _columns(seed=len(policy), in_range=policy == "raise")
+    kernel, reference = _kernel_model(), YardageModelEnhanced()
+    for model in (kernel, reference):
+        model.set_extrapolation(policy)
+    _assert_identical(kernel.calculate_adjusted_yardage_batch(*columns, rounded=rounded),
+                      reference.calculate_adjusted_yardage_batch(*columns, rounded=rounded))
+
+    # Without the kernel the factorized columns feed the NumPy path
+    kernel.use_kernel = False
+    _assert_identical(kernel.calculate_adjusted_yardage_batch(*columns, rounded=rounded),
+                      reference.calculate_adjusted_yardage_batch(*columns, rounded=rounded))
+
+
+def test_kernel_scalar_arguments_and_set_conditions():
+    kernel, reference = _kernel_model(), YardageModelEnhanced()
+    for model in (kernel, reference):
+        model.set_conditions(85, 5280, 12, 200)
+        model.set_ball_model("tour_premium")
+    target = np.linspace(60, 280, 50)
+    _assert_identical(kernel.calculate_adjusted_yardage_batch(target, "7-Iron", wind_speed=np.nan),
+                      reference.calculate_adjusted_yardage_batch(target, "7-Iron", wind_speed=np.nan))
+
+
+def test_kernel_raise_policy_and_unknown_names():
+    kernel = _kernel_model()
+    for model in (kernel, YardageModelEnhanced()):
+        model.set_extrapolation("raise")
+        with pytest.raises(ValueError):
+            model.calculate_adjusted_yardage_batch([150, 150], "7-iron", altitude=[1000, 20000])
+        with pytest.raises(ValueError):
+            model.calculate_adjusted_yardage_batch(*_columns(n=50))
+    # Unset and zero conditions are skipped, so never out of range
+    kernel.calculate_adjusted_yardage_batch([150, 150], "7-iron", temperature=[np.nan, 0.0])
+    with pytest.raises(ValueError):
+        kernel.calculate_adjusted_yardage_batch(150, "7-iron", ball_model=["mid_range", "rock"])
+
+
+def test_factorize_finds_names_the_sample_missed(monkeypatch):
+    monkeypatch.setattr(yardage_kernel, "SAMPLE_ROWS", 4)
+    values = np.array(["driver"] * 97 + ["Driver", "7-iron", "driver-x"])
+    codes, names = factorize(values, len(values))
+    assert sorted(names.tolist()) == sorted(set(values.tolist()))
+    np.testing.assert_array_equal(names[codes], values)
+
+    codes, names = factorize("7-iron", 3)
+    assert codes.tolist() == [0, 0, 0] and names.tolist() == ["7-iron"]
+    assert factorize(np.array([], dtype=str), 0)[0].size == 0
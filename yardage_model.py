@@ -1,13 +1,33 @@
 import math
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple, Union
+
+import numpy as np
+
+from club_selection import ClubCarryIndex, ClubRecommendation
+from interpolation import InterpolationTable, StepTable
+
+ArrayLike = Union[float, str, np.ndarray, List]
 
 @dataclass
 class ShotResult:
     carry_distance: float  # Adjusted carry distance in yards
     lateral_movement: float  # Lateral movement in yards (+ is right, - is left)
 
+@dataclass
+class BatchShotResult:
+    carry_distance: np.ndarray  # Adjusted carry distances in yards
+    lateral_movement: np.ndarray  # Lateral movements in yards (+ is right, - is left)
+
+    def __len__(self) -> int:
+        return len(self.carry_distance)
+
+    def to_shot_results(self) -> List[ShotResult]:
+        """Unpack into one ShotResult per row."""
+        return [ShotResult(carry_distance=float(c), lateral_movement=float(l))
+                for c, l in zip(self.carry_distance, self.lateral_movement)]
+
 class SkillLevel(Enum):
     BEGINNER = "beginner"      # High HCP (17+)
     INTERMEDIATE = "intermediate"  # Mid HCP (9-16)
@@ -47,11 +67,27 @@ class YardageModel:
         8000: 1.190
     }
 
+    # Wind multiplier by shot height in feet from wind-effects.md (upper bound of each band)
+    WIND_GRADIENTS = {
+        10: 0.75,
+        50: 0.85,
+        100: 1.0,
+        150: 1.15
+    }
+    WIND_GRADIENT_ABOVE = 1.25  # Above the highest band
+
+    # Lookups built once from the tables above. Out-of-range inputs extend the
+    # nearest segment; see set_extrapolation for the other policies.
+    ALTITUDE_EFFECT_LOOKUP = InterpolationTable(ALTITUDE_EFFECTS)
+    WIND_GRADIENT_LOOKUP = StepTable(WIND_GRADIENTS, WIND_GRADIENT_ABOVE)
+
     def __init__(self):
         self.temperature: Optional[float] = None
         self.altitude: Optional[float] = None
         self.wind_speed: Optional[float] = None
         self.wind_direction: Optional[float] = None
+        self._carry_index: Optional[ClubCarryIndex] = None
+        self._carry_index_key: Optional[tuple] = None
 
     def set_conditions(self, temperature: float, altitude: float,
                       wind_speed: float, wind_direction: float):
@@ -61,31 +97,127 @@ class YardageModel:
         self.wind_speed = wind_speed
         self.wind_direction = wind_direction
 
+    def set_extrapolation(self, policy: str, fill_value: float = 1.0):
+        """
+        Choose how table lookups treat conditions outside the research tables.
+
+        Args:
+            policy: "linear" (extend the nearest segment), "clamp", "constant"
+                (return fill_value, the old behaviour) or "raise"
+            fill_value: Effect returned by the "constant" policy
+        """
+        self.ALTITUDE_EFFECT_LOOKUP = self.ALTITUDE_EFFECT_LOOKUP.with_extrapolation(policy, fill_value)
+        self._carry_index = None
+
     def _calculate_wind_gradient(self, height_ft: float) -> float:
         """Calculate wind multiplier based on shot height per wind-effects.md"""
-        if height_ft <= 10:
-            return 0.75
-        elif height_ft <= 50:
-            return 0.85
-        elif height_ft <= 100:
-            return 1.0
-        elif height_ft <= 150:
-            return 1.15
-        else:
-            return 1.25
+        return self.WIND_GRADIENT_LOOKUP(height_ft)
 
     def _calculate_altitude_effect(self, altitude: float) -> float:
         """Get exact altitude effect from research data"""
-        # Find the two closest altitude points and interpolate
-        alts = sorted(self.ALTITUDE_EFFECTS.keys())
-        for i in range(len(alts) - 1):
-            if alts[i] <= altitude <= alts[i + 1]:
-                alt1, alt2 = alts[i], alts[i + 1]
-                effect1, effect2 = self.ALTITUDE_EFFECTS[alt1], self.ALTITUDE_EFFECTS[alt2]
-                # Linear interpolation
-                ratio = (altitude - alt1) / (alt2 - alt1)
-                return effect1 + (effect2 - effect1) * ratio
-        return 1.0  # Default if altitude is out of range
+        return self.ALTITUDE_EFFECT_LOOKUP(altitude)
+
+    @staticmethod
+    def _condition_column(values: Optional[ArrayLike], default: Optional[float],
+                          size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Broadcast a condition to a column plus a mask of rows where it is set (truthy).
+        NaN marks a row as unset, like None in the scalar API.
+        """
+        if values is None:
+            values = default
+        if values is None:
+            return np.zeros(size), np.zeros(size, dtype=bool)
+        column = np.broadcast_to(np.asarray(values, dtype=float), (size,))
+        unset = np.isnan(column)
+        if unset.any():
+            column = np.where(unset, 0.0, column)
+        return column, column != 0
+
+    def _club_columns(self, club: ArrayLike, size: int) -> Dict[str, np.ndarray]:
+        """Per-row club characteristics for a scalar or array of club names."""
+        names = np.broadcast_to(np.char.lower(np.asarray(club, dtype=str)), (size,))
+        unique, inverse = np.unique(names, return_inverse=True)
+        for name in unique:
+            if name not in self.CLUB_DATABASE:
+                raise ValueError(f"Unknown club: {name}")
+        clubs = [self.CLUB_DATABASE[name] for name in unique]
+        return {
+            "ball_speed": np.array([c.ball_speed for c in clubs], dtype=float)[inverse],
+            "launch_angle": np.array([c.launch_angle for c in clubs], dtype=float)[inverse],
+            "spin_rate": np.array([c.spin_rate for c in clubs], dtype=float)[inverse],
+            "max_height": np.array([c.max_height for c in clubs], dtype=float)[inverse],
+            "wind_multiplier": np.array(
+                [self._calculate_wind_gradient(c.max_height * 3) for c in clubs], dtype=float)[inverse],
+        }
+
+    def calculate_adjusted_yardage_batch(self, target_yardage: ArrayLike,
+                                         club: ArrayLike,
+                                         temperature: Optional[ArrayLike] = None,
+                                         altitude: Optional[ArrayLike] = None,
+                                         wind_speed: Optional[ArrayLike] = None,
+                                         wind_direction: Optional[ArrayLike] = None,
+                                         rounded: bool = True) -> BatchShotResult:
+        """
+        Vectorized calculate_adjusted_yardage over columnar inputs.
+
+        Each argument may be a scalar or a 1-D array; scalars are broadcast to the
+        longest column. Conditions left as None fall back to the values given to
+        set_conditions, so a single call can cover every club x condition combination
+        of a round. Results match the scalar path row for row.
+
+        Args:
+            target_yardage: Target carry distances in yards
+            club: Club name(s) from CLUB_DATABASE
+            temperature, altitude, wind_speed, wind_direction: Per-row conditions (NaN = unset)
+            rounded: Round to 0.1 yards like the scalar path
+
+        Returns:
+            BatchShotResult: carry and lateral arrays, one entry per row
+        """
+        size = max(np.size(v) for v in (target_yardage, club, temperature, altitude,
+                                        wind_speed, wind_direction) if v is not None)
+        target = np.broadcast_to(np.asarray(target_yardage, dtype=float), (size,))
+        clubs = self._club_columns(club, size)
+        altitude, has_altitude = self._condition_column(altitude, self.altitude, size)
+        wind_speed, has_speed = self._condition_column(wind_speed, self.wind_speed, size)
+        wind_direction, has_direction = self._condition_column(wind_direction, self.wind_direction, size)
+
+        adjusted_yardage = target.copy()
+
+        # Altitude effects
+        altitude_effect = self.ALTITUDE_EFFECT_LOOKUP(altitude)
+        adjusted_yardage = np.where(has_altitude, adjusted_yardage * altitude_effect, adjusted_yardage)
+
+        # Wind effects (same operation order as the scalar path)
+        has_wind = has_speed & has_direction
+        wind_rad = np.radians(wind_direction)
+        distance_factor = adjusted_yardage / 300
+        speed_factor = np.sqrt(171 / clubs["ball_speed"])
+        height_factor = clubs["max_height"] / 35
+        effective_wind = wind_speed * clubs["wind_multiplier"]
+
+        wind_factor = np.cos(wind_rad)
+        head_tail_effect = effective_wind * np.abs(wind_factor) * distance_factor * speed_factor * 2.1
+        turbulence_reduction = 0.05 + (0.10 * height_factor)
+        head_tail_effect = head_tail_effect * (1 - turbulence_reduction)
+        windy_yardage = np.where(np.abs(wind_rad) > math.pi/2,
+                                 adjusted_yardage - head_tail_effect,
+                                 adjusted_yardage + head_tail_effect)
+        adjusted_yardage = np.where(has_wind, windy_yardage, adjusted_yardage)
+
+        cross_factor = np.sin(wind_rad)
+        cross_wind_effect = effective_wind * cross_factor * 0.35
+        lateral_base = (cross_wind_effect * distance_factor * speed_factor) * 3.0
+        spin_factor = np.sqrt(clubs["spin_rate"] / 2545)
+        loft_factor = np.sqrt(clubs["launch_angle"] / 10.4)
+        lateral_movement = lateral_base * (1 + (spin_factor + loft_factor - 2) * 0.2)
+        lateral_movement = np.where(has_wind, lateral_movement, 0.0)
+
+        if rounded:
+            adjusted_yardage = np.round(adjusted_yardage, 1)
+            lateral_movement = np.round(lateral_movement, 1)
+        return BatchShotResult(carry_distance=adjusted_yardage, lateral_movement=lateral_movement)
 
     def calculate_adjusted_yardage(self, target_yardage: float,
                                  skill_level: SkillLevel,
@@ -172,6 +304,34 @@ class YardageModel:
             lateral_movement=round(lateral_movement, 1)
         )
 
+    def _club_carry_index(self) -> ClubCarryIndex:
+        """Carry-per-yard index over CLUB_DATABASE, rebuilt only when conditions change."""
+        key = (self.temperature, self.altitude, self.wind_speed, self.wind_direction)
+        if self._carry_index is None or self._carry_index_key != key:
+            clubs = list(self.CLUB_DATABASE)
+            # Environment work happens once here, in one vectorized pass over the bag
+            per_yard = self.calculate_adjusted_yardage_batch(1.0, clubs, rounded=False)
+            self._carry_index = ClubCarryIndex(clubs, per_yard.carry_distance, per_yard.lateral_movement)
+            self._carry_index_key = key
+        return self._carry_index
+
+    def recommend_club(self, target_yardage: float, skill_level: SkillLevel,
+                       max_alternatives: int = 2) -> ClubRecommendation:
+        """
+        Recommend the club whose adjusted carry lands closest to the target, plus
+        ranked alternatives.
+        Note: skill_level parameter kept for API compatibility but not used.
+
+        Args:
+            target_yardage: The desired carry distance in yards
+            skill_level: Player's skill level (not used in calculation)
+            max_alternatives: Number of alternative clubs to return
+
+        Returns:
+            ClubRecommendation: Best club and alternatives with adjusted carries
+        """
+        return self._club_carry_index().recommend(target_yardage, max_alternatives)
+
     def get_optimal_club(self, target_yardage: float,
                         skill_level: SkillLevel) -> str:
         """
@@ -185,19 +345,4 @@ class YardageModel:
         Returns:
             str: Recommended club name
         """
-        min_diff = float('inf')
-        optimal_club = None
-        
-        for club_name in self.CLUB_DATABASE:
-            result = self.calculate_adjusted_yardage(
-                target_yardage=target_yardage,
-                skill_level=skill_level,  # Kept for API compatibility
-                club=club_name
-            )
-            diff = abs(target_yardage - result.carry_distance)
-            
-            if diff < min_diff:
-                min_diff = diff
-                optimal_club = club_name
-                
-        return optimal_club
+        return self.recommend_club(target_yardage, skill_level, max_alternatives=0).club
@@ -1,13 +1,36 @@
 import math
+import functools
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from club_selection import ClubCarryIndex, ClubRecommendation, LoftRecommendation
+from interpolation import InterpolationTable, StepTable
+from club_loft import LoftTable, parse_loft
+from instrumentation import Instrumentation, StageTimer
+
+ArrayLike = Union[float, str, np.ndarray, List]
 
 @dataclass
 class ShotResult:
     carry_distance: float  # Adjusted carry distance in yards
     lateral_movement: float  # Lateral movement in yards (+ is right, - is left)
 
+@dataclass
+class BatchShotResult:
+    carry_distance: np.ndarray  # Adjusted carry distances in yards
+    lateral_movement: np.ndarray  # Lateral movements in yards (+ is right, - is left)
+
+    def __len__(self) -> int:
+        return len(self.carry_distance)
+
+    def to_shot_results(self) -> List[ShotResult]:
+        """Unpack into one ShotResult per row."""
+        return [ShotResult(carry_distance=float(c), lateral_movement=float(l))
+                for c, l in zip(self.carry_distance, self.lateral_movement)]
+
 class SkillLevel(Enum):
     BEGINNER = "beginner"      # High HCP (17+)
     INTERMEDIATE = "intermediate"  # Mid HCP (9-16)
@@ -22,7 +45,7 @@ class BallModel:
     spin_factor: float
     temp_sensitivity: float
 
-@dataclass
+@dataclass(frozen=True)
 class ClubData:
     name: str
     ball_speed: float     # Ball speed in mph
@@ -31,16 +54,77 @@ class ClubData:
     max_height: float     # Max height in yards
     land_angle: float     # Landing angle in degrees
     spin_decay: float     # Spin decay rate in % per second
+    loft: Optional[float] = None  # Static loft in degrees (club_loft.py)
+
+@dataclass(frozen=True)
+class Conditions:
+    """Environmental conditions for a shot; None leaves the effect out."""
+    temperature: Optional[float] = None     # °F
+    altitude: Optional[float] = None        # Feet above sea level
+    wind_speed: Optional[float] = None      # mph
+    wind_direction: Optional[float] = None  # Degrees (0 is headwind, 180 is tailwind)
+
+@dataclass(frozen=True)
+class ShotRequest:
+    """Everything a calculation needs, passed explicitly instead of through model state."""
+    target_yardage: float
+    club: str
+    conditions: Conditions = Conditions()
+    ball_model: str = "mid_range"
+    skill_level: SkillLevel = SkillLevel.PROFESSIONAL
+    club_data: Optional[ClubData] = None  # Personal club characteristics (player_profiles.py)
+
+@dataclass(frozen=True)
+class EnvironmentSnapshot:
+    """Condition-dependent terms shared by every club and target in one set of conditions."""
+    temperature: Optional[float]
+    altitude: Optional[float]
+    wind_speed: Optional[float]
+    wind_direction: Optional[float]
+    has_temperature: bool
+    has_altitude: bool
+    has_wind: bool
+    air_density_factor: float        # 1.0 when no temperature effect applies
+    altitude_effect: float           # 1.0 when no altitude effect applies
+    wind_cos: float                  # cos of wind direction (+1 headwind)
+    wind_sin: float                  # sin of wind direction
+    wind_gradient: Mapping[str, float]  # Wind multiplier at each club's apex height
 
 class YardageModelEnhanced:
-    # PGA Tour average club data from pga-averages.md - only using ball flight characteristics
+    # PGA Tour average club data from pga-averages.md - only using ball flight characteristics.
+    # Lofts are typical stock lofts (club_loft.STOCK_LOFTS); other clubs are interpolated by loft.
     CLUB_DATABASE = {
-        "driver": ClubData("Driver", 171, 10.4, 2545, 35, 39, 0.08),
-        "3-wood": ClubData("3-Wood", 162, 9.3, 3663, 32, 44, 0.09),
-        "5-iron": ClubData("5-Iron", 135, 11.9, 5280, 33, 50, 0.11),
-        "7-iron": ClubData("7-Iron", 123, 16.1, 7124, 34, 51, 0.12),
-        "pitching-wedge": ClubData("Pitching Wedge", 104, 23.7, 9316, 32, 52, 0.15)
+        "driver": ClubData("Driver", 171, 10.4, 2545, 35, 39, 0.08, loft=10.5),
+        "3-wood": ClubData("3-Wood", 162, 9.3, 3663, 32, 44, 0.09, loft=15.0),
+        "5-wood": ClubData("5-Wood", 156, 9.7, 4322, 33, 48, 0.095, loft=18.0),
+        "hybrid": ClubData("Hybrid", 149, 10.2, 4587, 31, 49, 0.097, loft=19.0),
+        "3-iron": ClubData("3-Iron", 145, 10.3, 4404, 30, 48, 0.10, loft=21.0),
+        "4-iron": ClubData("4-Iron", 140, 10.8, 4782, 31, 49, 0.105, loft=24.0),
+        "5-iron": ClubData("5-Iron", 135, 11.9, 5280, 33, 50, 0.11, loft=27.0),
+        "6-iron": ClubData("6-Iron", 130, 14.0, 6204, 32, 50, 0.114, loft=30.0),
+        "7-iron": ClubData("7-Iron", 123, 16.1, 7124, 34, 51, 0.12, loft=34.0),
+        "8-iron": ClubData("8-Iron", 118, 17.8, 8078, 33, 51, 0.13, loft=38.0),
+        "9-iron": ClubData("9-Iron", 112, 20.0, 8793, 32, 52, 0.14, loft=42.0),
+        "pitching-wedge": ClubData("Pitching Wedge", 104, 23.7, 9316, 32, 52, 0.15, loft=46.0)
     }
+
+    # Stock carry in yards from pga-averages.md, for the loft search in optimal_loft
+    STOCK_CARRY = {
+        "driver": 282,
+        "3-wood": 249,
+        "5-wood": 236,
+        "hybrid": 231,
+        "3-iron": 218,
+        "4-iron": 209,
+        "5-iron": 199,
+        "6-iron": 188,
+        "7-iron": 176,
+        "8-iron": 164,
+        "9-iron": 152,
+        "pitching-wedge": 142
+    }
+    LOFT_TABLE = LoftTable.from_clubs(CLUB_DATABASE, STOCK_CARRY)
+    LOFT_CLUB_CACHE_SIZE = 256  # Club names resolved by loft kept by club_data
     
     # Altitude effects from altitude-effects.md
     ALTITUDE_EFFECTS = {
@@ -98,21 +182,60 @@ class YardageModelEnhanced:
         100: 0.94
     }
 
+    # Wind multiplier by shot height in feet from wind-effects.md (upper bound of each band)
+    WIND_GRADIENTS = {
+        10: 0.75,
+        50: 0.85,
+        100: 1.0,
+        150: 1.15
+    }
+    WIND_GRADIENT_ABOVE = 1.25  # Above the highest band
+
+    # Lookups built once from the tables above. Out-of-range inputs extend the
+    # nearest segment; see set_extrapolation for the other policies.
+    ALTITUDE_EFFECT_LOOKUP = InterpolationTable(ALTITUDE_EFFECTS)
+    AIR_DENSITY_LOOKUP = InterpolationTable(AIR_DENSITY_TABLE)
+    WIND_GRADIENT_LOOKUP = StepTable(WIND_GRADIENTS, WIND_GRADIENT_ABOVE)
+
     # Add spin decay rates from research
     SPIN_DECAY_RATES = {
         "driver": 0.08,    # 8% per second
         "3-wood": 0.09,    # 9% per second
+        "5-wood": 0.095,   # Clubs between the researched ones are interpolated by loft
+        "hybrid": 0.097,
+        "3-iron": 0.10,
+        "4-iron": 0.105,
         "5-iron": 0.11,    # 11% per second
+        "6-iron": 0.114,
         "7-iron": 0.12,    # 12% per second
+        "8-iron": 0.13,
+        "9-iron": 0.14,
         "pitching-wedge": 0.15  # 15% per second
     }
 
+    # Wind response factors, hand-tuned against wind-effects.md (fit with calibration.py)
+    HEADWIND_FACTOR = 1.5   # Headwinds cost this much more than tailwinds give back
+    HEAD_TAIL_SCALE = 1.2   # Yards of carry per unit of effective head/tail wind
+    CROSSWIND_FACTOR = 0.35
+    LATERAL_SCALE = 3.0     # Yards of lateral movement per unit of effective crosswind
+    WIND_FACTORS = ("HEADWIND_FACTOR", "HEAD_TAIL_SCALE", "CROSSWIND_FACTOR", "LATERAL_SCALE")
+
     def __init__(self):
         self.temperature: Optional[float] = None
         self.altitude: Optional[float] = None
         self.wind_speed: Optional[float] = None
         self.wind_direction: Optional[float] = None
         self.ball_model: str = "mid_range"  # Default to mid-range ball
+        # Shared caches are only ever replaced whole, so concurrent readers see
+        # either the old or the new entry, never a half-updated one
+        self._carry_index_cache = functools.lru_cache(maxsize=64)(self._build_carry_index)
+        self._last_environment: Optional[Tuple[Conditions, EnvironmentSnapshot]] = None
+        self._last_environment_hits = 0  # Repeats served before reaching the snapshot cache
+        self._last_conditions: Optional[Tuple[tuple, Conditions]] = None
+        self._snapshot_cache = None
+        self._cache_resolution: Dict[str, float] = {}
+        self._loft_clubs = functools.lru_cache(maxsize=self.LOFT_CLUB_CACHE_SIZE)(self._build_loft_club)
+        self.instrumentation: Optional[Instrumentation] = None
 
     def set_conditions(self, temperature: float, altitude: float,
                       wind_speed: float, wind_direction: float):
@@ -121,6 +244,155 @@ class YardageModelEnhanced:
         self.altitude = altitude
         self.wind_speed = wind_speed
         self.wind_direction = wind_direction
+        self.environment()
+
+    def enable_environment_cache(self, maxsize: int = 256,
+                                 resolution: Optional[Dict[str, float]] = None):
+        """
+        Reuse environment snapshots through an LRU cache keyed on quantized conditions.
+
+        Args:
+            maxsize: Number of snapshots to keep
+            resolution: Quantization step per condition, e.g. {"temperature": 1.0,
+                "wind_direction": 5.0}; conditions without a step are keyed exactly
+        """
+        self._cache_resolution = dict(resolution or {})
+        self._snapshot_cache = functools.lru_cache(maxsize=maxsize)(self._build_environment)
+        self._last_environment = None
+        self._last_environment_hits = 0
+
+    def environment_cache_stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters of the environment cache for monitoring. Hits include
+        repeats of the last conditions, which are served without a cache lookup
+        and are also counted separately as last_hits.
+        """
+        if self._snapshot_cache is None:
+            return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0, "last_hits": 0}
+        info = self._snapshot_cache.cache_info()
+        last_hits = self._last_environment_hits
+        return {"hits": info.hits + last_hits, "misses": info.misses, "size": info.currsize,
+                "maxsize": info.maxsize, "last_hits": last_hits}
+
+    def _quantize(self, name: str, value: Optional[float]) -> Optional[float]:
+        step = self._cache_resolution.get(name)
+        if value is None or not step:
+            return value
+        return round(value / step) * step
+
+    def _build_environment(self, temperature: Optional[float], altitude: Optional[float],
+                           wind_speed: Optional[float],
+                           wind_direction: Optional[float]) -> EnvironmentSnapshot:
+        """Compute the temperature, altitude and wind terms for one set of conditions."""
+        has_temperature = bool(temperature)
+        has_altitude = bool(altitude)
+        has_wind = bool(wind_speed) and wind_direction is not None
+        # 0° is headwind, 180° is tailwind
+        wind_rad = math.radians(wind_direction) if has_wind else 0.0
+        return EnvironmentSnapshot(
+            temperature=temperature,
+            altitude=altitude,
+            wind_speed=wind_speed,
+            wind_direction=wind_direction,
+            has_temperature=has_temperature,
+            has_altitude=has_altitude,
+            has_wind=has_wind,
+            air_density_factor=self._calculate_air_density(temperature) if has_temperature else 1.0,
+            altitude_effect=self._calculate_altitude_effect(altitude) if has_altitude else 1.0,
+            wind_cos=math.cos(wind_rad),
+            wind_sin=math.sin(wind_rad),
+            wind_gradient={name: self._calculate_wind_gradient(club.max_height * 3)
+                           for name, club in self.CLUB_DATABASE.items()},
+        )
+
+    def environment_for(self, conditions: Conditions) -> EnvironmentSnapshot:
+        """Snapshot for the given conditions, reusing the last one when they repeat."""
+        last = self._last_environment
+        if last is not None and (last[0] is conditions or last[0] == conditions):
+            self._last_environment_hits += 1
+            return last[1]
+        if self._snapshot_cache is not None:
+            env = self._snapshot_cache(self._quantize("temperature", conditions.temperature),
+                                       self._quantize("altitude", conditions.altitude),
+                                       self._quantize("wind_speed", conditions.wind_speed),
+                                       self._quantize("wind_direction", conditions.wind_direction))
+        else:
+            env = self._build_environment(conditions.temperature, conditions.altitude,
+                                          conditions.wind_speed, conditions.wind_direction)
+        self._last_environment = (conditions, env)
+        return env
+
+    @property
+    def conditions(self) -> Conditions:
+        """Conditions set with set_conditions, as a value object."""
+        key = (self.temperature, self.altitude, self.wind_speed, self.wind_direction)
+        last = self._last_conditions
+        if last is None or last[0] != key:
+            last = self._last_conditions = (key, Conditions(*key))
+        return last[1]
+
+    def environment(self) -> EnvironmentSnapshot:
+        """Snapshot for the conditions set with set_conditions."""
+        return self.environment_for(self.conditions)
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        """
+        Attach per-stage counters and timers to calculate and the batch API, or detach with None.
+
+        Calls are recorded under the model's class name, so several engines can
+        share one Instrumentation and be compared directly.
+        """
+        self.instrumentation = instrumentation
+
+    def set_extrapolation(self, policy: str, fill_value: float = 1.0):
+        """
+        Choose how table lookups treat conditions outside the research tables.
+
+        Args:
+            policy: "linear" (extend the nearest segment), "clamp", "constant"
+                (return fill_value, the old behaviour) or "raise"
+            fill_value: Effect returned by the "constant" policy
+        """
+        self.ALTITUDE_EFFECT_LOOKUP = self.ALTITUDE_EFFECT_LOOKUP.with_extrapolation(policy, fill_value)
+        self.AIR_DENSITY_LOOKUP = self.AIR_DENSITY_LOOKUP.with_extrapolation(policy, fill_value)
+        # Cached snapshots were computed under the previous policy
+        self._clear_caches()
+
+    def _clear_caches(self):
+        if self._snapshot_cache is not None:
+            self._snapshot_cache = functools.lru_cache(
+                maxsize=self._snapshot_cache.cache_info().maxsize)(self._build_environment)
+        self._last_environment = None
+        self._last_environment_hits = 0
+        self._carry_index_cache.cache_clear()
+
+    def apply_parameters(self, parameters: Mapping[str, object]):
+        """
+        Replace constant tables and factors on this instance, e.g. with a calibration bundle.
+
+        Args:
+            parameters: Any of CLUB_DATABASE and BALL_MODELS (name -> field dict),
+                SPIN_DECAY_RATES (club -> rate) and the wind factors in WIND_FACTORS
+        """
+        for name, value in parameters.items():
+            if name == "CLUB_DATABASE":
+                self.CLUB_DATABASE = {club: ClubData(**fields) for club, fields in value.items()}
+                try:
+                    self.LOFT_TABLE = LoftTable.from_clubs(self.CLUB_DATABASE, self.STOCK_CARRY)
+                except ValueError:
+                    pass  # Fewer than two clubs with lofts: keep the stock loft table
+                self._loft_clubs = functools.lru_cache(
+                    maxsize=self.LOFT_CLUB_CACHE_SIZE)(self._build_loft_club)
+            elif name == "BALL_MODELS":
+                self.BALL_MODELS = {ball: BallModel(**fields) for ball, fields in value.items()}
+            elif name == "SPIN_DECAY_RATES":
+                self.SPIN_DECAY_RATES = {club: float(rate) for club, rate in value.items()}
+            elif name in self.WIND_FACTORS:
+                setattr(self, name, float(value))
+            else:
+                raise ValueError(f"Unknown model parameter: {name}")
+        # Snapshots and carry indexes were computed from the previous tables
+        self._clear_caches()
 
     def set_ball_model(self, model: str):
         """Set the ball model being used."""
@@ -128,60 +400,248 @@ class YardageModelEnhanced:
             raise ValueError(f"Unknown ball model: {model}")
         self.ball_model = model
 
+    def club_data(self, club: str) -> ClubData:
+        """
+        Stock ClubData for a club name: its CLUB_DATABASE entry, or for other
+        clubs of a full bag ("sand-wedge") and loft names ("56-degree") the
+        characteristics interpolated from LOFT_TABLE at that loft.
+        """
+        key = club.lower()
+        data = self.CLUB_DATABASE.get(key)
+        if data is not None:
+            return data
+        # Names come from requests, so only the most recent LOFT_CLUB_CACHE_SIZE are kept
+        return self._loft_clubs(key)
+
+    def _build_loft_club(self, key: str) -> ClubData:
+        loft = parse_loft(key)
+        values = self.LOFT_TABLE(loft)
+        values.pop("carry", None)
+        return ClubData(name=key.replace("-", " ").title(), loft=loft, **values)
+
+    def loft_columns(self, loft: ArrayLike) -> Dict[str, np.ndarray]:
+        """Club columns for _adjusted_columns at any lofts, interpolated in one pass."""
+        values = self.LOFT_TABLE(np.atleast_1d(np.asarray(loft, dtype=float)))
+        values["wind_multiplier"] = self.WIND_GRADIENT_LOOKUP(values["max_height"] * 3)
+        return values
+
     def _calculate_wind_gradient(self, height_ft: float) -> float:
         """Calculate wind multiplier based on shot height."""
-        if height_ft <= 10:
-            return 0.75
-        elif height_ft <= 50:
-            return 0.85
-        elif height_ft <= 100:
-            return 1.0
-        elif height_ft <= 150:
-            return 1.15
-        else:
-            return 1.25
+        return self.WIND_GRADIENT_LOOKUP(height_ft)
 
     def _calculate_altitude_effect(self, altitude: float) -> float:
         """Get exact altitude effect from research data."""
-        alts = sorted(self.ALTITUDE_EFFECTS.keys())
-        for i in range(len(alts) - 1):
-            if alts[i] <= altitude <= alts[i + 1]:
-                alt1, alt2 = alts[i], alts[i + 1]
-                effect1, effect2 = self.ALTITUDE_EFFECTS[alt1], self.ALTITUDE_EFFECTS[alt2]
-                ratio = (altitude - alt1) / (alt2 - alt1)
-                return effect1 + (effect2 - effect1) * ratio
-        return 1.0
+        return self.ALTITUDE_EFFECT_LOOKUP(altitude)
 
     def _calculate_air_density(self, temperature: float) -> float:
         """Calculate air density factor based on temperature."""
-        temps = sorted(self.AIR_DENSITY_TABLE.keys())
-        for i in range(len(temps) - 1):
-            if temps[i] <= temperature <= temps[i + 1]:
-                temp1, temp2 = temps[i], temps[i + 1]
-                density1 = self.AIR_DENSITY_TABLE[temp1]
-                density2 = self.AIR_DENSITY_TABLE[temp2]
-                ratio = (temperature - temp1) / (temp2 - temp1)
-                return density1 + (density2 - density1) * ratio
-        return 1.0  # Default to baseline if out of range
-
-    def _calculate_spin_decay(self, club: str, initial_spin: float, flight_time: float) -> float:
+        return self.AIR_DENSITY_LOOKUP(temperature)
+
+    def _calculate_spin_decay(self, club: str, initial_spin: float, flight_time: float,
+                              decay_rate: Optional[float] = None) -> float:
         """Calculate average spin rate accounting for non-linear decay."""
-        decay_rate = self.SPIN_DECAY_RATES[club]
+        if decay_rate is None:
+            decay_rate = self.SPIN_DECAY_RATES[club]
         # Using research model: average spin = initial_spin * (1 - decay_rate * time/2)
         return initial_spin * (1 - decay_rate * flight_time/2)
 
+    @staticmethod
+    def _condition_column(values: Optional[ArrayLike], default: Optional[float],
+                          size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Broadcast a condition to a column plus a mask of rows where it is set.
+        NaN marks a row as unset, like None in the scalar API.
+        """
+        if values is None:
+            values = default
+        if values is None:
+            return np.zeros(size), np.zeros(size, dtype=bool)
+        column = np.broadcast_to(np.asarray(values, dtype=float), (size,))
+        unset = np.isnan(column)
+        if unset.any():
+            return np.where(unset, 0.0, column), ~unset
+        return column, np.ones(size, dtype=bool)
+
+    def _club_columns(self, club: ArrayLike, size: int) -> Dict[str, np.ndarray]:
+        """Per-row club characteristics for a scalar or array of club names."""
+        names = np.broadcast_to(np.char.lower(np.asarray(club, dtype=str)), (size,))
+        unique, inverse = np.unique(names, return_inverse=True)
+        clubs = [self.club_data(name) for name in unique]
+        return {
+            "ball_speed": np.array([c.ball_speed for c in clubs], dtype=float)[inverse],
+            "launch_angle": np.array([c.launch_angle for c in clubs], dtype=float)[inverse],
+            "spin_rate": np.array([c.spin_rate for c in clubs], dtype=float)[inverse],
+            "max_height": np.array([c.max_height for c in clubs], dtype=float)[inverse],
+            "wind_multiplier": np.array(
+                [self._calculate_wind_gradient(c.max_height * 3) for c in clubs], dtype=float)[inverse],
+        }
+
+    def _ball_columns(self, ball_model: Optional[ArrayLike], size: int) -> Dict[str, np.ndarray]:
+        """Per-row ball characteristics, defaulting to the model set with set_ball_model."""
+        names = np.broadcast_to(np.asarray(self.ball_model if ball_model is None else ball_model,
+                                           dtype=str), (size,))
+        unique, inverse = np.unique(names, return_inverse=True)
+        for name in unique:
+            if name not in self.BALL_MODELS:
+                raise ValueError(f"Unknown ball model: {name}")
+        balls = [self.BALL_MODELS[name] for name in unique]
+        return {
+            "speed_factor": np.array([b.speed_factor for b in balls], dtype=float)[inverse],
+            "spin_factor": np.array([b.spin_factor for b in balls], dtype=float)[inverse],
+            "temp_sensitivity": np.array([b.temp_sensitivity for b in balls], dtype=float)[inverse],
+        }
+
+    def calculate_adjusted_yardage_batch(self, target_yardage: ArrayLike,
+                                         club: ArrayLike,
+                                         temperature: Optional[ArrayLike] = None,
+                                         altitude: Optional[ArrayLike] = None,
+                                         wind_speed: Optional[ArrayLike] = None,
+                                         wind_direction: Optional[ArrayLike] = None,
+                                         ball_model: Optional[ArrayLike] = None,
+                                         rounded: bool = True) -> BatchShotResult:
+        """
+        Vectorized calculate_adjusted_yardage over columnar inputs.
+
+        Each argument may be a scalar or a 1-D array; scalars are broadcast to the
+        longest column. Conditions and ball model left as None fall back to the values
+        given to set_conditions/set_ball_model, so a single call can cover every
+        club x condition x ball combination of a round. Results match the scalar path
+        row for row.
+
+        Args:
+            target_yardage: Target carry distances in yards
+            club: Club name(s) from CLUB_DATABASE
+            temperature, altitude, wind_speed, wind_direction: Per-row conditions (NaN = unset)
+            ball_model: Ball model name(s) from BALL_MODELS
+            rounded: Round to 0.1 yards like the scalar path
+
+        Returns:
+            BatchShotResult: carry and lateral arrays, one entry per row
+        """
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__, "batch")
+        size = max(np.size(v) for v in (target_yardage, club, temperature, altitude,
+                                        wind_speed, wind_direction, ball_model) if v is not None)
+        target = np.broadcast_to(np.asarray(target_yardage, dtype=float), (size,))
+        clubs = self._club_columns(club, size)
+        balls = self._ball_columns(ball_model, size)
+        conditions = self._condition_columns(temperature, altitude, wind_speed, wind_direction, size)
+        if timer is not None:
+            timer.mark("environment")
+
+        adjusted_yardage, lateral_movement = self._adjusted_columns(target, clubs, balls, conditions, timer)
+        if rounded:
+            adjusted_yardage = np.round(adjusted_yardage, 1)
+            lateral_movement = np.round(lateral_movement, 1)
+        if timer is not None:
+            timer.mark("wind")
+            timer.finish(size)
+        return BatchShotResult(carry_distance=adjusted_yardage, lateral_movement=lateral_movement)
+
+    def _condition_columns(self, temperature: Optional[ArrayLike], altitude: Optional[ArrayLike],
+                           wind_speed: Optional[ArrayLike], wind_direction: Optional[ArrayLike],
+                           size: int) -> Dict[str, np.ndarray]:
+        """Per-row conditions plus has_<name> masks, defaulting to the values from set_conditions."""
+        columns = {}
+        for name, values in (("temperature", temperature), ("altitude", altitude),
+                             ("wind_speed", wind_speed), ("wind_direction", wind_direction)):
+            columns[name], columns["has_" + name] = self._condition_column(values, getattr(self, name), size)
+        return columns
+
+    def _adjusted_columns(self, target: np.ndarray, clubs: Dict[str, np.ndarray],
+                          balls: Dict[str, np.ndarray], conditions: Dict[str, np.ndarray],
+                          timer: Optional[StageTimer] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unrounded carry and lateral movement from resolved columns.
+
+        The batch API resolves names and conditions once and calls this; callers that
+        evaluate the same rows many times (e.g. calibration.py) can reuse the columns.
+        """
+        temperature = conditions["temperature"]
+        altitude = conditions["altitude"]
+        wind_speed = conditions["wind_speed"]
+        wind_direction = conditions["wind_direction"]
+
+        # Apply ball speed effect
+        adjusted_yardage = target * balls["speed_factor"]
+        if timer is not None:
+            timer.mark("ball")
+
+        # Enhanced temperature effects (skipped when unset or 0°F, as in the scalar path)
+        has_temperature = conditions["has_temperature"] & (temperature != 0)
+        # Rows without the effect look up an in-range key, so the raise policy only sees used rows
+        air_density_factor = self.AIR_DENSITY_LOOKUP(
+            np.where(has_temperature, temperature, self.AIR_DENSITY_LOOKUP.keys[0]))
+        ball_temp_effect = 1 + ((temperature - 70) * 0.003 * balls["temp_sensitivity"])
+        temp_effect = (2 * ball_temp_effect + air_density_factor) / 3
+        adjusted_yardage = np.where(has_temperature, adjusted_yardage * temp_effect, adjusted_yardage)
+        if timer is not None:
+            timer.mark("temperature")
+
+        # Altitude effects
+        has_altitude = conditions["has_altitude"] & (altitude != 0)
+        altitude_effect = self.ALTITUDE_EFFECT_LOOKUP(
+            np.where(has_altitude, altitude, self.ALTITUDE_EFFECT_LOOKUP.keys[0]))
+        adjusted_yardage = np.where(has_altitude, adjusted_yardage * altitude_effect, adjusted_yardage)
+        if timer is not None:
+            timer.mark("altitude")
+
+        # Wind effects (same operation order as the scalar path)
+        has_wind = conditions["has_wind_speed"] & (wind_speed != 0) & conditions["has_wind_direction"]
+        wind_rad = np.radians(wind_direction)
+        distance_factor = adjusted_yardage / 300
+        speed_factor = np.sqrt(171 / (clubs["ball_speed"] * balls["speed_factor"]))
+        effective_wind = wind_speed * clubs["wind_multiplier"]
+
+        wind_factor = np.cos(wind_rad)
+        wind_factor = np.where(wind_factor > 0, wind_factor * self.HEADWIND_FACTOR, wind_factor)
+        head_tail_effect = effective_wind * wind_factor * distance_factor * speed_factor * self.HEAD_TAIL_SCALE
+        height_effect = np.sqrt(clubs["max_height"] / 35)
+        head_tail_effect = head_tail_effect * height_effect
+        adjusted_yardage = np.where(has_wind, adjusted_yardage - head_tail_effect, adjusted_yardage)
+
+        cross_factor = np.sin(wind_rad)
+        cross_wind_effect = effective_wind * cross_factor * self.CROSSWIND_FACTOR
+        lateral_base = (cross_wind_effect * distance_factor * speed_factor) * self.LATERAL_SCALE
+        spin_factor = np.sqrt((clubs["spin_rate"] * balls["spin_factor"]) / 2545)
+        loft_factor = np.sqrt(clubs["launch_angle"] / 10.4)
+        lateral_movement = lateral_base * (1 + (spin_factor + loft_factor - 2) * 0.2)
+        lateral_movement = np.where(has_wind, lateral_movement, 0.0)
+        return adjusted_yardage, lateral_movement
+
     def calculate_adjusted_yardage(self, target_yardage: float,
                                  skill_level: SkillLevel,
                                  club: str) -> ShotResult:
-        """Calculate the adjusted yardage with enhanced temperature and spin effects."""
-        if club.lower() not in self.CLUB_DATABASE:
-            raise ValueError(f"Unknown ball model: {club}")
+        """Calculate the adjusted yardage in the conditions set with set_conditions."""
+        return self.calculate(ShotRequest(target_yardage, club, self.conditions,
+                                          self.ball_model, skill_level))
+
+    def calculate(self, request: ShotRequest) -> ShotResult:
+        """
+        Calculate the adjusted yardage with enhanced temperature and spin effects.
 
-        club_data = self.CLUB_DATABASE[club.lower()]
-        ball = self.BALL_MODELS[self.ball_model]
+        Reads nothing set by set_conditions or set_ball_model, so one model can
+        serve concurrent requests from many threads.
+
+        Args:
+            request: Target, club, conditions and ball model for the shot
+
+        Returns:
+            ShotResult: Adjusted carry and lateral movement
+        """
+        timer = None if self.instrumentation is None else \
+            self.instrumentation.start(type(self).__name__)
+        club = request.club
+        club_data = request.club_data or self.club_data(club)
+        if request.ball_model not in self.BALL_MODELS:
+            raise ValueError(f"Unknown ball model: {request.ball_model}")
+        ball = self.BALL_MODELS[request.ball_model]
+        env = self.environment_for(request.conditions)
+        if timer is not None:
+            timer.mark("environment")
         
         # Start with target yardage
-        adjusted_yardage = target_yardage
+        adjusted_yardage = request.target_yardage
         
         # Apply ball speed effect
         adjusted_yardage *= ball.speed_factor
@@ -191,48 +651,53 @@ class YardageModelEnhanced:
         initial_velocity_fps = club_data.ball_speed * 1.467 * ball.speed_factor  # mph to ft/s
         launch_rad = math.radians(club_data.launch_angle)
         flight_time = (2 * initial_velocity_fps * math.sin(launch_rad)) / gravity
+        if timer is not None:
+            timer.mark("ball")
         
         # Enhanced temperature effects
-        if self.temperature:
-            # Air density effect
-            air_density_factor = self._calculate_air_density(self.temperature)
+        if env.has_temperature:
             # Ball temperature effect (from research)
-            ball_temp_effect = 1 + ((self.temperature - 70) * 0.003 * ball.temp_sensitivity)
-            # Combined temperature effect
-            temp_effect = (2 * ball_temp_effect + air_density_factor) / 3  # Weighted average
+            ball_temp_effect = 1 + ((env.temperature - 70) * 0.003 * ball.temp_sensitivity)
+            # Combined with the air density effect
+            temp_effect = (2 * ball_temp_effect + env.air_density_factor) / 3  # Weighted average
             adjusted_yardage *= temp_effect
+        if timer is not None:
+            timer.mark("temperature")
         
         # Altitude effects with enhanced spin
-        if self.altitude:
-            altitude_effect = self._calculate_altitude_effect(self.altitude)
+        if env.has_altitude:
             # Calculate spin with decay
             initial_spin = club_data.spin_rate * ball.spin_factor
-            average_spin = self._calculate_spin_decay(club.lower(), initial_spin, flight_time)
+            average_spin = self._calculate_spin_decay(
+                club.lower(), initial_spin, flight_time,
+                None if club_data is self.CLUB_DATABASE.get(club.lower()) else club_data.spin_decay)
             # Apply altitude effect directly (spin is already accounted for in the altitude table)
-            adjusted_yardage *= altitude_effect
+            adjusted_yardage *= env.altitude_effect
+        if timer is not None:
+            timer.mark("altitude")
         
         # Wind effects
         lateral_movement = 0.0
-        if self.wind_speed and self.wind_direction is not None:
-            # Convert wind direction to radians (0° is headwind, 180° is tailwind)
-            wind_rad = math.radians(self.wind_direction)
+        if env.has_wind:
             distance_factor = adjusted_yardage / 300  # Normalize to driver distance
             
             # Ball speed affects time in air for given distance
             speed_factor = math.sqrt(171 / (club_data.ball_speed * ball.speed_factor))
             height_factor = club_data.max_height / 35
             
-            wind_multiplier = self._calculate_wind_gradient(club_data.max_height * 3)
-            effective_wind = self.wind_speed * wind_multiplier
+            if club_data is self.CLUB_DATABASE.get(club.lower()):
+                effective_wind = env.wind_speed * env.wind_gradient[club.lower()]
+            else:
+                effective_wind = env.wind_speed * self._calculate_wind_gradient(club_data.max_height * 3)
             
             # Calculate head/tail wind effect
-            wind_factor = math.cos(wind_rad)  # +1 for headwind (0°), -1 for tailwind (180°)
+            wind_factor = env.wind_cos  # +1 for headwind (0°), -1 for tailwind (180°)
             
             # Headwinds have 1.5x effect, tailwinds 1x (based on research)
             if wind_factor > 0:  # Headwind
-                wind_factor *= 1.5  # Increase headwind by 50%
+                wind_factor *= self.HEADWIND_FACTOR  # Increase headwind by 50%
                 
-            head_tail_effect = effective_wind * wind_factor * distance_factor * speed_factor * 1.2
+            head_tail_effect = effective_wind * wind_factor * distance_factor * speed_factor * self.HEAD_TAIL_SCALE
             
             # Height affects wind impact
             height_effect = math.sqrt(club_data.max_height / 35)  # Normalized to driver height
@@ -242,9 +707,9 @@ class YardageModelEnhanced:
             adjusted_yardage -= head_tail_effect  # Subtract because headwind (negative wind_factor) should reduce distance
             
             # Calculate crosswind effect (90° is right to left, 270° is left to right)
-            cross_factor = math.sin(wind_rad)
-            cross_wind_effect = effective_wind * cross_factor * 0.35
-            lateral_base = (cross_wind_effect * distance_factor * speed_factor) * 3.0
+            cross_factor = env.wind_sin
+            cross_wind_effect = effective_wind * cross_factor * self.CROSSWIND_FACTOR
+            lateral_base = (cross_wind_effect * distance_factor * speed_factor) * self.LATERAL_SCALE
             
             # Apply club characteristics as modifiers
             spin_factor = math.sqrt((club_data.spin_rate * ball.spin_factor) / 2545)
@@ -252,7 +717,153 @@ class YardageModelEnhanced:
             
             lateral_movement = lateral_base * (1 + (spin_factor + loft_factor - 2) * 0.2)
 
-        return ShotResult(
+        result = ShotResult(
             carry_distance=round(adjusted_yardage, 1),
             lateral_movement=round(lateral_movement, 1)
         )
+        if timer is not None:
+            timer.mark("wind")
+            timer.finish()
+        return result
+
+    def _build_carry_index(self, temperature: Optional[float], altitude: Optional[float],
+                           wind_speed: Optional[float], wind_direction: Optional[float],
+                           ball_model: str) -> ClubCarryIndex:
+        """Carry-per-yard index over CLUB_DATABASE for one set of conditions."""
+        clubs = list(self.CLUB_DATABASE)
+        # Environment work happens once here, in one vectorized pass over the bag.
+        # Unset conditions are passed as NaN so the batch path skips them like None.
+        per_yard = self.calculate_adjusted_yardage_batch(
+            1.0, clubs, *(np.nan if value is None else value
+                          for value in (temperature, altitude, wind_speed, wind_direction)),
+            ball_model, rounded=False)
+        return ClubCarryIndex(clubs, per_yard.carry_distance, per_yard.lateral_movement)
+
+    def carry_indexes(self, conditions: Sequence[Conditions],
+                      ball_model: Optional[str] = None) -> List[ClubCarryIndex]:
+        """
+        Carry-per-yard indexes for several sets of conditions, as recommend() uses them.
+
+        Every entry goes through environment_for and the carry index cache, so
+        conditions seen before (and, with enable_environment_cache, conditions
+        within its resolution) reuse their index instead of another batch call.
+
+        Args:
+            conditions: Condition sets, e.g. the weather windows of a round
+            ball_model: Ball model from BALL_MODELS (default: the one set with set_ball_model)
+
+        Returns:
+            List[ClubCarryIndex]: One index per entry of conditions
+        """
+        return [self._club_carry_index(entry, ball_model) for entry in conditions]
+
+    def _club_carry_index(self, conditions: Optional[Conditions] = None,
+                          ball_model: Optional[str] = None) -> ClubCarryIndex:
+        """Carry-per-yard index, cached per set of (quantized) conditions and ball model."""
+        env = self.environment_for(self.conditions if conditions is None else conditions)
+        return self._carry_index_cache(env.temperature, env.altitude, env.wind_speed,
+                                       env.wind_direction, ball_model or self.ball_model)
+
+    def recommend(self, target_yardage: float, conditions: Conditions = Conditions(),
+                  ball_model: str = "mid_range", max_alternatives: int = 2) -> ClubRecommendation:
+        """
+        Stateless recommend_club: best club and ranked alternatives for explicit conditions.
+
+        Args:
+            target_yardage: The desired carry distance in yards
+            conditions: Conditions for the shot
+            ball_model: Ball model from BALL_MODELS
+            max_alternatives: Number of alternative clubs to return
+
+        Returns:
+            ClubRecommendation: Best club and alternatives with adjusted carries
+        """
+        return self._club_carry_index(conditions, ball_model).recommend(target_yardage, max_alternatives)
+
+    def recommend_club(self, target_yardage: float, skill_level: SkillLevel,
+                       max_alternatives: int = 2) -> ClubRecommendation:
+        """
+        Recommend the club whose adjusted carry lands closest to the target, plus
+        ranked alternatives.
+        Note: skill_level parameter kept for API compatibility but not used.
+
+        Args:
+            target_yardage: The desired carry distance in yards
+            skill_level: Player's skill level (not used in calculation)
+            max_alternatives: Number of alternative clubs to return
+
+        Returns:
+            ClubRecommendation: Best club and alternatives with adjusted carries
+        """
+        return self._club_carry_index().recommend(target_yardage, max_alternatives)
+
+    def get_optimal_club(self, target_yardage: float,
+                        skill_level: SkillLevel) -> str:
+        """
+        Recommend the optimal club for the target yardage.
+        Note: skill_level parameter kept for API compatibility but not used.
+
+        Args:
+            target_yardage: The desired carry distance in yards
+            skill_level: Player's skill level (not used in calculation)
+
+        Returns:
+            str: Recommended club name
+        """
+        return self.recommend_club(target_yardage, skill_level, max_alternatives=0).club
+
+    def optimal_loft(self, target_yardage: float, conditions: Conditions = Conditions(),
+                     ball_model: str = "mid_range", step: float = 0.25) -> LoftRecommendation:
+        """
+        Loft whose stock full swing carries the target in these conditions.
+
+        Searches loft continuously instead of club by club: the adjusted carry of
+        the stock shot at every loft of a LOFT_TABLE grid is evaluated in one
+        vectorized pass, and the loft where it crosses the target is
+        interpolated between grid points. Targets beyond the longest or short of
+        the shortest loft get that end of the range.
+
+        Args:
+            target_yardage: The desired carry distance in yards
+            conditions: Conditions for the shot
+            ball_model: Ball model from BALL_MODELS
+            step: Loft grid spacing in degrees
+
+        Returns:
+            LoftRecommendation: Loft, nearest bag club and the adjusted carry at that loft
+        """
+        if "carry" not in self.LOFT_TABLE.fields:
+            raise ValueError("LOFT_TABLE has no stock carry to search")
+        lofts = self.LOFT_TABLE.grid(step)
+        size = len(lofts)
+        clubs = self.loft_columns(lofts)
+        balls = self._ball_columns(ball_model, size)
+        columns = self._condition_columns(*(np.nan if value is None else value
+                                            for value in (conditions.temperature, conditions.altitude,
+                                                          conditions.wind_speed, conditions.wind_direction)),
+                                          size)
+        stock = self.LOFT_TABLE(lofts)["carry"]
+        carry, lateral = self._adjusted_columns(stock, clubs, balls, columns)
+
+        # Carry falls with loft; take the first grid segment that brackets the target
+        long_enough = carry >= target_yardage
+        if not long_enough[0]:
+            i, fraction = 0, 0.0
+        elif long_enough.all():
+            i, fraction = size - 2, 1.0
+        else:
+            i = int(np.argmin(long_enough)) - 1
+            fraction = (carry[i] - target_yardage) / (carry[i] - carry[i + 1])
+
+        def at(values: np.ndarray) -> float:
+            return float(values[i] + (values[i + 1] - values[i]) * fraction)
+
+        loft = at(lofts)
+        bag = [(abs(data.loft - loft), name) for name, data in self.CLUB_DATABASE.items() if data.loft is not None]
+        return LoftRecommendation(
+            loft=round(loft, 1),
+            club=min(bag)[1] if bag else "",
+            stock_carry=round(at(stock), 1),
+            carry_distance=round(at(carry), 1),
+            lateral_movement=round(at(lateral), 1),
+        )